@@ -22,10 +22,12 @@ from .utils import *
 from .goldy.recipes import *
 from .goldy.recipes.button import *
 from .goldy.recipes.select_menu import *
+from .goldy.recipes.persistent import *
 
 # Database
 # ----------
 from .goldy.database import DatabaseEnums
+from .goldy.database.indexes import DatabaseIndex
 from .goldy.database.wrappers import DatabaseWrapper
 
 # Nextcore utils and api wrappers.
@@ -9,7 +9,7 @@ from nextcore.http.client import HTTPClient
 from nextcore.http import BotAuthentication, UnauthorizedError, Route
 from nextcore.gateway import ShardManager
 
-from typing import Dict, Any, TYPE_CHECKING, Tuple, Set
+from typing import Dict, Any, TYPE_CHECKING, Set
 from discord_typings import UpdatePresenceData, PartialActivityData, ApplicationData
 from devgoldyutils import Colours, LoggerAdapter
 
@@ -31,9 +31,12 @@ cache: Dict[str, Any] = {
     "goldy_core_instance": None,
 }
 
+GUILD_MEMBERS_INTENT = 1 << 1
+"""The privileged gateway intent for guild member events, only requested when ``guild_members_intent`` is enabled in goldy.json."""
+
 class Goldy():
     """The main Goldy Bot class that controls the whole framework and let's you start an instance of Goldy Bot. Also known as the core."""
-    def __init__(self, token: Token = None, raise_on_extension_loader_error = None, display_copyright = True):
+    def __init__(self, token: Token = None, raise_on_extension_loader_error = None, display_copyright = True, force_command_sync = None):
         self.token = token
         self.logger = LoggerAdapter(goldy_bot_logger, Colours.ORANGE.apply_to_string("Goldy"))
         self.async_loop = asyncio.get_event_loop()
@@ -50,7 +53,6 @@ class Goldy():
             self.token = Token()
 
         self.nc_authentication = BotAuthentication(self.token.discord_token)
-        self.intents = 1 << 9 | 1 << 15 | 1 << 7 | 1 << 0
 
         self.http_client = HTTPClient()
         """Nextcore http client, use this if you would like to perform low level requests."""
@@ -60,6 +62,11 @@ class Goldy():
         Class that allows you to retrieve configuration data from the ``goldy.json`` config file. 
         """
 
+        self.intents = 1 << 9 | 1 << 15 | 1 << 7 | 1 << 0
+
+        if self.config.guild_members_intent:
+            self.intents |= GUILD_MEMBERS_INTENT
+
         self.shard_manager = ShardManager(
             authentication = self.nc_authentication,
             intents = self.intents,
@@ -78,8 +85,9 @@ class Goldy():
         """The datetime object of when the framework was booted up. Is None if the :py:meth:`~GoldyBot.Goldy.start` method isn't ran."""
 
         self.pre_invokables: Set[INVOKABLE_TYPES] = set()
-        self.invokables: Set[Tuple[str, INVOKABLE_TYPES]] = set()
-        """List of all commands, buttons and events registered."""
+        self.invokables = InvokableRegistry(max_recipes = self.config.max_registered_recipes)
+        """Indexed registry of all commands, buttons and events registered."""
+        self.__invokable_sweeper: asyncio.Task | None = None
 
         self.bot_user: objects.Member = None
         """The bot's user/member object."""
@@ -96,7 +104,7 @@ class Goldy():
         """Class that allows you to control the status, game activity and more of Goldy Bot"""
         self.system = System(self)
         """Goldy Bot class used to check how much resources Goldy is utilizing on the host system."""
-        self.command_loader = CommandLoader(self)
+        self.command_loader = CommandLoader(self, force_command_sync)
         """Class that handles command loading."""
         self.command_listener = CommandListener(self)
         """Class that handles the invoking of commands."""
@@ -143,23 +151,19 @@ class Goldy():
 
         await self.http_client.setup()
 
-        # This should return once all shards have started to connect.
-        # This does not mean they are connected.
-        try:
-            await self.shard_manager.connect()
-            self.logger.debug("Nextcore shard manager connecting...")
-        except UnauthorizedError as e:
-            raise GoldyBotError(
-                f"Nextcord shard manager failed to connect! We got '{e.message}' from nextcord. This might mean your discord token is incorrect!"
-            )
-
         # Log when shards are ready.
         self.shard_manager.event_dispatcher.add_listener(
             lambda x: self.logger.info(f"Nextcore shards are {Colours.GREEN.apply_to_string('connected')} and {Colours.BLUE.apply_to_string('READY!')}"), 
             event_name="READY"
         )
 
-        await self.pre_setup()
+        # Connecting to the database, connecting the shards and fetching the data setup needs from discord all happen at the same time.
+        await asyncio.gather(
+            self.__connect_shards(),
+            self.database.connect(),
+            self.pre_setup()
+        )
+
         await self.setup()
 
         if self.system.in_docker is True: # Live console is disabled when running a docker container.
@@ -175,6 +179,17 @@ class Goldy():
 
         await self.__stop()
 
+    async def __connect_shards(self):
+        # This should return once all shards have started to connect.
+        # This does not mean they are connected.
+        try:
+            await self.shard_manager.connect()
+            self.logger.debug("Nextcore shard manager connecting...")
+        except UnauthorizedError as e:
+            raise GoldyBotError(
+                f"Nextcord shard manager failed to connect! We got '{e.message}' from nextcord. This might mean your discord token is incorrect!"
+            )
+
     async def pre_setup(self):
         """Method ran before actual setup. This is used to fetch some data from discord needed by goldy when running the actual setup."""
         r = await self.http_client.request(
@@ -206,13 +221,17 @@ class Goldy():
 
     async def setup(self):
         """Method ran to set up goldy bot."""
+        await self.database.setup()
         await self.guild_manager.setup()
 
         self.extension_loader.pull()
         self.extension_loader.load()
+        await self.database.sync_indexes()
         await self.command_loader.load()
         await self.command_listener.start_listening()
 
+        self.__invokable_sweeper = self.async_loop.create_task(self.invokables.run_sweeper())
+
     def stop(self, reason: str = "Unknown Reason"):
         """Shuts down goldy bot right away and safely incase anything sussy wussy is going on. 😳"""
         self.live_console.stop()
@@ -231,6 +250,11 @@ class Goldy():
     async def __stop(self):
         """This is an internal method and NOT to be used by you. Use the ``Goldy().stop()`` instead. This method is ran when nextcore raises a critical error."""
         await self.presence.change(Status.INVISIBLE) # Set bot to invisible before shutting off.
+
+        if self.__invokable_sweeper is not None:
+            self.__invokable_sweeper.cancel()
+
+        self.guild_manager.stop_watching_configs()
         
         self.logger.debug("Closing nextcore http client...")
         await self.http_client.close()
@@ -238,8 +262,11 @@ class Goldy():
         self.logger.debug("Closing nextcore shard manager...")
         await self.shard_manager.close()
 
-        self.logger.debug("Closing AsyncIOMotorClient...")
-        self.database.client.close()
+        self.logger.debug("Flushing buffered database writes...")
+        await self.database.write_buffer.close()
+
+        self.logger.debug(f"Closing {self.database.backend.name}...")
+        self.database.backend.close()
     
         self.logger.debug("Closing async_loop...")
         self.async_loop.stop()
@@ -267,6 +294,6 @@ from .extensions.extension_loader import ExtensionLoader
 from .commands.loader import CommandLoader
 from .commands.listener import CommandListener
 from .live_console import LiveConsole
-from .objects import Member
+from .objects import Member, InvokableRegistry
 from .guilds import GuildManager
 from .permission_system import PermissionSystem
\ No newline at end of file
@@ -14,8 +14,8 @@ from devgoldyutils import LoggerAdapter, Colours
 
 from ... import errors
 from ..objects import Invokable
-from ... import goldy_bot_logger, utils
-from ..extensions import extensions_cache
+from ... import goldy_bot_logger
+from ..extensions import extensions_index
 from ..nextcore_utils import front_end_errors
 
 class Command(Invokable):
@@ -60,6 +60,7 @@ class Command(Invokable):
         self.__params = self.__get_function_parameters()
 
         self._parent_command = None
+        self._extension: Extension | None = None
         self._is_loaded = False
         self.__is_disabled = False
 
@@ -111,9 +112,14 @@ class Command(Invokable):
     @property
     def extension(self) -> Extension | None:
         """Finds and returns the object of the command's extension. Returns None if the extension doesn't exits. (failed to load)"""
-        return (lambda x: x[1] if x is not None else None)(
-            utils.cache_lookup(self.extension_name, extensions_cache)
-        )
+        extension = self._extension
+
+        # The extension is bound to the command on first use (when the command is loaded) and looked up again once it's unloaded.
+        if extension is None or not extension.loaded:
+            extension = extensions_index.get(self.extension_name)
+            self._extension = extension
+
+        return extension
 
     @property
     def is_loaded(self) -> bool:
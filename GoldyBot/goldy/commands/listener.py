@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-from typing import Tuple, TYPE_CHECKING
+from typing import Dict, TYPE_CHECKING
 from devgoldyutils import Colours, LoggerAdapter
-from discord_typings import InteractionCreateData, MessageData, ComponentInteractionData
+from discord_typings import InteractionCreateData, MessageData, ComponentInteractionData, MessageDeleteData, MessageDeleteBulkData
 
 from .slash_command import SlashCommand
-from .prefix_command import PrefixCommand
+from .prefix_command import PrefixCommand, tokenize
 from ..recipes.button import Button
 from ..recipes.select_menu import SelectMenu
+from ..recipes.persistent import PersistentRecipe
 from .. import objects
-from ... import goldy_bot_logger, utils
+from ... import goldy_bot_logger
+from ..objects.invokable_registry import InvokableTypes
 from ..objects.platter.golden_platter import GoldPlatter
 
 if TYPE_CHECKING:
@@ -22,6 +24,9 @@ class CommandListener():
 
         self.logger = LoggerAdapter(goldy_bot_logger, prefix=Colours.BLUE.apply("CommandListener"))
 
+        self.message_stats: Dict[str, int] = {"rejected": 0, "unknown": 0, "dispatched": 0}
+        """How many messages were rejected as not being commands, started with the prefix but matched no command and were dispatched to a prefix command."""
+
     async def start_listening(self) -> None:
         """Registers nextcore listeners and starts listening for commands."""
 
@@ -40,26 +45,49 @@ class CommandListener():
         )
         self.logger.info("Prefix command listener set!")
 
+        # Recipe clean up listeners.
+        self.goldy.shard_manager.event_dispatcher.add_listener(
+            self.on_message_delete,
+            event_name="MESSAGE_DELETE"
+        )
+        self.goldy.shard_manager.event_dispatcher.add_listener(
+            self.on_message_delete_bulk,
+            event_name="MESSAGE_DELETE_BULK"
+        )
+
         return None
 
+    async def on_message_delete(self, data: MessageDeleteData) -> None:
+        """Unregisters the recipes attached to a message once it's deleted."""
+        removed = self.goldy.invokables.remove_message(data["id"])
+
+        if removed > 0:
+            self.logger.debug(f"Unregistered {removed} recipes from the deleted message '{data['id']}'.")
+
+    async def on_message_delete_bulk(self, data: MessageDeleteBulkData) -> None:
+        for message_id in data["ids"]:
+            await self.on_message_delete({"id": message_id})
+
 
     async def on_interaction(self, interaction: InteractionCreateData) -> None:
         guild = self.goldy.guild_manager.get_guild(interaction["guild_id"])
 
         if guild is not None:
             author = objects.Member(interaction["member"]["user"], guild, self.goldy)
+            guild.member_cache.set(author.id, interaction["member"])
 
             # Slash commands and slash auto complete.
             # ------------------------------------------
             if interaction["type"] == 2 or interaction["type"] == 4:
-                command: Tuple[str, SlashCommand] = utils.cache_lookup(f"{interaction['data']['id']}", self.goldy.invokables)
+                command: SlashCommand | None = self.goldy.invokables.get(
+                    InvokableTypes.SLASH_COMMAND, f"{interaction['data']['id']}"
+                )
 
                 # uhhhh, let's hope this doesn't cause the biggest catastrophe EVER!!
 
                 if command is None and guild.code_name == "test_server": 
-                    command: Tuple[str, SlashCommand] = utils.cache_lookup(
-                        f"{guild.id}:{interaction['data']['id']}", 
-                        self.goldy.invokables
+                    command: SlashCommand | None = self.goldy.invokables.get(
+                        InvokableTypes.SLASH_COMMAND, f"{guild.id}:{interaction['data']['id']}"
                     )
 
                 if command is not None:
@@ -68,39 +96,44 @@ class CommandListener():
                         gold_platter = GoldPlatter(
                             data = interaction, 
                             author = author,
-                            invokable = command[1],
-                            goldy = command[1].goldy,
-                            logger = command[1].logger
+                            invokable = command,
+                            goldy = command.goldy,
+                            logger = command.logger
                         )
 
-                        await gold_platter.guild.config_wrapper.update()
+                        await gold_platter.guild.config_wrapper.refresh()
 
-                        await command[1].invoke(
+                        await command.invoke(
                             gold_platter
                         )
 
                     elif interaction["type"] == 4:
-                        await command[1].invoke_auto_complete(interaction)
+                        await command.invoke_auto_complete(interaction)
 
 
             # Message components.
             # --------------------
             elif interaction["type"] == 3:
                 interaction: ComponentInteractionData
-                message_component: Tuple[str, Button | SelectMenu] = utils.cache_lookup(interaction["data"]["custom_id"], self.goldy.invokables)
+                message_component: Button | SelectMenu | PersistentRecipe | None = self.goldy.invokables.get(
+                    InvokableTypes.RECIPE, interaction["data"]["custom_id"]
+                )
+
+                if message_component is None:
+                    message_component = PersistentRecipe.from_custom_id(interaction["data"]["custom_id"])
 
                 if message_component is not None:
                     gold_platter = GoldPlatter(
                         data = interaction, 
                         author = author,
-                        invokable = message_component[1],
-                        goldy = message_component[1].goldy,
-                        logger = message_component[1].logger
+                        invokable = message_component,
+                        goldy = message_component.goldy,
+                        logger = message_component.logger
                     )
 
-                    await gold_platter.guild.config_wrapper.update()
+                    await gold_platter.guild.config_wrapper.refresh()
 
-                    await message_component[1].invoke(
+                    await message_component.invoke(
                         gold_platter
                     )
 
@@ -108,37 +141,62 @@ class CommandListener():
 
 
     async def on_prefix_cmd(self, message: MessageData) -> None:
-        guild = self.goldy.guild_manager.get_guild(message["guild_id"])
+        # Most messages aren't commands so they are rejected here with a dict lookup and a startswith, before anything is awaited.
+        # The prefix could only be out of date if the guild's config has gone stale, those are checked properly below.
+        prefix_entry = self.goldy.guild_manager.prefix_table.get(message.get("guild_id"))
 
-        # If user is bot return right away.
-        if message["author"].get("bot", False):
+        if prefix_entry is None or message["author"].get("bot", False):
+            self.message_stats["rejected"] += 1
             return
 
+        prefix, config_wrapper = prefix_entry
+
+        if not message["content"].startswith(prefix) and not config_wrapper.is_stale:
+            self.message_stats["rejected"] += 1
+            return
+
+        guild = self.goldy.guild_manager.get_guild(message["guild_id"])
+
         if guild is not None:
             #await guild.update() # Since v5.0dev5 the guild database data is no longer updated automatically via the on message event.
             # This means if you manually change the command prefix in the database you have to also manually run "reload_config" in live console.
 
             # Check if prefix is correct.
             guild_config = await guild.config
-            if len(message["content"]) < 1 or not guild_config.prefix == message["content"][0]:
+            if len(message["content"]) < 1 or not message["content"].startswith(guild_config.prefix):
+                self.message_stats["rejected"] += 1
                 return
 
-            # i really hope this doesn't break
-            command: Tuple[str, PrefixCommand] = utils.cache_lookup(message["content"].split(" ")[0][1:], self.goldy.invokables)
+            # The message is only ever tokenized here, the command gets handed the routed sub commands and arguments.
+            tokens = tokenize(message["content"])
 
-            if command is not None:
-                gold_platter = GoldPlatter(
-                    data = message, 
-                    author = objects.Member(message["author"], guild, self.goldy),
-                    invokable = command[1],
-                    goldy = command[1].goldy,
-                    logger = command[1].logger
-                )
+            command: PrefixCommand | None = self.goldy.invokables.get(
+                InvokableTypes.PREFIX_COMMAND, tokens[0][len(guild_config.prefix):]
+            ) if len(tokens) > 0 else None
 
-                await gold_platter.guild.config_wrapper.update()
+            if command is None:
+                self.message_stats["unknown"] += 1
+                return
 
-                await command[1].invoke(
-                    gold_platter
-                )
+            self.message_stats["dispatched"] += 1
 
-        return None
\ No newline at end of file
+            if "member" in message:
+                guild.member_cache.set(message["author"]["id"], message["member"])
+
+            gold_platter = GoldPlatter(
+                data = message, 
+                author = objects.Member(message["author"], guild, self.goldy),
+                invokable = command,
+                goldy = command.goldy,
+                logger = command.logger
+            )
+
+            await gold_platter.guild.config_wrapper.refresh()
+
+            sub_commands, args = command.route(tokens[1:])
+
+            await command.invoke(
+                gold_platter, args, sub_commands
+            )
+
+        return None
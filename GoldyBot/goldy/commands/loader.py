@@ -1,5 +1,11 @@
 from __future__ import annotations
-from typing import List, overload, Tuple
+from typing import List, Dict, Awaitable, overload, Tuple, TYPE_CHECKING
+
+import copy
+import json
+import time
+import asyncio
+import hashlib
 from discord_typings import ApplicationCommandPayload, ApplicationCommandData
 
 from nextcore.http import Route
@@ -8,12 +14,27 @@ from devgoldyutils import LoggerAdapter
 from .. import Goldy
 from . import slash_command
 from .command import Command
+from ..database import DatabaseEnums
 from ... import goldy_bot_logger
 
+if TYPE_CHECKING:
+    from ..guilds import Guild
+
+COMMAND_SYNC_COLLECTION = "command_sync"
+"""The collection in ``goldy_main`` holding the hash and ids of the application commands last synced with discord."""
+
 class CommandLoader():
     """Class that handles command loading."""
-    def __init__(self, goldy:Goldy) -> None:
+    def __init__(self, goldy: Goldy, force_sync: bool | None = None) -> None:
         self.goldy = goldy
+        self.force_sync = force_sync
+        """
+        Whether application commands are always uploaded to discord, even if they haven't changed since the last sync. 
+        Defaults to the ``goldy.commands.force_sync`` config option, ``Goldy(force_command_sync = True)`` overrides it.
+        """
+
+        if self.force_sync is None:
+            self.force_sync = self.goldy.config.force_command_sync
 
         self.logger = LoggerAdapter(goldy_bot_logger, prefix="CommandLoader")
 
@@ -83,63 +104,31 @@ class CommandLoader():
         slash_command_payloads: List[ApplicationCommandPayload], 
         testing_server: Tuple[str, str] | None
     ) -> None:
-        created_interaction_cmds: List[ApplicationCommandData] = []
+        start_time = time.perf_counter()
+        phase_timings: Dict[str, float] = {}
 
-        await self.__delete_unknown_cmds()
+        async def timed(phase: str, coroutine: Awaitable[List[ApplicationCommandData]]) -> List[ApplicationCommandData]:
+            phase_start_time = time.perf_counter()
 
-        # Creating global commands.
-        # --------------------------
-        if len([guild for guild in self.goldy.guild_manager.guilds if not guild[1].code_name == "test_server"]) >= 1:
-            global_route = Route(
-                "PUT",
-                "/applications/{application_id}/commands",
-                application_id = self.goldy.application_data["id"]
-            )
-            
-            r = await self.goldy.http_client.request(
-                global_route,
-                rate_limit_key = self.goldy.nc_authentication.rate_limit_key,
-                headers = self.goldy.nc_authentication.headers,
-                json = slash_command_payloads
-            )
+            try:
+                return await coroutine
+            finally:
+                phase_timings[phase] = time.perf_counter() - phase_start_time
 
-            created_interaction_cmds += await r.json()
-            self.logger.debug("Created global commands.")
+        phases = [timed("guild cleanup", self.__delete_unknown_cmds())]
 
+        if len([guild for guild in self.goldy.guild_manager.guilds if not guild[1].code_name == "test_server"]) >= 1:
+            phases.append(timed("global commands", self.__create_global_cmds(slash_command_payloads)))
 
-        # Creating guild commands for testing server.
-        # --------------------------------------------
         if testing_server is not None:
-            testing_guild_route = Route(
-                "PUT",
-                "/applications/{application_id}/guilds/{guild_id}/commands",
-                application_id = self.goldy.application_data["id"],
-                guild_id = testing_server[0],
-            )
-
-            # Adding test warning to all slash commands for the test server.
-            for payload in slash_command_payloads:
-                test_description = "⚒️ THIS IS A TEST COMMAND REGISTERED JUST FOR THIS GUILD"
-                
-                # Setting test description to all first layer sub commands.
-                for option in payload["options"]:
-                    if not option["type"] == 1:
-                        continue
-
-                    option["description"] = test_description
-
-                payload["description"] = test_description
-
-            # Creating guild commands for testing server.
-            r = await self.goldy.http_client.request(
-                testing_guild_route,
-                rate_limit_key = self.goldy.nc_authentication.rate_limit_key,
-                headers = self.goldy.nc_authentication.headers,
-                json = slash_command_payloads
-            )
-
-            created_interaction_cmds += await r.json()
-            self.logger.debug("Created guild commands for test server.")
+            phases.append(timed("test server commands", self.__create_test_server_cmds(slash_command_payloads, testing_server)))
+
+        # None of these touch the same commands so they can all go at once, nextcore handles the rate limits.
+        results = await asyncio.gather(*phases)
+
+        created_interaction_cmds: List[ApplicationCommandData] = [
+            interaction_cmd for phase_result in results for interaction_cmd in phase_result
+        ]
 
         # Registering slash commands with the id given by discord.
         # ----------------------------------------------------------
@@ -156,41 +145,148 @@ class CommandLoader():
 
                     break
 
+        self.logger.info(
+            f"Synced application commands in {time.perf_counter() - start_time:.2f}s " \
+                f"({', '.join(f'{phase}: {timing * 1000:.0f}ms' for phase, timing in phase_timings.items())})."
+        )
+
         return None
-    
-    async def __delete_unknown_cmds(self):
-        """Deletes the old guild commands that existed from previous goldy bot versions."""
-        for _, guild in self.goldy.guild_manager.guilds:
+
+    async def __create_global_cmds(self, slash_command_payloads: List[ApplicationCommandPayload]) -> List[ApplicationCommandData]:
+        global_route = Route(
+            "PUT",
+            "/applications/{application_id}/commands",
+            application_id = self.goldy.application_data["id"]
+        )
+
+        created_interaction_cmds = await self.__sync_cmds("global", global_route, slash_command_payloads)
+
+        self.logger.debug("Created global commands.")
+        return created_interaction_cmds
+
+    async def __create_test_server_cmds(
+        self, 
+        slash_command_payloads: List[ApplicationCommandPayload], 
+        testing_server: Tuple[str, str]
+    ) -> List[ApplicationCommandData]:
+        testing_guild_route = Route(
+            "PUT",
+            "/applications/{application_id}/guilds/{guild_id}/commands",
+            application_id = self.goldy.application_data["id"],
+            guild_id = testing_server[0],
+        )
+
+        # Copied as the global commands are being sent at the same time and must keep their descriptions.
+        slash_command_payloads = copy.deepcopy(slash_command_payloads)
+
+        # Adding test warning to all slash commands for the test server.
+        for payload in slash_command_payloads:
+            test_description = "⚒️ THIS IS A TEST COMMAND REGISTERED JUST FOR THIS GUILD"
             
-            if guild.code_name == "test_server":
-                continue
+            # Setting test description to all first layer sub commands.
+            for option in payload["options"]:
+                if not option["type"] == 1:
+                    continue
+
+                option["description"] = test_description
+
+            payload["description"] = test_description
+
+        # Creating guild commands for testing server.
+        created_interaction_cmds = await self.__sync_cmds(testing_server[0], testing_guild_route, slash_command_payloads)
+
+        self.logger.debug("Created guild commands for test server.")
+        return created_interaction_cmds
+
+    async def __sync_cmds(self, scope: str, route: Route, slash_command_payloads: List[ApplicationCommandPayload]) -> List[ApplicationCommandData]:
+        """
+        PUTs these application commands to discord, unless they are exactly the same as the last ones synced to this scope (global or a guild id). 
+        Then the command ids saved from that sync are returned instead, sparing the heavily rate limited endpoint.
+
+        The saved ids are trusted as is, so if the commands were changed or deleted outside of goldy bot 
+        (e.g. by another bot using the same token) turn on ``force_sync`` for one start up to upload them again.
+        """
+        database = self.goldy.database.get_goldy_database(DatabaseEnums.GOLDY_MAIN)
+        sync_id = f"{self.goldy.application_data['id']}:{scope}"
+        payloads_hash = hash_payloads(slash_command_payloads)
+
+        if not self.force_sync:
+            last_sync = await database.find_one(COMMAND_SYNC_COLLECTION, {"_id": sync_id})
+
+            if last_sync is not None and last_sync["hash"] == payloads_hash:
+                self.logger.debug(f"Application commands for '{scope}' haven't changed since the last sync, skipping upload.")
+                return last_sync["commands"]
+
+        r = await self.goldy.http_client.request(
+            route,
+            rate_limit_key = self.goldy.nc_authentication.rate_limit_key,
+            headers = self.goldy.nc_authentication.headers,
+            json = slash_command_payloads
+        )
 
-            r = await self.goldy.http_client.request(
-                Route(
-                    "GET",
-                    "/applications/{application_id}/guilds/{guild_id}/commands",
-                    application_id = self.goldy.application_data["id"],
-                    guild_id = guild.id,
-                ),
-                rate_limit_key = self.goldy.nc_authentication.rate_limit_key,
-                headers = self.goldy.nc_authentication.headers
-            )
+        created_interaction_cmds: List[ApplicationCommandData] = await r.json()
+
+        await database.edit(
+            COMMAND_SYNC_COLLECTION, 
+            {"_id": sync_id}, 
+            {
+                "hash": payloads_hash, 
+                # Only what's needed to register the commands again is kept.
+                "commands": [
+                    {key: interaction_cmd[key] for key in ("id", "name", "guild_id") if interaction_cmd.get(key) is not None} 
+                        for interaction_cmd in created_interaction_cmds
+                ]
+            }, 
+            overwrite = True
+        )
 
-            guild_application_cmds = await r.json()
+        return created_interaction_cmds
+
+    async def __delete_unknown_cmds(self) -> List[ApplicationCommandData]:
+        """Deletes the old guild commands that existed from previous goldy bot versions."""
+        # Nextcore queues these requests by their rate limit buckets, the semaphore just keeps us from flooding it.
+        semaphore = asyncio.Semaphore(self.goldy.config.command_sync_concurrency)
 
-            if len(guild_application_cmds) > 0:
+        async def delete_guild_cmds(guild: Guild) -> None:
+            async with semaphore:
                 r = await self.goldy.http_client.request(
                     Route(
-                        "PUT",
+                        "GET",
                         "/applications/{application_id}/guilds/{guild_id}/commands",
                         application_id = self.goldy.application_data["id"],
                         guild_id = guild.id,
                     ),
                     rate_limit_key = self.goldy.nc_authentication.rate_limit_key,
-                    headers = self.goldy.nc_authentication.headers,
-                    json = []
+                    headers = self.goldy.nc_authentication.headers
                 )
 
-                self.logger.info(
-                    f"Removed guild application commands for the guild '{guild.code_name}'!"
-                )
\ No newline at end of file
+                guild_application_cmds = await r.json()
+
+                if len(guild_application_cmds) > 0:
+                    r = await self.goldy.http_client.request(
+                        Route(
+                            "PUT",
+                            "/applications/{application_id}/guilds/{guild_id}/commands",
+                            application_id = self.goldy.application_data["id"],
+                            guild_id = guild.id,
+                        ),
+                        rate_limit_key = self.goldy.nc_authentication.rate_limit_key,
+                        headers = self.goldy.nc_authentication.headers,
+                        json = []
+                    )
+
+                    self.logger.info(
+                        f"Removed guild application commands for the guild '{guild.code_name}'!"
+                    )
+
+        await asyncio.gather(
+            *[delete_guild_cmds(guild) for _, guild in self.goldy.guild_manager.guilds if not guild.code_name == "test_server"]
+        )
+
+        return []
+
+
+def hash_payloads(slash_command_payloads: List[ApplicationCommandPayload]) -> str:
+    """Returns a sha256 hash of these application command payloads that only changes when the payloads do, no matter the order of their keys."""
+    canonical_payloads = json.dumps(slash_command_payloads, sort_keys = True, separators = (",", ":"), ensure_ascii = False, default = str)
+    return hashlib.sha256(canonical_payloads.encode()).hexdigest()
@@ -1,6 +1,5 @@
 from __future__ import annotations
-from typing import Any, Callable, List, TYPE_CHECKING
-from discord_typings import MessageData
+from typing import Any, Callable, Dict, List, Tuple, TYPE_CHECKING
 
 from .. import objects
 from ..nextcore_utils import front_end_errors
@@ -10,8 +9,11 @@ if TYPE_CHECKING:
     from ... import Extension
 
 from .command import Command
+from ..objects.invokable_registry import InvokableTypes
 
 class PrefixCommand(Command):
+    invokable_type = InvokableTypes.PREFIX_COMMAND
+
     def __init__(
         self, 
         goldy: Goldy, 
@@ -23,7 +25,7 @@ class PrefixCommand(Command):
         wait: bool = False,
         pre_register: bool = True
     ):
-        self.__sub_commands: List[PrefixCommand] = []
+        self.__sub_commands: Dict[str, PrefixCommand] = {}
 
         super().__init__(
             goldy = goldy, 
@@ -45,7 +47,7 @@ class PrefixCommand(Command):
             command_args_string += f"{{{param}}} "
 
         command_sub_cmds_string = "<"
-        for sub_cmd in self.__sub_commands:
+        for sub_cmd in self.__sub_commands.values():
             command_sub_cmds_string += f"{sub_cmd.name}|"
 
         if len(command_sub_cmds_string) >= 2:
@@ -57,14 +59,44 @@ class PrefixCommand(Command):
     def register_sub_command(self, command: PrefixCommand) -> None:
         """Method that registers prefix sub command."""
         command._parent_command = self
-        self.__sub_commands.append(command)
+        self.__sub_commands[command.name] = command
+
+    def route(self, tokens: List[str]) -> Tuple[List[PrefixCommand], List[str]]:
+        """
+        Walks the sub command tree with the tokens that come after this command's name. 
+        Returns the chain of sub commands that matched (in order) and the tokens left over as arguments.
+        """
+        sub_commands: List[PrefixCommand] = []
+        command = self
+        index = 0
+
+        while index < len(tokens):
+            sub_command = command.__sub_commands.get(tokens[index])
+
+            if sub_command is None:
+                break
+
+            sub_commands.append(sub_command)
+            command = sub_command
+            index += 1
+
+        return sub_commands, tokens[index:]
+
+
+    async def invoke(self, platter: objects.GoldPlatter, args: List[str] = None, sub_commands: List[PrefixCommand] = None) -> None:
+        """
+        Runs and triggers a prefix command. This method is usually ran internally.
 
+        ``args`` and ``sub_commands`` are what the command listener already parsed out of the message, 
+        when they aren't passed the message content is tokenized and routed here.
+        """
+        if args is None:
+            sub_commands, args = self.route(tokenize(platter.data["content"])[1:])
 
-    async def invoke(self, platter: objects.GoldPlatter) -> None:
-        """Runs and triggers a slash command. This method is usually ran internally."""
-        data: MessageData = platter.data
+        elif sub_commands is None:
+            sub_commands = []
 
-        params = self.__invoke_data_to_params(data)
+        params = self.__args_to_params(args)
         if not params == []: self.logger.debug(f"Got args --> {params}")
 
         try:
@@ -75,8 +107,8 @@ class PrefixCommand(Command):
             # Handle sub commands.
             # ----------------------
             # Invoke sub command if there is one in invoke data.
-            if return_value is not False:
-                await self.__invoke_sub_command(data, platter)
+            if return_value is not False and len(sub_commands) > 0:
+                await self.__invoke_sub_command(platter, args, sub_commands)
 
         except TypeError as e:
             # This could mean the args are missing or it could very well be a normal type error so let's check and handle it respectively.
@@ -100,55 +132,68 @@ class PrefixCommand(Command):
         except Exception as e:
             raise front_end_errors.UnknownError(platter, e, self.logger)
 
-    async def __invoke_sub_command(self, data: MessageData, platter: objects.GoldPlatter) -> None:
-        for arg in data["content"].split(" ")[1:]:
-            for command in self.__sub_commands:
-                if command.name == arg:
-                    data["content"] = data["content"].replace(arg, "")
-        
-                    self.logger.debug("Calling sub command...")
+    async def __invoke_sub_command(self, platter: objects.GoldPlatter, args: List[str], sub_commands: List[PrefixCommand]) -> None:
+        command, *sub_commands = sub_commands
 
-                    platter = objects.GoldPlatter(
-                        data = data, 
-                        author = platter.author,
-                        invokable = command,
-                        goldy = command.goldy,
-                        logger = command.logger
-                    )
-
-                    await command.invoke(platter)
-                    break
+        self.logger.debug("Calling sub command...")
 
+        platter = objects.GoldPlatter(
+            data = platter.data, 
+            author = platter.author,
+            invokable = command,
+            goldy = command.goldy,
+            logger = command.logger
+        )
 
-    def __invoke_data_to_params(self, data: MessageData) -> List[str]: 
-        """A function that grabs prefix command arguments from invoke data and converts it to appropriate params."""
-        self.logger.debug("Attempting to phrase invoke data into parameters...")
+        await command.invoke(platter, args, sub_commands)
 
-        # Where all the fucking magic happens.
-        params = []
 
+    def __args_to_params(self, args: List[str]) -> List[str]: 
+        """A function that converts prefix command arguments to appropriate params."""
         # Yep your right, parent commands of sub commands don't get any arguments. Ha, chew on that!
         if len(self.__sub_commands) > 0:
             self.logger.debug("This command is a parent command so it won't be given arguments when ran.")
             return []
 
-        for arg in data["content"].split(" ")[1:]:
-            # Ignore sub commands.
-            if arg in [x.name for x in self.__sub_commands]:
-                self.logger.debug(f"Not phrasing the argument '{arg}' as it is a sub command.")
-                continue
+        # If the argument is a user, a channel or a role strip the id from the mention. (Yes this means normal args can't start with these)
+        return [arg[2:-1] if arg[:2] in ("<@", "<#") else arg for arg in args]
+
+
+QUOTES = {'"': '"', "'": "'", "“": "”"}
+"""Quotes that group an argument with spaces into one token, mapped to their closing quote."""
 
-            # A really weird check I know but I promise it's needed okay.
-            if arg == "" or arg[0] == " ":
-                self.logger.debug(f"Not phrasing the argument '{arg}' as it is either blank or incorrect.")
-                continue
+def tokenize(content: str) -> List[str]:
+    """
+    Splits a prefix command message into tokens in one pass. Runs of whitespace separate tokens and a quote 
+    at the start of a token groups everything up to the closing quote into it, e.g. ``!say "hello world"`` -> ``["!say", "hello world"]``.
+    """
+    tokens: List[str] = []
+    token: List[str] | None = None
+    closing_quote: str | None = None
 
-            # If the argument is a user, a channel or a role strip the id from the mention. (Yes this means normal args can't start with these)
-            if arg[:2] in ["<@", "<#"]:
-                params.append(arg[2:-1])
+    for char in content:
+        if closing_quote is not None:
+            if char == closing_quote:
+                closing_quote = None
             else:
-                params.append(arg)
+                token.append(char)
+
+        elif char.isspace():
+            if token is not None:
+                tokens.append("".join(token))
+                token = None
+
+        elif token is None and char in QUOTES:
+            token = []
+            closing_quote = QUOTES[char]
+
+        else:
+            if token is None:
+                token = []
+
+            token.append(char)
 
-            self.logger.debug(f"Found arg '{arg}'.")
+    if token is not None:
+        tokens.append("".join(token))
 
-        return params
\ No newline at end of file
+    return tokens
@@ -11,9 +11,11 @@ if TYPE_CHECKING:
 
 from ... import errors
 from .command import Command
-from ..objects import GoldPlatter
+from ..objects import GoldPlatter, InvokableTypes
 
 class SlashCommand(Command):
+    invokable_type = InvokableTypes.SLASH_COMMAND
+
     def __init__(
         self, 
         goldy: Goldy, 
@@ -1,16 +1,18 @@
 from __future__ import annotations
 import asyncio
-from typing import List
+from typing import List, Dict, Tuple, Set, Any, Callable, AsyncIterator
 
 from enum import Enum
 
 import pymongo
-from pymongo.errors import ServerSelectionTimeoutError
+from pymongo.errors import ServerSelectionTimeoutError, OperationFailure
 from devgoldyutils import Colours
-import motor.motor_asyncio
 from .. import Goldy, LoggerAdapter, goldy_bot_logger, GoldyBotError
 
-from .databases import GoldyDB
+from .databases import GoldyDB, READ_PREFERENCE
+from .backends import DatabaseBackend, get_backend
+
+OPERATION_HOOK = Callable[[str, str, str, float], Any]
 
 class DatabaseEnums(Enum):
     """Enum class that holds the code names for all goldy bot pymongo databases and collection types."""
@@ -23,6 +25,11 @@ class DatabaseEnums(Enum):
     def __init__(self, database_name: str):
         ...
 
+    @classmethod
+    def databases(cls) -> List[DatabaseEnums]:
+        """Returns the enums of the actual databases goldy bot uses."""
+        return [cls.GOLDY_MAIN, cls.GOLDY_MEMBER_DATA]
+
 class Database():
     """Goldy Bot's class to interface with a Mongo Database asynchronously."""
     def __init__(self, goldy: Goldy):
@@ -31,21 +38,135 @@ class Database():
         self.async_loop = asyncio.get_event_loop()
         self.logger = LoggerAdapter(goldy_bot_logger, prefix="Database")
 
-        # Initializing MongoDB database.
+        # The backend is only created here, connecting happens in the background with connect() so it doesn't hold up start up.
+        self.backend: DatabaseBackend = get_backend(self.database_url, **self.goldy.config.database_client_options)
+        self.client: pymongo.MongoClient = self.backend.client
+        self.__connection: asyncio.Future | None = None
+
+        self.__goldy_databases: Dict[str, GoldyDB] = {}
+
+        self.operation_stats: Dict[str, Dict[str, Any]] = {}
+        """How many operations ran and how long they took, per ``database.collection``."""
+        self.operation_hooks: List[OPERATION_HOOK] = []
+
+        self.write_buffer = WriteBehindBuffer(
+            self, 
+            max_pending = self.goldy.config.write_buffer_max_pending, 
+            flush_interval = self.goldy.config.write_buffer_flush_interval, 
+            max_attempts = self.goldy.config.write_buffer_max_attempts
+        )
+        """Opt-in buffer that batches writes to the database. Used by ``MemberDBWrapper.push(..., buffered = True)`` and ``MemberDBWrapper.increment``."""
+
+        self.indexes: List[DatabaseIndex] = [
+            DatabaseIndex(DatabaseEnums.GOLDY_MEMBER_DATA, MEMBERS_COLLECTION, [("member_id", pymongo.ASCENDING), ("scope", pymongo.ASCENDING)], unique = True),
+        ]
+        """Every index goldy bot makes sure exists, the framework's own and ones declared by extensions."""
+        self.__indexes_synced = False
+
+        self.legacy_member_ids: Set[str] = set()
+        """The members whose data is still in the old one collection per member layout. They get migrated on access."""
+
+    @property
+    def legacy_member_collections(self) -> bool:
+        """Whether member data in the old one collection per member layout still exists."""
+        return len(self.legacy_member_ids) > 0
+
+    @property
+    def ready(self) -> bool:
+        """Whether the database has connected."""
+        connection = self.__connection
+        return connection is not None and connection.done() and not connection.cancelled() and connection.exception() is None
+
+    def connect(self) -> asyncio.Future:
+        """Starts connecting to the database in the background if it isn't already. Await the returned future or :py:meth:`wait_until_ready` to know when it's connected."""
+        if self.__connection is None:
+            self.__connection = asyncio.ensure_future(self.__connect())
+
+        return self.__connection
+
+    async def wait_until_ready(self) -> None:
+        """Waits for the database to connect, starting the connection if needed. Raises ``GoldyBotError`` if it couldn't connect."""
+        await asyncio.shield(self.connect())
+
+    async def __connect(self) -> None:
         try:
-            self.client: pymongo.MongoClient = motor.motor_asyncio.AsyncIOMotorClient(self.database_url, serverSelectionTimeoutMS=2000)
-            self.async_loop.run_until_complete(self.client.server_info())
-            self.logger.info("AsyncIOMotorClient " + Colours.GREEN.apply_to_string("Connected!"))
+            await self.backend.connect()
+            self.logger.info(f"{self.backend.name} " + Colours.GREEN.apply_to_string("Connected!"))
         except ServerSelectionTimeoutError as e:
             raise GoldyBotError(
-                f"Couldn't connect to Database! Check if the database URL you entered is correct. Error received from motor >>> {e}"
+                f"Couldn't connect to Database! Check if the database URL you entered is correct. Error received from {self.backend.name} >>> {e}"
             )
 
         except Exception as e:
             raise GoldyBotError(
-                f"Couldn't connect to Database! Error received from motor >>> {e}"
+                f"Couldn't connect to Database! Error received from {self.backend.name} >>> {e}"
+            )
+
+    async def setup(self) -> None:
+        """Checks for member data that still needs migrating and turns on slow query profiling if it's enabled in goldy.json."""
+        await self.wait_until_ready()
+
+        legacy_collections = await list_legacy_member_collections(self)
+        self.legacy_member_ids = set(legacy_collections)
+
+        if self.legacy_member_collections:
+            self.logger.warning(
+                f"Found {len(legacy_collections)} members still using the old member data layout. " \
+                    "They will be migrated as they are used, run 'migrate_member_data' in the live console to migrate them all now."
             )
 
+        slow_query_ms = self.goldy.config.database_profile_slow_ms
+
+        if slow_query_ms is not None:
+            for database in DatabaseEnums.databases():
+                await self.get_goldy_database(database).database.command("profile", 1, slowms = slow_query_ms)
+
+            self.logger.info(f"Profiling database queries slower than {slow_query_ms}ms, run 'collscan_report' in the live console to see collection scans.")
+
+    def add_indexes(self, *indexes: DatabaseIndex) -> None:
+        """Declares indexes goldy bot should make sure exist. If indexes were already synced these get created straight away."""
+        self.indexes.extend(indexes)
+
+        if self.__indexes_synced:
+            self.async_loop.create_task(self.sync_indexes())
+
+    async def sync_indexes(self) -> None:
+        """Creates every declared index that is missing. Indexes that changed are only rebuilt if ``rebuild_indexes`` is enabled in goldy.json."""
+        rebuild = self.goldy.config.database_rebuild_indexes
+        collections: Dict[Tuple[str, str], List[DatabaseIndex]] = {}
+
+        for index in self.indexes:
+            collections.setdefault((index.database, index.collection), []).append(index)
+
+        for (database_name, collection), indexes in collections.items():
+            try:
+                created, rebuilt, outdated = await sync_collection_indexes(
+                    self.get_goldy_database(database_name), collection, indexes, rebuild = rebuild
+                )
+            except OperationFailure as e:
+                self.logger.error(f"Failed to sync the indexes of '{database_name}.{collection}'! Error: {e}")
+                continue
+
+            if created > 0 or rebuilt > 0:
+                self.logger.info(f"Created {created} and rebuilt {rebuilt} indexes on '{database_name}.{collection}'.")
+
+            if len(outdated) > 0:
+                self.logger.warning(
+                    f"The indexes {[index.name for index in outdated]} on '{database_name}.{collection}' don't match how they are declared. " \
+                        "Set 'rebuild_indexes' to true in the database section of goldy.json to rebuild them."
+                )
+
+        self.__indexes_synced = True
+
+    async def collscan_report(self) -> List[Dict[str, Any]]:
+        """Returns the collections that had slow queries run as a collection scan (they are missing an index), worst first."""
+        report = []
+
+        for database in DatabaseEnums.databases():
+            report.extend(await collscan_report(self.get_goldy_database(database)))
+
+        return sorted(report, key = lambda stats: stats["total_ms"], reverse = True)
+
     async def insert(self, database: DatabaseEnums | str, collection: str, data) -> bool:
         """Inserts the data provided into a collection in this database."""
         return await self.get_goldy_database(database).insert(collection, data)
@@ -58,17 +179,39 @@ class Database():
         """Finds and deletes a copy of this data from a collection in this database."""
         return await self.get_goldy_database(database).remove(collection, data)
 
-    async def find(self, database: DatabaseEnums | str, collection: str, query, key: str, max_to_find = 50) -> List[dict]:
-        """Searches for and returns documents with that query in a collection in this database."""
-        return await self.get_goldy_database(database).find(collection, query, key, max_to_find)
+    async def find(
+        self, 
+        database: DatabaseEnums | str, 
+        collection: str, 
+        query, 
+        key: str, 
+        max_to_find = 50, 
+        read_preference: READ_PREFERENCE = None
+    ) -> List[dict]:
+        """Searches for and returns documents with that query in a collection in this database. ``read_preference`` can route the read to secondaries, e.g. ``"secondaryPreferred"``."""
+        return await self.get_goldy_database(database).find(collection, query, key, max_to_find, read_preference)
 
-    async def find_all(self, database: DatabaseEnums | str, collection: str, max_to_find = 100) -> List[dict] | None:
+    async def find_all(self, database: DatabaseEnums | str, collection: str, max_to_find = 100, read_preference: READ_PREFERENCE = None) -> List[dict] | None:
         """Finds and returns all documents in a collection from this database. This took me a day to make! 😞"""
-        return await self.get_goldy_database(database).find_all(collection, max_to_find)
+        return await self.get_goldy_database(database).find_all(collection, max_to_find, read_preference)
+
+    def stream(
+        self, 
+        database: DatabaseEnums | str, 
+        collection: str, 
+        query: dict = None, 
+        projection: dict | List[str] = None, 
+        sort: str | List[Tuple[str, int]] = None, 
+        limit: int = 0, 
+        batch_size: int = None, 
+        read_preference: READ_PREFERENCE = None
+    ) -> AsyncIterator[dict]:
+        """Streams documents matching the query from a collection in this database without loading them all into memory."""
+        return self.get_goldy_database(database).stream(collection, query, projection, sort, limit, batch_size, read_preference)
 
-    async def find_one(self, database: DatabaseEnums | str, collection: str, query: dict) -> dict | None:
+    async def find_one(self, database: DatabaseEnums | str, collection: str, query: dict, read_preference: READ_PREFERENCE = None) -> dict | None:
         """Searches for and returns specific data from a collection in this database."""
-        return await self.get_goldy_database(database).find_one(collection, query)
+        return await self.get_goldy_database(database).find_one(collection, query, read_preference)
 
     async def create_collection(self, database: DatabaseEnums | str, collection_name: str, data) -> bool:
         return await self.get_goldy_database(database).create_collection(collection_name, data)
@@ -86,8 +229,51 @@ class Database():
 
     
     def get_goldy_database(self, database_name: DatabaseEnums | str) -> GoldyDB:
-        """Returns an instance of :py:meth:`~GoldyBot.goldy.database.databases.GoldyDB`."""
+        """Returns the instance of :py:meth:`~GoldyBot.goldy.database.databases.GoldyDB` for that database. Instances are cached."""
         if isinstance(database_name, DatabaseEnums):
-            return GoldyDB(self, database_name.value)
+            database_name = database_name.value
+
+        goldy_database = self.__goldy_databases.get(database_name)
+
+        if goldy_database is None:
+            goldy_database = GoldyDB(self, DatabaseEnums(database_name).value)
+            self.__goldy_databases[database_name] = goldy_database
+
+        return goldy_database
+
+    def add_operation_hook(self, hook: OPERATION_HOOK) -> None:
+        """
+        Adds a function that gets called after every database operation with the database name, 
+        collection name, operation name and how long it took in seconds. Handy for exporting metrics.
+        """
+        self.operation_hooks.append(hook)
+
+    def record_operation(self, database_name: str, collection: str, operation: str, duration: float) -> None:
+        """Counts a database operation in ``operation_stats`` and passes it on to the operation hooks. This is usually used internally."""
+        key = f"{database_name}.{collection}"
+        stats = self.operation_stats.get(key)
+
+        if stats is None:
+            stats = {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "operations": {}}
+            self.operation_stats[key] = stats
+
+        duration_ms = duration * 1000
+
+        stats["count"] += 1
+        stats["total_ms"] += duration_ms
+        stats["max_ms"] = max(stats["max_ms"], duration_ms)
+        stats["operations"][operation] = stats["operations"].get(operation, 0) + 1
+
+        for hook in self.operation_hooks:
+            try:
+                hook(database_name, collection, operation, duration)
+            except Exception as e:
+                self.logger.error(f"The database operation hook '{hook}' raised an error! Error: {e}")
+
 
-        return GoldyDB(self, DatabaseEnums(database_name).value)
\ No newline at end of file
+# Imported down here as they need DatabaseEnums.
+# ------------------------------------------------
+from .wrappers.member import MEMBERS_COLLECTION
+from .migrations import list_legacy_member_collections
+from .write_buffer import WriteBehindBuffer
+from .indexes import DatabaseIndex, sync_collection_indexes, collscan_report
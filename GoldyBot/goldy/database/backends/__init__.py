@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Any
+from abc import ABC, abstractmethod
+
+__all__ = ("DatabaseBackend", "get_backend")
+
+class DatabaseBackend(ABC):
+    """
+    The storage engine behind :py:class:`~GoldyBot.goldy.database.Database`. 
+
+    A backend hands goldy bot a motor style client (``client[database][collection]``), so the database classes 
+    don't care whether documents live in MongoDB or in a local file.
+    """
+    name: str
+    """Display name of the backend for log messages."""
+    supports_change_streams: bool = False
+    """Whether the client can ``watch`` collections. Without change streams guild configs are kept fresh by their ttl instead."""
+
+    def __init__(self, url: str, **client_options) -> None:
+        self.url = url
+        self.client_options = client_options
+
+    @property
+    @abstractmethod
+    def client(self) -> Any:
+        """The motor style client."""
+        ...
+
+    @abstractmethod
+    async def connect(self) -> None:
+        """Checks the backend can be reached, raises if it can't."""
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        ...
+
+
+def get_backend(url: str, **client_options) -> DatabaseBackend:
+    """
+    Returns the backend for that database url. ``local://<path>`` urls use the local engine, everything else goes to MongoDB. 
+    ``client_options`` are passed on to the client (pool size, read preference and so on).
+    """
+    if url.startswith(LocalBackend.URL_SCHEME):
+        return LocalBackend(url, **client_options)
+
+    return MongoBackend(url, **client_options)
+
+
+from .mongo import MongoBackend
+from .local import LocalBackend
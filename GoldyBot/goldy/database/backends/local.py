@@ -0,0 +1,639 @@
+"""
+A small embedded document store backed by SQLite for single node bots and tests.
+
+It speaks the subset of the motor API goldy bot uses, documents are stored as extended json
+and plain equality filters are pushed down to SQLite so fewer documents have to be decoded.
+
+SQLite calls are made straight from the event loop, so every query blocks goldy bot until it's done. 
+This backend is meant for development and tests only, bots running in production should use MongoDB.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Iterator
+
+from bson import ObjectId, json_util
+from pymongo import UpdateOne
+from pymongo.errors import OperationFailure, DuplicateKeyError, BulkWriteError
+
+from . import DatabaseBackend
+
+if TYPE_CHECKING:
+    from pymongo import IndexModel
+
+__all__ = ("LocalBackend",)
+
+MISSING = object()
+
+class LocalBackend(DatabaseBackend):
+    """
+    Stores everything in a SQLite file. Use with a ``local://<path>`` database url, ``local://:memory:`` keeps it all in memory. 
+    
+    Client options like pool size and read preference mean nothing to it so they are ignored. 
+    
+    ⚠️ For development and tests only, queries run synchronously and block the event loop (see the module docstring).
+    """
+    name = "LocalClient"
+    URL_SCHEME = "local://"
+
+    def __init__(self, url: str, **client_options) -> None:
+        super().__init__(url, **client_options)
+
+        self.__client = LocalClient(url[len(self.URL_SCHEME):])
+
+    @property
+    def client(self) -> LocalClient:
+        return self.__client
+
+    async def connect(self) -> None:
+        await self.__client.server_info()
+
+    def close(self) -> None:
+        self.__client.close()
+
+
+class LocalClient():
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+        self.__connection: sqlite3.Connection | None = None
+        self.__databases: Dict[str, LocalDatabase] = {}
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The SQLite connection, it's opened on first use just like motor connects lazily."""
+        if self.__connection is None:
+            connection = sqlite3.connect(self.path)
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS "_goldy_indexes" (namespace TEXT, name TEXT, spec TEXT, PRIMARY KEY (namespace, name))'
+            )
+            connection.commit()
+
+            self.__connection = connection
+
+        return self.__connection
+
+    def __getitem__(self, name: str) -> LocalDatabase:
+        database = self.__databases.get(name)
+
+        if database is None:
+            database = LocalDatabase(self, name)
+            self.__databases[name] = database
+
+        return database
+
+    async def server_info(self) -> dict:
+        self.connection.execute("SELECT 1")
+        return {"version": sqlite3.sqlite_version}
+
+    def close(self) -> None:
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
+
+class LocalDatabase():
+    def __init__(self, client: LocalClient, name: str) -> None:
+        self.client = client
+        self.name = name
+
+        self.__collections: Dict[str, LocalCollection] = {}
+
+    def __getitem__(self, name: str) -> LocalCollection:
+        collection = self.__collections.get(name)
+
+        if collection is None:
+            collection = LocalCollection(self, name)
+            self.__collections[name] = collection
+
+        return collection
+
+    async def list_collection_names(self) -> List[str]:
+        prefix = self.name + "."
+        rows = self.client.connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+
+        return [name[len(prefix):] for name, in rows if name.startswith(prefix)]
+
+    async def command(self, command: str, *args, **kwargs) -> dict:
+        if command == "profile":
+            return {"was": 0, "ok": 1} # There's no profiler so there's nothing to turn on.
+
+        raise OperationFailure(f"The command '{command}' is not supported by the local database backend.")
+
+class LocalCollection():
+    def __init__(self, database: LocalDatabase, name: str) -> None:
+        self.database = database
+        self.name = name
+        self.namespace = f"{database.name}.{name}"
+
+        self.__table_exists = False
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        return self.database.client.connection
+
+    def with_options(self, **options) -> LocalCollection:
+        # There's only ever one copy of the data so read preferences and such don't change anything.
+        return self
+
+    def __ensure_table(self) -> None:
+        if not self.__table_exists:
+            self.connection.execute(f'CREATE TABLE IF NOT EXISTS "{self.namespace}" (id TEXT PRIMARY KEY, doc TEXT NOT NULL)')
+            self.__table_exists = True
+
+    # Reading
+    # ---------
+    def _find_documents(self, query: dict | None) -> Iterator[dict]:
+        self.__ensure_table()
+        query = query or {}
+
+        sql_filters, parameters = push_down_filters(query)
+        sql = f'SELECT doc FROM "{self.namespace}"'
+
+        if len(sql_filters) > 0:
+            sql += " WHERE " + " AND ".join(sql_filters)
+
+        # Rows are pulled from SQLite as they are iterated so streaming a big collection doesn't load all of it.
+        for doc, in self.connection.execute(sql + " ORDER BY rowid", parameters):
+            document = json_util.loads(doc)
+
+            if match(document, query):
+                yield document
+
+    def _find_first(self, query: dict | None) -> dict | None:
+        documents = self._find_documents(query)
+
+        try:
+            return next(documents, None)
+        finally:
+            documents.close() # Finishes the SQLite statement before anything gets written.
+
+    async def find_one(self, query: dict = None, projection = None) -> dict | None:
+        return project(self._find_first(query), projection)
+
+    def find(self, query: dict = None, projection = None, limit: int = 0, **_) -> LocalCursor:
+        return LocalCursor(self, query, projection, limit)
+
+    # Writing
+    # ---------
+    def __write(self, document: dict, replace: bool) -> None:
+        try:
+            self.connection.execute(
+                f'INSERT {"OR REPLACE " if replace else ""}INTO "{self.namespace}" (id, doc) VALUES (?, ?)',
+                (id_key(document["_id"]), json_util.dumps(document))
+            )
+        except sqlite3.IntegrityError as e:
+            raise DuplicateKeyError(f"E11000 duplicate key error collection: {self.namespace} ({e})", 11000)
+
+    def __insert(self, document: dict) -> None:
+        self.__ensure_table()
+
+        if "_id" not in document:
+            document["_id"] = ObjectId()
+
+        self.__write(document, replace = False)
+
+    def __update(self, query: dict, update: dict, upsert: bool) -> Tuple[dict | None, dict | None]:
+        """Updates the first matching document, returns the document from before and after the update."""
+        document = self._find_first(query)
+
+        if document is not None:
+            updated = apply_update(json_util.loads(json_util.dumps(document)), update, inserting = False)
+            self.__write(updated, replace = True)
+
+            return document, updated
+
+        if not upsert:
+            return None, None
+
+        document = apply_update(upsert_base(query), update, inserting = True)
+        self.__insert(document)
+
+        return None, document
+
+    async def insert_one(self, document: dict) -> None:
+        self.__insert(document)
+        self.connection.commit()
+
+    async def insert_many(self, documents: List[dict], ordered: bool = True) -> None:
+        write_errors = []
+
+        for index, document in enumerate(documents):
+            try:
+                self.__insert(document)
+            except DuplicateKeyError as e:
+                write_errors.append({"index": index, "code": 11000, "errmsg": str(e)})
+
+                if ordered:
+                    break
+
+        self.connection.commit()
+
+        if len(write_errors) > 0:
+            raise BulkWriteError({"writeErrors": write_errors, "nInserted": len(documents) - len(write_errors)})
+
+    async def update_one(self, query: dict, update: dict, upsert: bool = False) -> None:
+        self.__update(query, update, upsert)
+        self.connection.commit()
+
+    async def find_one_and_update(self, query: dict, update: dict, projection = None, upsert: bool = False, return_document: bool = False, **_) -> dict | None:
+        before, after = self.__update(query, update, upsert)
+        self.connection.commit()
+
+        return project(after if return_document else before, projection)
+
+    async def delete_one(self, query: dict) -> None:
+        document = self._find_first(query)
+
+        if document is not None:
+            self.connection.execute(f'DELETE FROM "{self.namespace}" WHERE id = ?', (id_key(document["_id"]),))
+
+        self.connection.commit()
+
+    async def bulk_write(self, operations: List[UpdateOne], ordered: bool = True) -> None:
+        for operation in operations:
+            if not isinstance(operation, UpdateOne):
+                raise OperationFailure(f"'{type(operation).__name__}' is not supported by the local database backend's bulk_write.")
+
+        updates = [BulkUpdate(operation) for operation in operations]
+        write_errors = []
+
+        for index, update in enumerate(updates):
+            try:
+                self.__update(update.query, update.update, update.upsert)
+            except (DuplicateKeyError, OperationFailure) as e:
+                write_errors.append({"index": index, "code": e.code, "errmsg": str(e)})
+
+                if ordered:
+                    break
+
+        self.connection.commit()
+
+        if len(write_errors) > 0:
+            raise BulkWriteError({"writeErrors": write_errors})
+
+    async def drop(self) -> None:
+        self.connection.execute(f'DROP TABLE IF EXISTS "{self.namespace}"')
+        self.connection.execute('DELETE FROM "_goldy_indexes" WHERE namespace = ?', (self.namespace,))
+        self.connection.commit()
+
+        self.__table_exists = False
+
+    def watch(self, *args, **kwargs):
+        raise OperationFailure("Change streams are not supported by the local database backend.", 40573)
+
+    # Indexes
+    # ---------
+    async def list_indexes(self):
+        yield {"name": "_id_", "key": {"_id": 1}}
+
+        rows = self.connection.execute('SELECT spec FROM "_goldy_indexes" WHERE namespace = ?', (self.namespace,)).fetchall()
+
+        for spec, in rows:
+            yield json.loads(spec)
+
+    async def create_indexes(self, models: List[IndexModel]) -> List[str]:
+        self.__ensure_table()
+
+        for model in models:
+            spec = dict(model.document)
+            spec["key"] = dict(spec["key"])
+
+            columns = ", ".join(json_extract(key) for key in spec["key"])
+
+            try:
+                self.connection.execute(
+                    f'CREATE {"UNIQUE " if spec.get("unique") else ""}INDEX IF NOT EXISTS "{self.namespace}.{spec["name"]}" ' \
+                        f'ON "{self.namespace}" ({columns})'
+                )
+            except sqlite3.IntegrityError as e:
+                raise DuplicateKeyError(f"E11000 duplicate key error collection: {self.namespace} index: {spec['name']} ({e})", 11000)
+
+            self.connection.execute(
+                'INSERT OR REPLACE INTO "_goldy_indexes" (namespace, name, spec) VALUES (?, ?, ?)',
+                (self.namespace, spec["name"], json.dumps(spec))
+            )
+
+        self.connection.commit()
+
+        return [model.document["name"] for model in models]
+
+    async def drop_index(self, name: str) -> None:
+        self.connection.execute(f'DROP INDEX IF EXISTS "{self.namespace}.{name}"')
+        self.connection.execute('DELETE FROM "_goldy_indexes" WHERE namespace = ? AND name = ?', (self.namespace, name))
+        self.connection.commit()
+
+class BulkUpdate():
+    """
+    The filter, update and upsert flag of a pymongo ``UpdateOne``. 
+    
+    pymongo only keeps these as underscore attributes, reading them here means there's one place to fix if it ever renames them.
+    """
+    def __init__(self, operation: UpdateOne) -> None:
+        self.query: dict = operation._filter
+        self.update: dict = operation._doc
+        self.upsert = bool(operation._upsert)
+
+class LocalCursor():
+    def __init__(self, collection: LocalCollection, query: dict | None, projection, limit: int) -> None:
+        self.collection = collection
+        self.query = query
+        self.projection = projection
+        self.limit = limit
+
+        self.__sort: List[Tuple[str, int]] = []
+        self.__documents: Iterator[dict] | None = None
+
+    def sort(self, key: str | List[Tuple[str, int]], direction: int = 1) -> LocalCursor:
+        self.__sort = [(key, direction)] if isinstance(key, str) else list(key)
+        return self
+
+    def batch_size(self, batch_size: int) -> LocalCursor:
+        return self
+
+    def __load(self) -> Iterator[dict]:
+        if self.__documents is None:
+            documents = self.collection._find_documents(self.query)
+
+            if len(self.__sort) > 0:
+                # Sorting needs every matching document in memory, only unsorted cursors stream.
+                documents = list(documents)
+
+                for key, direction in reversed(self.__sort):
+                    documents.sort(key = lambda document: sort_key(get_path(document, key)), reverse = direction < 0)
+
+            if self.limit > 0:
+                documents = islice(documents, self.limit)
+
+            self.__documents = (project(document, self.projection) for document in documents)
+
+        return self.__documents
+
+    async def to_list(self, length: int | None) -> List[dict]:
+        documents = self.__load()
+
+        if length is None:
+            return list(documents)
+
+        return [document for _, document in zip(range(length), documents)]
+
+    async def next(self) -> dict:
+        try:
+            return next(self.__load())
+        except StopIteration:
+            raise StopAsyncIteration
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> dict:
+        return await self.next()
+
+    async def close(self) -> None:
+        if self.__documents is not None:
+            self.__documents.close()
+
+        self.__documents = iter([])
+
+
+# Document helpers
+# ------------------
+def id_key(_id: Any) -> str:
+    return json_util.dumps(_id)
+
+def json_extract(path: str) -> str:
+    return "json_extract(doc, '$." + ".".join(f'"{part}"' for part in path.split(".")) + "')"
+
+def json_each_contains(path: str, amount: int) -> str:
+    """SQL that's true when the field equals one of the values or is an array holding one of them."""
+    return f"EXISTS (SELECT 1 FROM json_each(doc, '$.\"{path}\"') WHERE value IN ({', '.join('?' for _ in range(amount))}))"
+
+def push_down_filters(query: dict) -> Tuple[List[str], list]:
+    """
+    Turns the plain equality and ``$in`` filters of a query into SQL so SQLite can narrow the documents down. 
+    
+    The SQL only has to let through every document that could match, ``match`` still checks each one. ``_id`` goes through 
+    the primary key, other top level fields are checked with ``json_each`` so arrays holding the value still match like they 
+    do in MongoDB. Dotted paths are left to ``match`` as they can step through arrays of documents.
+    """
+    sql_filters = []
+    parameters = []
+
+    for key, condition in query.items():
+        if key.startswith("$") or (not key == "_id" and "." in key):
+            continue
+
+        if isinstance(condition, dict) and list(condition) == ["$in"]:
+            values = condition["$in"]
+        elif not isinstance(condition, (dict, list)):
+            values = [condition]
+        else:
+            continue
+
+        if len(values) == 0:
+            sql_filters.append("0") # An empty $in matches nothing.
+
+        elif key == "_id":
+            sql_filters.append(f"id IN ({', '.join('?' for _ in values)})")
+            parameters.extend(id_key(value) for value in values)
+
+        elif all(isinstance(value, (str, int, float)) and not isinstance(value, bool) for value in values):
+            sql_filters.append(json_each_contains(key, len(values)))
+            parameters.extend(values)
+
+    return sql_filters, parameters
+
+def get_path(document: Any, path: str) -> Any:
+    for part in path.split("."):
+        if isinstance(document, dict):
+            document = document.get(part, MISSING)
+        elif isinstance(document, list) and part.isdigit() and int(part) < len(document):
+            document = document[int(part)]
+        else:
+            return MISSING
+
+        if document is MISSING:
+            return MISSING
+
+    return document
+
+def set_path(document: dict, path: str, value: Any) -> None:
+    *parents, key = path.split(".")
+
+    for part in parents:
+        child = document.setdefault(part, {})
+
+        if not isinstance(child, dict):
+            raise OperationFailure(f"Cannot create field '{key}' in element {{{part}: {child!r}}}", 28)
+
+        document = child
+
+    document[key] = value
+
+def unset_path(document: dict, path: str) -> None:
+    *parents, key = path.split(".")
+    parent = get_path(document, ".".join(parents)) if len(parents) > 0 else document
+
+    if isinstance(parent, dict):
+        parent.pop(key, None)
+
+def values_equal(value: Any, expected: Any) -> bool:
+    if value is MISSING:
+        return expected is None
+
+    if isinstance(value, list) and not isinstance(expected, list):
+        return expected in value
+
+    return value == expected
+
+def compare(value: Any, expected: Any, operator: str) -> bool:
+    if value is MISSING or value is None:
+        return False
+
+    try:
+        if operator == "$gt":
+            return value > expected
+        if operator == "$gte":
+            return value >= expected
+        if operator == "$lt":
+            return value < expected
+        return value <= expected
+    except TypeError:
+        return False
+
+def match(document: dict, query: dict) -> bool:
+    """Returns whether the document matches a MongoDB style query. Supports equality, comparisons, ``$in``, ``$nin``, ``$ne``, ``$exists``, ``$and`` and ``$or``."""
+    for key, condition in query.items():
+        if key == "$and":
+            if not all(match(document, sub_query) for sub_query in condition):
+                return False
+            continue
+
+        if key == "$or":
+            if not any(match(document, sub_query) for sub_query in condition):
+                return False
+            continue
+
+        value = get_path(document, key)
+
+        if isinstance(condition, dict) and len(condition) > 0 and all(operator.startswith("$") for operator in condition):
+            for operator, expected in condition.items():
+                if operator == "$eq":
+                    passed = values_equal(value, expected)
+                elif operator == "$ne":
+                    passed = not values_equal(value, expected)
+                elif operator == "$in":
+                    passed = any(values_equal(value, option) for option in expected)
+                elif operator == "$nin":
+                    passed = not any(values_equal(value, option) for option in expected)
+                elif operator == "$exists":
+                    passed = (value is not MISSING) == bool(expected)
+                elif operator in ("$gt", "$gte", "$lt", "$lte"):
+                    passed = compare(value, expected, operator)
+                else:
+                    raise OperationFailure(f"The query operator '{operator}' is not supported by the local database backend.")
+
+                if not passed:
+                    return False
+
+        elif not values_equal(value, condition):
+            return False
+
+    return True
+
+def upsert_base(query: dict) -> dict:
+    """The document an upsert starts from, made of the query's equality fields."""
+    document = {}
+
+    for key, condition in query.items():
+        if key.startswith("$"):
+            continue
+
+        if isinstance(condition, dict) and any(operator.startswith("$") for operator in condition):
+            if list(condition) == ["$eq"]:
+                set_path(document, key, condition["$eq"])
+            continue
+
+        set_path(document, key, condition)
+
+    return document
+
+def apply_update(document: dict, update: dict, inserting: bool) -> dict:
+    """Applies a MongoDB style update (``$set``, ``$setOnInsert``, ``$inc``, ``$unset`` or a replacement document) to a document."""
+    if not any(key.startswith("$") for key in update):
+        replacement = dict(update)
+
+        if "_id" in document:
+            replacement["_id"] = document["_id"]
+
+        return replacement
+
+    for operator, fields in update.items():
+        if operator == "$set" or (operator == "$setOnInsert" and inserting):
+            for path, value in fields.items():
+                set_path(document, path, value)
+
+        elif operator == "$setOnInsert":
+            continue
+
+        elif operator == "$inc":
+            for path, amount in fields.items():
+                current = get_path(document, path)
+                set_path(document, path, amount if current is MISSING else current + amount)
+
+        elif operator == "$unset":
+            for path in fields:
+                unset_path(document, path)
+
+        else:
+            raise OperationFailure(f"The update operator '{operator}' is not supported by the local database backend.")
+
+    return document
+
+def project(document: dict | None, projection: dict | List[str] | None) -> dict | None:
+    if document is None or projection is None:
+        return document
+
+    if isinstance(projection, (list, tuple)):
+        projection = {field: 1 for field in projection}
+
+    include_id = projection.get("_id", 1)
+    fields = {field: value for field, value in projection.items() if not field == "_id"}
+
+    if len(fields) > 0 and all(fields.values()):
+        projected = {}
+
+        for field in fields:
+            value = get_path(document, field)
+
+            if value is not MISSING:
+                set_path(projected, field, value)
+
+        if include_id and "_id" in document:
+            projected["_id"] = document["_id"]
+
+        return projected
+
+    projected = json_util.loads(json_util.dumps(document))
+
+    for field in fields:
+        unset_path(projected, field)
+
+    if not include_id:
+        projected.pop("_id", None)
+
+    return projected
+
+def sort_key(value: Any) -> Tuple[int, Any]:
+    """Orders missing/null values first then numbers then strings like MongoDB does, other types are compared as strings."""
+    if value is MISSING or value is None:
+        return (0, 0)
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (1, value)
+
+    if isinstance(value, str):
+        return (2, value)
+
+    return (3, str(value))
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import motor.motor_asyncio
+
+from . import DatabaseBackend
+
+__all__ = ("MongoBackend",)
+
+class MongoBackend(DatabaseBackend):
+    """Stores everything in MongoDB through motor. This is the default backend."""
+    name = "AsyncIOMotorClient"
+    supports_change_streams = True
+
+    def __init__(self, url: str, **client_options) -> None:
+        super().__init__(url, **client_options)
+
+        client_options.setdefault("serverSelectionTimeoutMS", 2000)
+        self.__client = motor.motor_asyncio.AsyncIOMotorClient(url, **client_options)
+
+    @property
+    def client(self) -> motor.motor_asyncio.AsyncIOMotorClient:
+        return self.__client
+
+    async def connect(self) -> None:
+        await self.__client.server_info()
+
+    def close(self) -> None:
+        self.__client.close()
@@ -1,79 +1,213 @@
 from __future__ import annotations
-from typing import List, TYPE_CHECKING
+from typing import List, Dict, Tuple, AsyncIterator, Union, TYPE_CHECKING
+
+import time
+from contextlib import contextmanager
 
 from devgoldyutils import Colours
+from pymongo import ReturnDocument
+from pymongo.read_preferences import Primary, PrimaryPreferred, Secondary, SecondaryPreferred, Nearest, make_read_preference, read_pref_mode_from_name
 
 if TYPE_CHECKING:
     from pymongo.results import UpdateResult
+    from motor.motor_asyncio import AsyncIOMotorCollection
     from .. import Database
 
-from ... import LoggerAdapter
+from ... import LoggerAdapter, GoldyBotError
 from .... import utils
 
+READ_PREFERENCE = Union[str, Primary, PrimaryPreferred, Secondary, SecondaryPreferred, Nearest, None]
+"""A read preference, either it's name like ``"secondaryPreferred"`` or a pymongo read preference. None uses the client's default."""
+
 class GoldyDB():
     """A class representing a singular goldy bot database in mongoDB."""
     def __init__(self, core_database: Database, db_code_name: str) -> None:
+        self.core_database = core_database
+        self.name = db_code_name
+
         self.client = core_database.client
         self.database = self.client[db_code_name]
         
         self.logger = LoggerAdapter(core_database.logger, Colours.PINK_GREY.apply_to_string(db_code_name))
 
+        self.__collections: Dict[str | Tuple[str, str], AsyncIOMotorCollection] = {}
+
+    def collection(self, collection: str, read_preference: READ_PREFERENCE = None) -> AsyncIOMotorCollection:
+        """
+        Returns the motor collection handle of that collection, handles are cached. 
+        
+        Pass a ``read_preference`` (like ``"secondaryPreferred"``) to get a handle that sends it's reads there instead of where the client's default says.
+        """
+        if read_preference is None:
+            handle = self.__collections.get(collection)
+
+            if handle is None:
+                handle = self.database[collection]
+                self.__collections[collection] = handle
+
+            return handle
+
+        if isinstance(read_preference, str):
+            read_preference = make_read_preference(read_pref_mode_from_name(read_preference), None)
+
+        key = (collection, repr(read_preference))
+        handle = self.__collections.get(key)
+
+        if handle is None:
+            handle = self.collection(collection).with_options(read_preference = read_preference)
+            self.__collections[key] = handle
+
+        return handle
+
+    @contextmanager
+    def track(self, collection: str, operation: str):
+        """Times the database operation ran inside this and reports it to :py:meth:`~GoldyBot.goldy.database.Database.record_operation`."""
+        start_time = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.core_database.record_operation(self.name, collection, operation, time.perf_counter() - start_time)
+
     async def insert(self, collection: str, data) -> None:
         """
         Inserts the data provided into a collection in this database. 
         Creates a whole new document. If you want to edit an existing document use .edit()
         """
-        await self.database[collection].insert_one(data)
+        with self.track(collection, "insert_one"):
+            await self.collection(collection).insert_one(data)
+
         self.logger.debug(f"Inserted '{data}' into '{collection}.'")
 
+    async def insert_many(self, collection: str, data: List[dict], ordered: bool = False) -> None:
+        """Inserts all these documents into a collection in this database in one go."""
+        with self.track(collection, "insert_many"):
+            await self.collection(collection).insert_many(data, ordered = ordered)
+
+        self.logger.debug(f"Inserted {len(data)} documents into '{collection}.'")
+
     async def edit(self, collection: str, query, data: dict, overwrite: bool = False) -> dict:
-        """Finds and edits a document in this database and collection with the data provided."""
-        if overwrite:
-            await self.database[collection].update_one(query, {"$set": data}, upsert = True)
-        else:
-            document_data = await self.find_one("guild_configs", query)
-            data = utils.update_dict(document_data, data) if document_data is not None else data
-            await self.database[collection].update_one(query, {"$set": data}, upsert = True)
+        """
+        Finds and edits a document in this database and collection with the data provided, creating it if it doesn't exist. Returns the edited document.
+
+        Sub dictionaries are merged into the document field by field unless ``overwrite`` is True. 
+        This all happens in one atomic operation so edits running at the same time don't clobber each other.
 
-        self.logger.debug(f"Edited '{query}' with '{data}.'")
-        return await self.find_one(collection, query)
+        Raises ``GoldyBotError`` if the data has an ``_id`` (it can't be changed) or keys with a ``.`` or starting with ``$``.
+        """
+        if "_id" in data:
+            raise GoldyBotError(f"Can't edit the '_id' of a document in '{collection}', leave it out of the data.")
+
+        try:
+            flat_update = utils.flatten_dict(data) # Also checks the keys.
+        except ValueError as e:
+            raise GoldyBotError(f"Can't edit '{query}' in '{collection}'. {e}")
+
+        update = data if overwrite else flat_update
+
+        if len(update) == 0:
+            return await self.find_one(collection, query)
+
+        with self.track(collection, "find_one_and_update"):
+            document = await self.collection(collection).find_one_and_update(
+                query, 
+                {"$set": update}, 
+                upsert = True, 
+                return_document = ReturnDocument.AFTER
+            )
+
+        self.logger.debug(f"Edited '{query}' with '{update}.'")
+        return document
 
     async def remove(self, collection: str, data) -> None:
         """Finds and deletes a copy of this data from a collection in this database."""
-        await self.database[collection].delete_one(data)
+        with self.track(collection, "delete_one"):
+            await self.collection(collection).delete_one(data)
+
         self.logger.debug(f"Deleted '{data}' from '{collection}.'")
 
-    async def find(self, collection:  str, query, key: str, max_to_find = 50) -> List[dict]:
-        """Searches for and returns documents with that query in a collection in this database."""
+    async def find(self, collection:  str, query, key: str, max_to_find = 50, read_preference: READ_PREFERENCE = None) -> List[dict]:
+        """Searches for and returns documents with that query in a collection in this database. Use :py:meth:`~GoldyBot.goldy.database.databases.GoldyDB.stream` for large results."""
         try:
-            document_list = []
-            cursor = self.database[collection].find(query).sort(key)
+            cursor = self.collection(collection, read_preference).find(query).sort(key)
 
-            for document in await cursor.to_list(max_to_find):
-                document_list.append(document)
+            with self.track(collection, "find"):
+                return await cursor.to_list(max_to_find)
 
-            return document_list
         except KeyError:
             self.logger.debug(f"Could not find the collection '{collection}'!")
             return None
 
-    async def find_all(self, collection: str, max_to_find=100) -> List[dict] | None:
+    async def find_all(self, collection: str, max_to_find=100, read_preference: READ_PREFERENCE = None) -> List[dict] | None:
         """Finds and returns all documents in a collection from this database. This took me a day to make! 😞"""
         try:
-            document_list = []
-            cursor = self.database[collection].find().sort('_id')
+            cursor = self.collection(collection, read_preference).find().sort('_id')
 
-            for document in await cursor.to_list(max_to_find):
-                document_list.append(document)
+            with self.track(collection, "find"):
+                return await cursor.to_list(max_to_find)
 
-            return document_list
         except KeyError:
             self.logger.debug(f"Could not find the collection '{collection}'!")
             return None
 
-    async def find_one(self, collection: str, query: dict) -> (dict | None):
+    async def stream(
+        self, 
+        collection: str, 
+        query: dict = None, 
+        projection: dict | List[str] = None, 
+        sort: str | List[Tuple[str, int]] = None, 
+        limit: int = 0, 
+        batch_size: int = None, 
+        read_preference: READ_PREFERENCE = None
+    ) -> AsyncIterator[dict]:
+        """
+        Streams documents matching the query from a collection in this database, one batch in memory at a time. 
+        Great for leaderboards or going over every document in a large collection.
+
+        ---------------
+
+        ⭐ Example:
+        -------------
+        ::
+
+            async for member in database.stream("members", {"scope": guild.id}, projection = ["xp"], sort = [("xp", -1)], limit = 10):
+                ...
+
+        ``limit`` is applied by the server, 0 means no limit. ``batch_size`` is how many documents are pulled per round trip. 
+        Big streams like leaderboards are a good fit for ``read_preference = "secondaryPreferred"``.
+        """
+        cursor = self.collection(collection, read_preference).find(query or {}, projection, limit = limit)
+
+        if sort is not None:
+            cursor = cursor.sort(sort)
+
+        if batch_size is not None:
+            cursor = cursor.batch_size(batch_size)
+
+        waited = 0.0
+
+        try:
+            while True:
+                start_time = time.perf_counter()
+
+                try:
+                    document = await cursor.next()
+                except StopAsyncIteration:
+                    break
+                finally:
+                    waited += time.perf_counter() - start_time
+
+                yield document
+
+        finally:
+            await cursor.close()
+            # Only the time spent waiting on the database is recorded, not the time the caller spent on each document.
+            self.core_database.record_operation(self.name, collection, "stream", waited)
+
+    async def find_one(self, collection: str, query: dict, read_preference: READ_PREFERENCE = None) -> (dict | None):
         """Searches for and returns specific data (document) from a collection in this database."""
-        data = await self.database[collection].find_one(query)
+        with self.track(collection, "find_one"):
+            data = await self.collection(collection, read_preference).find_one(query)
 
         if data is not None:
             self.logger.debug(f"Found '{query}' in '{collection}.'")
@@ -83,15 +217,30 @@ class GoldyDB():
             return None
 
     async def create_collection(self, collection_name: str, data) -> None:
-        await self.database[collection_name].insert_one(data)
+        with self.track(collection_name, "insert_one"):
+            await self.collection(collection_name).insert_one(data)
+
         self.logger.debug(f"Database collection '{collection_name}' created.")
 
+    async def bulk_write(self, collection: str, operations: list, ordered: bool = True) -> None:
+        """Runs a batch of write operations on a collection in this database in one round trip."""
+        with self.track(collection, "bulk_write"):
+            await self.collection(collection).bulk_write(operations, ordered = ordered)
+
+    def watch(self, collection: str, **kwargs):
+        """Returns a change stream of the following collection. Change streams are only supported on replica sets and sharded clusters."""
+        return self.collection(collection).watch(**kwargs)
+
     async def get_collection(self, collection: str):
         """Returns cursor of the following collection."""
-        return self.database[collection]
+        return self.collection(collection)
 
     async def delete_collection(self, collection_name: str) -> None:
-        await self.database[collection_name].drop()
+        await self.collection(collection_name).drop()
+
+        for key in [key for key in self.__collections if key == collection_name or (isinstance(key, tuple) and key[0] == collection_name)]:
+            del self.__collections[key]
+
         self.logger.debug(f"Database collection '{collection_name}' dropped.")
 
     async def list_collection_names(self) -> List[str]:
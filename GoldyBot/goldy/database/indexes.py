@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Tuple, Dict, Any
+
+import pymongo
+from pymongo import IndexModel
+from pymongo.errors import OperationFailure
+
+from . import DatabaseEnums
+
+if TYPE_CHECKING:
+    from .databases import GoldyDB
+
+__all__ = ("DatabaseIndex",)
+
+COMPARED_OPTIONS = {"unique": False, "sparse": False, "expireAfterSeconds": None, "partialFilterExpression": None}
+"""Index options (and their defaults) that make an existing index different from the declared one when they don't match."""
+
+class DatabaseIndex():
+    """
+    Declares an index goldy bot should make sure exists on a collection at start up.
+
+    ---------------
+
+    ⭐ Example:
+    -------------
+    This is how an extension declares the indexes it's queries need::
+
+        class Economy(GoldyBot.Extension):
+            indexes = [
+                GoldyBot.DatabaseIndex("goldy_member_data", "members", [("scope", 1), ("coins", -1)])
+            ]
+    """
+    def __init__(
+        self,
+        database: DatabaseEnums | str,
+        collection: str,
+        keys: List[Tuple[str, int]] | str,
+        unique: bool = False,
+        **options
+    ) -> None:
+        if isinstance(keys, str):
+            keys = [(keys, pymongo.ASCENDING)]
+
+        self.database = DatabaseEnums(database).value
+        self.collection = collection
+        self.keys = [(key, direction) for key, direction in keys]
+
+        self.options: Dict[str, Any] = options
+
+        if unique:
+            self.options["unique"] = True
+
+        self.options.setdefault("name", "_".join(f"{key}_{direction}" for key, direction in self.keys))
+
+    def __repr__(self) -> str:
+        return f"<DatabaseIndex {self.database}.{self.collection} {self.name}>"
+
+    @property
+    def name(self) -> str:
+        return self.options["name"]
+
+    def to_model(self) -> IndexModel:
+        return IndexModel(self.keys, **self.options)
+
+    def matches(self, index_info: dict) -> bool:
+        """Returns whether an existing index (from ``list_indexes``) is the same as this one."""
+        if not [(key, direction) for key, direction in index_info["key"].items()] == self.keys:
+            return False
+
+        for option, default in COMPARED_OPTIONS.items():
+            if not index_info.get(option, default) == self.options.get(option, default):
+                return False
+
+        return True
+
+
+async def sync_collection_indexes(
+    goldy_db: GoldyDB,
+    collection: str,
+    indexes: List[DatabaseIndex],
+    rebuild: bool = False
+) -> Tuple[int, int, List[DatabaseIndex]]:
+    """
+    Makes the indexes of a collection match the declared ones. Missing indexes are created and indexes that aren't declared are left alone.
+
+    Existing indexes with the same name or keys but different options are only rebuilt when ``rebuild`` is True, 
+    otherwise they are left as they are and returned so they can be reported.
+
+    Returns how many indexes were created, how many were rebuilt and the indexes that are out of date.
+    """
+    handle = goldy_db.collection(collection)
+    existing_indexes = {index_info["name"]: index_info async for index_info in handle.list_indexes()}
+
+    to_create: List[DatabaseIndex] = []
+    to_rebuild: List[Tuple[DatabaseIndex, dict]] = []
+    outdated: List[DatabaseIndex] = []
+
+    for index in indexes:
+        existing = existing_indexes.get(index.name)
+
+        if existing is None:
+            # An index on the same keys under another name would stop ours from being created.
+            existing = next(
+                (info for info in existing_indexes.values() if list(info["key"].items()) == index.keys and not info["name"] == "_id_"), None
+            )
+
+        if existing is None:
+            to_create.append(index)
+
+        elif index.matches(existing):
+            continue
+
+        elif rebuild:
+            to_rebuild.append((index, existing))
+
+        else:
+            outdated.append(index)
+
+    if len(to_create) > 0:
+        await handle.create_indexes([index.to_model() for index in to_create])
+
+    for index, existing in to_rebuild:
+        await rebuild_index(handle, index, existing)
+
+    return len(to_create), len(to_rebuild), outdated
+
+async def rebuild_index(handle, index: DatabaseIndex, existing: dict) -> None:
+    """
+    Swaps an existing index for the declared one. MongoDB won't hold two indexes on the same keys so the old one has to 
+    be dropped first, if the new one then fails to build (e.g. duplicates break a unique index) the old one is put back.
+    """
+    await handle.drop_index(existing["name"])
+
+    try:
+        await handle.create_indexes([index.to_model()])
+
+    except OperationFailure:
+        old_options = {option: value for option, value in existing.items() if option not in ("key", "v", "ns")}
+
+        await handle.create_indexes([IndexModel(list(existing["key"].items()), **old_options)])
+        raise
+
+async def collscan_report(goldy_db: GoldyDB, limit: int = 1000) -> List[Dict[str, Any]]:
+    """
+    Returns the collections in this database that had queries run as a collection scan, worst first,
+    using the slow queries in ``system.profile``. Profiling has to be enabled for anything to show up.
+    """
+    report: Dict[str, Dict[str, Any]] = {}
+
+    slow_queries = goldy_db.stream(
+        "system.profile",
+        {"planSummary": "COLLSCAN"},
+        projection = ["ns", "millis", "docsExamined", "command"],
+        sort = [("ts", pymongo.DESCENDING)],
+        limit = limit
+    )
+
+    async for entry in slow_queries:
+        stats = report.get(entry["ns"])
+
+        if stats is None:
+            command = entry.get("command", {})
+            stats = {
+                "namespace": entry["ns"],
+                "count": 0,
+                "total_ms": 0,
+                "max_docs_examined": 0,
+                "example_filter": command.get("filter", command.get("q"))
+            }
+            report[entry["ns"]] = stats
+
+        stats["count"] += 1
+        stats["total_ms"] += entry.get("millis", 0)
+        stats["max_docs_examined"] = max(stats["max_docs_examined"], entry.get("docsExamined", 0))
+
+    return sorted(report.values(), key = lambda stats: stats["total_ms"], reverse = True)
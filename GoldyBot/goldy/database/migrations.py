@@ -0,0 +1,107 @@
+"""
+Tools for moving member data from the old one collection per member layout
+into the single ``members`` collection. Migrations are safe to run while the bot is online.
+"""
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, List, Dict, Any
+
+from pymongo import UpdateOne
+
+from . import DatabaseEnums
+from .wrappers.member import MEMBERS_COLLECTION, GLOBAL_SCOPE
+
+if TYPE_CHECKING:
+    from . import Database
+
+__all__ = ("list_legacy_member_collections", "migrate_member_collection", "migrate_member_data")
+
+LEGACY_GLOBAL_ID = "1"
+"""The ``_id`` the global data document had in the old layout."""
+
+async def list_legacy_member_collections(database: Database) -> List[str]:
+    """Returns the names of all the old per member collections left in ``goldy_member_data``."""
+    collection_names = await database.list_collection_names(DatabaseEnums.GOLDY_MEMBER_DATA)
+
+    return [name for name in collection_names if name.isdigit()]
+
+async def migrate_member_collection(database: Database, member_id: str, batch_size: int = 500, drop: bool = True) -> int:
+    """
+    Streams one member's old collection into the ``members`` collection. Returns how many documents were migrated.
+
+    Data that was already written to the new layout (e.g. by an increment before the member was migrated) always wins, 
+    the legacy data only fills in the fields it's missing.
+    """
+    goldy_db = database.get_goldy_database(DatabaseEnums.GOLDY_MEMBER_DATA)
+
+    existing_documents = {
+        document["scope"]: document async for document in goldy_db.stream(MEMBERS_COLLECTION, {"member_id": member_id})
+    }
+
+    operations: List[UpdateOne] = []
+    migrated = 0
+
+    async for document in goldy_db.stream(member_id, batch_size = batch_size):
+        scope = document.pop("_id")
+        scope = GLOBAL_SCOPE if scope == LEGACY_GLOBAL_ID else scope
+
+        existing = existing_documents.get(scope)
+
+        if existing is None:
+            update = {"$setOnInsert": document}
+        else:
+            missing = missing_fields(document, existing)
+            update = {"$set": missing} if len(missing) > 0 else None
+
+        if update is not None:
+            operations.append(UpdateOne({"member_id": member_id, "scope": scope}, update, upsert = True))
+
+        if len(operations) >= batch_size:
+            await goldy_db.bulk_write(MEMBERS_COLLECTION, operations, ordered = False)
+            migrated += len(operations)
+            operations = []
+
+    if len(operations) > 0:
+        await goldy_db.bulk_write(MEMBERS_COLLECTION, operations, ordered = False)
+        migrated += len(operations)
+
+    if drop:
+        await goldy_db.delete_collection(member_id)
+        database.legacy_member_ids.discard(member_id)
+
+    return migrated
+
+def missing_fields(legacy_document: Dict[str, Any], document: Dict[str, Any], path: str = "") -> Dict[str, Any]:
+    """Returns the fields (as dotted paths) of the legacy document that the new layout document doesn't have yet."""
+    missing = {}
+
+    for key, value in legacy_document.items():
+        if key not in document:
+            missing[path + key] = value
+
+        elif isinstance(value, dict) and isinstance(document[key], dict):
+            missing.update(missing_fields(value, document[key], path + key + "."))
+
+    return missing
+
+async def migrate_member_data(database: Database, batch_size: int = 500, drop: bool = True) -> int:
+    """Migrates every old per member collection into the ``members`` collection. Returns how many documents were migrated."""
+    start_time = time.perf_counter()
+
+    legacy_collections = await list_legacy_member_collections(database)
+    database.logger.info(f"Migrating the member data of {len(legacy_collections)} members...")
+
+    migrated = 0
+
+    for index, member_id in enumerate(legacy_collections, start = 1):
+        migrated += await migrate_member_collection(database, member_id, batch_size, drop)
+
+        if index % 1000 == 0:
+            database.logger.info(f"Migrated {index}/{len(legacy_collections)} members...")
+
+    database.logger.info(
+        f"Done migrating {migrated} member data documents in {time.perf_counter() - start_time:.2f}s."
+    )
+
+    return migrated
@@ -1,5 +1,8 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Callable
+
+import copy
+import time
 
 from . import DatabaseWrapper
 
@@ -10,7 +13,7 @@ if TYPE_CHECKING:
 
 class GuildDBWrapper(DatabaseWrapper):
     """A database wrapper for goldy bot members."""
-    def __init__(self, guild: guilds.Guild) -> None:
+    def __init__(self, guild: guilds.Guild, clock: Callable[[], float] = time.monotonic) -> None:
         self.guild = guild
 
         self.guild_config_template = {
@@ -30,6 +33,11 @@ class GuildDBWrapper(DatabaseWrapper):
             }
         }
 
+        self.version = 0
+        """Incremented every time new config data is loaded into the wrapper."""
+        self.__last_updated: float | None = None
+        self.__clock = clock
+
         super().__init__(
             guild.goldy, guild.logger
         )
@@ -62,13 +70,58 @@ class GuildDBWrapper(DatabaseWrapper):
         """Returns the extension restrictions from this guild."""
         return self.get("extensions", "restrictions")
 
+    @property
+    def is_stale(self) -> bool:
+        """
+        Returns whether the config data held in memory should be pulled from the database again. 
+        
+        While guild configs are being watched with a change stream the data never goes stale 
+        as changes are pushed to us, otherwise it goes stale after the ``config_ttl`` set in ``goldy.json``.
+        """
+        if self.__last_updated is None:
+            return True
+
+        guild_manager = self.goldy.guild_manager
+
+        if guild_manager.watching_configs or guild_manager.config_ttl is None:
+            return False
+
+        return self.__clock() - self.__last_updated >= guild_manager.config_ttl
+
+    def set_data(self, data: dict) -> None:
+        """Replaces the config data held in memory without touching the database."""
+        self.data = data
+        self.version += 1
+        self.__last_updated = self.__clock()
+
+        self.goldy.guild_manager.update_prefix(self)
+
+    def expire(self) -> None:
+        """Marks the config data held in memory as stale so it's pulled from the database on next access."""
+        self.__last_updated = None
+
+    def new_config(self) -> dict:
+        """Returns a fresh config document for this guild made from the template."""
+        guild_config = copy.deepcopy(self.guild_config_template)
+        guild_config["_id"] = self.guild.id
+        guild_config["code_name"] = self.guild.code_name
+
+        return guild_config
+
+    async def refresh(self) -> None:
+        """Pulls the config from the database only if the data held in memory has gone stale."""
+        if self.is_stale:
+            await self.update()
+
     async def push(self, data: dict) -> None:
         self.logger.info("Pushing guild config to the database...")
         database = self.goldy.database.get_goldy_database(DatabaseEnums.GOLDY_MAIN)
 
         doc_id = self.guild.id
 
-        await database.edit("guild_configs", {"_id": doc_id}, data, overwrite = False)
+        self.set_data(
+            await database.edit("guild_configs", {"_id": doc_id}, data, overwrite = False)
+        )
 
     async def update(self) -> None:
         self.logger.info("Pulling updated guild configuration data from database...")
@@ -80,11 +133,7 @@ class GuildDBWrapper(DatabaseWrapper):
         guild_config = await database.find_one("guild_configs", query = {"_id": self.guild.id})
 
         if guild_config is None:
-            guild_config_template = self.guild_config_template.copy()
-            guild_config_template["_id"] = self.guild.id
-            guild_config_template["code_name"] = self.guild.code_name
-
-            guild_config = guild_config_template
+            guild_config = self.new_config()
             await database.insert("guild_configs", data = guild_config)
 
-        self.data = guild_config
\ No newline at end of file
+        self.set_data(guild_config)
\ No newline at end of file
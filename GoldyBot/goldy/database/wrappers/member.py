@@ -1,13 +1,21 @@
 from __future__ import annotations
-from typing import Literal, TYPE_CHECKING
+from typing import Literal, Dict, TYPE_CHECKING
 
 from . import DatabaseWrapper
+from .... import utils
 
 from .. import DatabaseEnums
 
 if TYPE_CHECKING:
     from ... import objects
 
+MEMBERS_COLLECTION = "members"
+"""The collection in ``goldy_member_data`` holding every member's data documents, one per member and scope."""
+GLOBAL_SCOPE = "global"
+"""The scope of a member's global data document. Guild data documents are scoped by the guild's id."""
+DOCUMENT_KEYS = ("_id", "member_id", "scope")
+"""Keys of a member data document that identify it rather than being the member's data."""
+
 class MemberDBWrapper(DatabaseWrapper):
     """A database wrapper for goldy bot members."""
     def __init__(self, member: objects.Member) -> None:
@@ -17,79 +25,110 @@ class MemberDBWrapper(DatabaseWrapper):
             member.goldy, member.logger
         )
 
-    async def push(self, type: Literal[DatabaseEnums.MEMBER_GUILD_DATA, DatabaseEnums.MEMBER_GLOBAL_DATA] | str, data: dict) -> None:
+    async def push(
+        self, 
+        type: Literal[DatabaseEnums.MEMBER_GUILD_DATA, DatabaseEnums.MEMBER_GLOBAL_DATA] | str, 
+        data: dict, 
+        buffered: bool = False
+    ) -> None:
+        """
+        Pushes data to the member's global or guild document. 
+        
+        With ``buffered`` the write goes through the database's write-behind buffer instead, 
+        that's way cheaper for data changing on every message but it only hits the database on the next flush.
+        """
         self.logger.info("Pushing data to the database...")
         database = self.goldy.database.get_goldy_database(DatabaseEnums.GOLDY_MEMBER_DATA)
 
+        query = self.__document_query(type)
+
+        if buffered:
+            self.goldy.database.write_buffer.set(DatabaseEnums.GOLDY_MEMBER_DATA, MEMBERS_COLLECTION, query, utils.flatten_dict(data))
+            self.data = utils.update_dict(self.data, data)
+            return None
+
+        await database.edit(MEMBERS_COLLECTION, query, data, overwrite = False)
+
+    def increment(self, type: Literal[DatabaseEnums.MEMBER_GUILD_DATA, DatabaseEnums.MEMBER_GLOBAL_DATA] | str, data: Dict[str, int | float]) -> None:
+        """Increments these fields (dotted paths for nested ones) of the member's global or guild document through the write-behind buffer. Great for xp and counters."""
+        self.goldy.database.write_buffer.inc(DatabaseEnums.GOLDY_MEMBER_DATA, MEMBERS_COLLECTION, self.__document_query(type), data)
+
+        for path, value in data.items():
+            keys = path.split(".")
+            sub_data = self.data
+
+            for key in keys[:-1]:
+                sub_data = sub_data.setdefault(key, {})
+
+            sub_data[keys[-1]] = sub_data.get(keys[-1], 0) + value
+
+    def __document_query(self, type: Literal[DatabaseEnums.MEMBER_GUILD_DATA, DatabaseEnums.MEMBER_GLOBAL_DATA] | str) -> dict:
         if isinstance(type, str):
             type = DatabaseEnums(type)
 
-        doc_id = "1" # Global document.
+        scope = GLOBAL_SCOPE
 
         if type == DatabaseEnums.MEMBER_GUILD_DATA:
-            doc_id = self.member.guild.id
+            scope = self.member.guild.id
 
-        await database.edit(self.member.id, {"_id": doc_id}, data, overwrite = False)
+        return {"member_id": self.member.id, "scope": scope}
 
     async def update(self) -> None:
         self.logger.info("Pulling updated member data from database...")
 
         database = self.goldy.database.get_goldy_database(DatabaseEnums.GOLDY_MEMBER_DATA)
 
-        # Let's hope you are not in more than 200 guilds or else this will break! 😫
-        self.logger.debug("Finding member's data collections...")
-        member_data = await database.find(self.member.id, 
+        member_data = await database.find(MEMBERS_COLLECTION,
             query = {
-                "_id" : {"$in" : ["1", self.member.guild.id]}
-            }, 
-            key = "_id",
+                "member_id": self.member.id,
+                "scope": {"$in" : [GLOBAL_SCOPE, self.member.guild.id]}
+            },
+            key = "scope",
             max_to_find = 2
         )
 
-        global_data = None
-        guild_data = None
+        # Checked against the legacy collections found at start up, new layout documents could already exist from an increment.
+        if self.member.id in self.goldy.database.legacy_member_ids:
+            member_data = await self.__migrate_legacy_data() or member_data
+
+        global_data = {}
+        guild_data = {}
 
         for data in member_data:
 
-            if data["_id"] == "1":
+            if data["scope"] == GLOBAL_SCOPE:
                 global_data = data
                 self.logger.debug("Found member's global data.")
 
-            elif data["_id"] == self.member.guild.id:
+            elif data["scope"] == self.member.guild.id:
                 guild_data = data
                 self.logger.debug(
                     f"Found member's guild data for '{self.member.guild.code_name}'."
                 )
 
-        # Generate template if member's data don't exist.
-        # ------------------------------------------------
-        if global_data is None:
-            self.logger.info(
-                f"'{self.member.username}'s global member data doesn't exist so we are generating one..."
-            )
+        # Members without data don't get documents until something is pushed.
+        self.data = {
+            key: value for key, value in {**global_data, **guild_data}.items() if key not in DOCUMENT_KEYS
+        }
 
-            await database.create_collection(
-                self.member.id,
-                data = {
-                    "_id": "1",
-                }
-            )
+    async def __migrate_legacy_data(self) -> list:
+        """Moves this member's data over from the old one collection per member layout if it's still there."""
+        from ..migrations import migrate_member_collection
 
-            global_data = {"_id": "1"}
+        migrated = await migrate_member_collection(self.goldy.database, self.member.id)
 
-        if guild_data is None:
-            self.logger.info(
-                f"'{self.member.username}'s guild member data doesn't exist so we are generating one..."
-            )
+        if migrated == 0:
+            return []
 
-            await database.create_collection(
-                self.member.id,
-                data = {
-                    "_id": self.member.guild.id,
-                }
-            )
-
-            guild_data = {"_id": self.member.guild.id}
+        self.logger.debug(f"Migrated {migrated} of '{self.member.username}'s legacy member data documents.")
 
+        database = self.goldy.database.get_goldy_database(DatabaseEnums.GOLDY_MEMBER_DATA)
 
-        self.data = {**global_data, **guild_data}
\ No newline at end of file
+        return await database.find(MEMBERS_COLLECTION,
+            query = {
+                "member_id": self.member.id,
+                "scope": {"$in" : [GLOBAL_SCOPE, self.member.guild.id]}
+            },
+            key = "scope",
+            max_to_find = 2
+        )
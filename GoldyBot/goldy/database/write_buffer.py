@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import json
+import time
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, Tuple, Any
+
+from pymongo import UpdateOne
+from pymongo.errors import PyMongoError, BulkWriteError
+
+from . import DatabaseEnums
+from .. import LoggerAdapter
+
+if TYPE_CHECKING:
+    from . import Database
+
+__all__ = ("WriteBehindBuffer",)
+
+class PendingWrite():
+    """The ``$set`` and ``$inc`` operations waiting to be written to one document."""
+    def __init__(self, query: dict) -> None:
+        self.query = query
+        self.set: Dict[str, Any] = {}
+        self.inc: Dict[str, int | float] = {}
+        self.attempts = 0
+        """How many times writing this update has failed."""
+
+    def conflicts(self, operator: str, paths: List[str]) -> bool:
+        """Returns whether any of these field paths can't be merged into this update as MongoDB won't allow overlapping paths in one update."""
+        pending_paths = list(self.set) + list(self.inc)
+
+        for path in paths:
+            if operator == "inc" and not isinstance(self.set.get(path, 0), (int, float)):
+                return True
+
+            for pending_path in pending_paths:
+                if not path == pending_path and (pending_path.startswith(path + ".") or path.startswith(pending_path + ".")):
+                    return True
+
+        return False
+
+    def to_operation(self) -> UpdateOne:
+        update = {}
+
+        if len(self.set) > 0:
+            update["$set"] = self.set
+
+        if len(self.inc) > 0:
+            update["$inc"] = self.inc
+
+        return UpdateOne(self.query, update, upsert = True)
+
+class WriteBehindBuffer():
+    """
+    Coalesces document updates in memory and writes them to the database in ``bulk_write`` batches.
+
+    Updates to the same document are merged (``$set`` values are replaced, ``$inc`` values are summed) so a member
+    gaining xp on every message only costs one write per flush. Buffered writes are flushed every ``flush_interval`` seconds,
+    once ``max_pending`` documents are waiting or when goldy bot stops.
+
+    Updates that fail to write are put back and retried on the next flush, they are only dropped after failing ``max_attempts`` times.
+    If the connection drops mid write MongoDB can't tell us whether it landed, so a retried ``$inc`` could in rare cases be counted twice.
+    """
+    def __init__(self, database: Database, max_pending: int = 500, flush_interval: float = 2, max_attempts: int = 5) -> None:
+        self.database = database
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+
+        self.logger = LoggerAdapter(database.logger, prefix = "WriteBehindBuffer")
+
+        self.metrics: Dict[str, int | float] = {
+            "buffered_writes": 0,
+            "coalesced_writes": 0,
+            "flushes": 0,
+            "flushed_documents": 0,
+            "retried_documents": 0,
+            "failed_documents": 0,
+            "last_batch_size": 0,
+            "max_batch_size": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+        }
+        """Counters on how well the buffer is batching writes and how long flushes take."""
+
+        self.__pending: Dict[Tuple[str, str], List[PendingWrite]] = {}
+        self.__open: Dict[Tuple[str, str, str], PendingWrite] = {}
+        self.__pending_count = 0
+
+        self.__flush_lock = asyncio.Lock()
+        self.__flusher: asyncio.Task | None = None
+        self.__flush_scheduled = False
+
+    def __len__(self) -> int:
+        """Returns how many document updates are waiting to be flushed."""
+        return self.__pending_count
+
+    def set(self, database: DatabaseEnums | str, collection: str, query: dict, data: dict) -> None:
+        """Buffers a ``$set`` of these fields. Use dotted paths (``utils.flatten_dict``) to set nested fields."""
+        self.__buffer(database, collection, query, "set", data)
+
+    def inc(self, database: DatabaseEnums | str, collection: str, query: dict, data: Dict[str, int | float]) -> None:
+        """Buffers an ``$inc`` of these fields."""
+        self.__buffer(database, collection, query, "inc", data)
+
+    def __buffer(self, database: DatabaseEnums | str, collection: str, query: dict, operator: str, data: dict) -> None:
+        database_name = DatabaseEnums(database).value
+        key = (database_name, collection, json.dumps(query, sort_keys = True, default = str))
+
+        pending = self.__open.get(key)
+
+        self.metrics["buffered_writes"] += 1
+
+        if pending is not None and pending.conflicts(operator, list(data)):
+            # Can't merge this into the same update so it gets written after the one pending.
+            pending = None
+
+        if pending is None:
+            pending = PendingWrite(query)
+
+            self.__open[key] = pending
+            self.__pending.setdefault((database_name, collection), []).append(pending)
+            self.__pending_count += 1
+        else:
+            self.metrics["coalesced_writes"] += 1
+
+        if operator == "set":
+            for path, value in data.items():
+                pending.inc.pop(path, None) # A set overrides any increments before it.
+                pending.set[path] = value
+
+        else:
+            for path, value in data.items():
+                if path in pending.set and isinstance(pending.set[path], (int, float)):
+                    pending.set[path] += value
+                else:
+                    pending.inc[path] = pending.inc.get(path, 0) + value
+
+        if self.__flusher is None:
+            self.__flusher = asyncio.get_event_loop().create_task(self.__flush_loop())
+
+        if self.__pending_count >= self.max_pending and not self.__flush_scheduled:
+            self.__flush_scheduled = True
+            asyncio.get_event_loop().create_task(self.flush())
+
+    async def flush(self) -> int:
+        """Writes every buffered update to the database now. Returns how many documents were written."""
+        async with self.__flush_lock:
+            self.__flush_scheduled = False
+
+            if self.__pending_count == 0:
+                return 0
+
+            pending, self.__pending = self.__pending, {}
+            self.__open = {}
+            batch_size, self.__pending_count = self.__pending_count, 0
+
+            start_time = time.perf_counter()
+            written = 0
+
+            for (database_name, collection), pending_writes in pending.items():
+                operations = [pending_write.to_operation() for pending_write in pending_writes]
+
+                try:
+                    # Ordered so updates that couldn't be merged still land in the order they were made.
+                    await self.database.get_goldy_database(database_name).bulk_write(collection, operations, ordered = True)
+                    written += len(operations)
+
+                except PyMongoError as e:
+                    failed_writes = pending_writes
+
+                    if isinstance(e, BulkWriteError) and len(e.details.get("writeErrors", [])) > 0:
+                        # The batch is ordered so everything before the first error was written and nothing after it was tried.
+                        failed_index = e.details["writeErrors"][0]["index"]
+                        written += failed_index
+
+                        failed_writes = pending_writes[failed_index:]
+                        failed_writes[0].attempts += 1
+                    else:
+                        for pending_write in failed_writes:
+                            pending_write.attempts += 1
+
+                    self.__requeue(database_name, collection, failed_writes, e)
+
+            flush_ms = (time.perf_counter() - start_time) * 1000
+
+            self.metrics["flushes"] += 1
+            self.metrics["flushed_documents"] += written
+            self.metrics["last_batch_size"] = batch_size
+            self.metrics["max_batch_size"] = max(self.metrics["max_batch_size"], batch_size)
+            self.metrics["last_flush_ms"] = flush_ms
+            self.metrics["max_flush_ms"] = max(self.metrics["max_flush_ms"], flush_ms)
+
+            self.logger.debug(f"Flushed {written}/{batch_size} buffered document writes in {flush_ms:.1f}ms.")
+
+            return written
+
+    def __requeue(self, database_name: str, collection: str, failed_writes: List[PendingWrite], error: PyMongoError) -> None:
+        """Puts failed writes back in front of the ones buffered since, dropping those that have run out of attempts."""
+        retry_writes = [pending_write for pending_write in failed_writes if pending_write.attempts < self.max_attempts]
+        dropped = len(failed_writes) - len(retry_writes)
+
+        if len(retry_writes) > 0:
+            key = (database_name, collection)
+            self.__pending[key] = retry_writes + self.__pending.get(key, [])
+            self.__pending_count += len(retry_writes)
+
+        self.metrics["retried_documents"] += len(retry_writes)
+        self.metrics["failed_documents"] += dropped
+
+        self.logger.error(
+            f"Failed to flush {len(failed_writes)} buffered writes to '{database_name}.{collection}', " \
+                f"{len(retry_writes)} will be retried on the next flush and {dropped} were dropped! Error: {error}"
+        )
+
+    async def close(self) -> None:
+        """Stops the flush timer and flushes everything left in the buffer."""
+        if self.__flusher is not None:
+            self.__flusher.cancel()
+            self.__flusher = None
+
+        await self.flush()
+
+    async def __flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
@@ -6,9 +6,9 @@ if TYPE_CHECKING:
     from discord_typings.gateway import GenericDispatchEvent
 
 import inspect
-from ... import errors, utils
+from ... import errors
 from ..objects.member import Member
-from ..extensions import extensions_cache
+from ..extensions import extensions_index
 from .. import get_goldy_instance, goldy_bot_logger
 from ..objects.platter.golden_platter import GoldPlatter
 
@@ -58,9 +58,20 @@ def event(
 
             goldy_bot_logger.info(f"Registering event '{event_name}' on '{func.__name__}' function...")
 
+            extension_name = func.__qualname__.split(".")[0]
+            bound_extension = None
+
             async def event_callback(event):
-                extension_name = str(func).split(" ")[1].split(".")[0]
-                extension = utils.cache_lookup(extension_name, extensions_cache)[1]
+                nonlocal bound_extension
+                extension = bound_extension
+
+                # The extension is bound on the first event and looked up again once it's unloaded.
+                if extension is None or not extension.loaded:
+                    extension = extensions_index.get(extension_name)
+                    bound_extension = extension
+
+                    if extension is None:
+                        return False
 
                 logger = extension.logger
                 guild = goldy.guild_manager.get_guild(event["guild_id"])
@@ -77,7 +88,7 @@ def event(
                     if extension.is_disabled:
                         return False
 
-                    await guild.config_wrapper.update()
+                    await guild.config_wrapper.refresh()
 
                     if await guild.is_extension_allowed(extension) is False:
                         return False
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 from devgoldyutils import Colours, LoggerAdapter
-from typing import Tuple, List, TYPE_CHECKING
+from typing import Tuple, List, Dict, TYPE_CHECKING
 
 from ...goldy import get_goldy_instance
 from ... import goldy_bot_logger
@@ -11,11 +11,14 @@ if TYPE_CHECKING:
     from ... import Goldy
     from ..commands.command import Command
     from .extension_metadata import ExtensionMetadata
+    from ..database.indexes import DatabaseIndex
 
 extensions_cache: List[Tuple[str, Extension]] = []
 """
 This cache contains all the extensions that have been loaded and it's memory location to the class.
 """
+extensions_index: Dict[str, Extension] = {}
+"""The same loaded extensions keyed by name, use this to look an extension up."""
 
 class Extension():
     """
@@ -43,9 +46,14 @@ class Extension():
     .. _docs: https://goldybot.devgoldy.xyz/goldy.extensions.html#how-to-create-an-extension
     """
 
+    indexes: List[DatabaseIndex] = []
+    """Database indexes this extension's queries need. Goldy bot makes sure they exist on start up."""
+
     def __init__(self):
         """Tells Goldy Bot to Load this class as an extension."""
         self.goldy: Goldy = get_goldy_instance()
+        self.loaded = False
+        """Whether this extension is loaded. Commands and events that bound themselves to it look it up again once this goes False."""
 
         self.logger = LoggerAdapter(
             LoggerAdapter(goldy_bot_logger, prefix = "Extensions"), 
@@ -64,11 +72,15 @@ class Extension():
             self.logger.info(f"Not loading the extension '{self.name}' as it's ignored.")
             return False
 
+        self.goldy.database.add_indexes(*self.indexes)
+
         # Adding to cache and loading commands.
         # ---------------------------------------        
         extensions_cache.append(
             (self.name, self)
         )
+        extensions_index[self.name] = self
+        self.loaded = True
 
         self.logger.info("Extension initialized!")
 
@@ -121,10 +133,17 @@ class Extension():
         for command in self.commands:
             command.delete()
 
+        self.goldy.permission_system.clear_compiled_perms()
+
         extensions_cache.remove(
             (self.name, self)
         )
 
+        if extensions_index.get(self.name) is self:
+            del extensions_index[self.name]
+
+        self.loaded = False
+
         self.logger.debug(f"Extension '{self.name}' unloaded!")
 
         return None
\ No newline at end of file
@@ -22,7 +22,7 @@ from devgoldyutils import LoggerAdapter
 
 from ... import utils
 from ...paths import Paths
-from . import extensions_cache
+from . import extensions_index
 from .. import Goldy, GoldyBotError
 from .extension_metadata import ExtensionMetadata
 from ... import goldy_bot_logger, __version__ as framework_version
@@ -240,7 +240,7 @@ class ExtensionLoader():
     async def reload(self, extensions: List[Extension] = None) -> None:
         """Reloads each extension in this list. If extensions is kept none, goldy bot will reload all the extensions loaded itself."""
         if extensions is None:
-            extensions = [x[1] for x in extensions_cache]
+            extensions = list(extensions_index.values())
 
         loaded_paths = []
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import List, Tuple
+from typing import List, Tuple, Dict, Any
+
+from pymongo.read_preferences import read_pref_mode_from_name
 
 from ..config import Config
 from ..errors import GoldyBotError
@@ -74,6 +76,104 @@ class GoldyConfig(Config):
 
         return tuple_list
 
+    @property
+    def guild_members_intent(self) -> bool:
+        """
+        Returns whether goldy bot should ask discord for the privileged ``GUILD_MEMBERS`` intent. 
+        It has to be enabled for the bot in the developer portal, it keeps the guild member caches up to date with member events.
+        """
+        return self.get("goldy", "guild_members_intent", default = False, optional = True)
+
+    @property
+    def guild_config_ttl(self) -> float | None:
+        """
+        Returns how many seconds a guild's config is kept in memory before it's pulled from the database again. 
+        This is only used when MongoDB change streams are not available. None means it's never pulled again.
+        """
+        return self.get("goldy", "guilds", "config_ttl", default = 60, optional = True)
+
+    @property
+    def guild_setup_concurrency(self) -> int:
+        """Returns how many guilds goldy bot sets up at the same time on start up."""
+        return self.get("goldy", "guilds", "setup_concurrency", default = 10, optional = True)
+
+    @property
+    def command_sync_concurrency(self) -> int:
+        """Returns how many guilds goldy bot cleans up old application commands from at the same time on start up."""
+        return self.get("goldy", "commands", "sync_concurrency", default = 5, optional = True)
+
+    @property
+    def force_command_sync(self) -> bool:
+        """
+        Returns whether application commands should be uploaded to discord on every start up, even when they haven't changed. 
+        Turn this on for a start up if the commands on discord were changed outside of goldy bot.
+        """
+        return self.get("goldy", "commands", "force_sync", default = False, optional = True)
+
+    @property
+    def recipe_ttl(self) -> float | None:
+        """Returns how many seconds buttons and select menus stay invokable by default before expiring. None means they never expire."""
+        return self.get("goldy", "recipes", "ttl", default = 86400, optional = True)
+
+    @property
+    def max_registered_recipes(self) -> int | None:
+        """Returns the max amount of buttons and select menus that can be registered at once. The oldest get evicted past this. None means no limit."""
+        return self.get("goldy", "recipes", "max_registered", default = 10000, optional = True)
+
+    @property
+    def write_buffer_max_pending(self) -> int:
+        """Returns how many document updates the database write buffer holds before it's flushed early."""
+        return self.get("goldy", "database", "write_buffer", "max_pending", default = 500, optional = True)
+
+    @property
+    def write_buffer_flush_interval(self) -> float:
+        """Returns how many seconds the database write buffer waits between flushes."""
+        return self.get("goldy", "database", "write_buffer", "flush_interval", default = 2, optional = True)
+
+    @property
+    def write_buffer_max_attempts(self) -> int:
+        """Returns how many times a buffered database write is tried before it's dropped."""
+        return self.get("goldy", "database", "write_buffer", "max_attempts", default = 5, optional = True)
+
+    @property
+    def database_profile_slow_ms(self) -> int | None:
+        """Returns the amount of milliseconds a query has to take to be logged to MongoDB's profiler. None means profiling is left as is."""
+        return self.get("goldy", "database", "profile_slow_ms", optional = True)
+
+    @property
+    def database_rebuild_indexes(self) -> bool:
+        """Returns whether declared indexes that changed should be dropped and rebuilt at start up."""
+        return self.get("goldy", "database", "rebuild_indexes", default = False, optional = True)
+
+    @property
+    def database_client_options(self) -> Dict[str, Any]:
+        """
+        Returns the options from the ``database`` section of ``goldy.json`` that tune the database client, 
+        already mapped to their motor keyword arguments. Options that aren't set are left out.
+        """
+        options = {
+            "serverSelectionTimeoutMS": self.get("goldy", "database", "server_selection_timeout_ms", default = 2000, optional = True),
+            "maxPoolSize": self.get("goldy", "database", "max_pool_size", optional = True),
+            "minPoolSize": self.get("goldy", "database", "min_pool_size", optional = True),
+            "maxIdleTimeMS": self.get("goldy", "database", "max_idle_time_ms", optional = True),
+            "compressors": self.get("goldy", "database", "compressors", optional = True),
+            "readPreference": self.get("goldy", "database", "read_preference", optional = True),
+        }
+
+        if isinstance(options["compressors"], list):
+            options["compressors"] = ",".join(options["compressors"])
+
+        if options["readPreference"] is not None:
+            try:
+                read_pref_mode_from_name(options["readPreference"])
+            except ValueError:
+                raise GoldyBotError(
+                    f"'{options['readPreference']}' is not a valid database read_preference in goldy.json. " \
+                        "Use one of 'primary', 'primaryPreferred', 'secondary', 'secondaryPreferred' or 'nearest'."
+                )
+
+        return {option: value for option, value in options.items() if value is not None}
+
     @property
     def bot_dev(self) -> str:
         """The discord id of the bot developer. If none this will default to me (https://github.com/THEGOLDENPRO)."""
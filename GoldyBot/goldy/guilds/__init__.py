@@ -1,19 +1,26 @@
 from __future__ import annotations
 
-from typing import List, Tuple
+import time
+import asyncio
+from typing import List, Dict, Tuple, TYPE_CHECKING
 
 from nextcore.http import Route, NotFoundError
+from pymongo.errors import OperationFailure, PyMongoError, BulkWriteError
 from devgoldyutils import Colours
 
 from .. import nextcore_utils
-from .. import Goldy, LoggerAdapter, goldy_bot_logger
-from ... import utils, errors
+from .. import Goldy, LoggerAdapter, goldy_bot_logger, GUILD_MEMBERS_INTENT
+from ... import errors
 from ..database import DatabaseEnums
 
 from .guild import Guild
 
 import logging
 
+if TYPE_CHECKING:
+    from discord_typings import GuildMemberUpdateData, GuildMemberRemoveData
+    from ..database.wrappers.guild import GuildDBWrapper
+
 class GuildManager():
     def __init__(self, goldy: Goldy) -> None:
         self.goldy = goldy
@@ -24,54 +31,227 @@ class GuildManager():
             raise AllowedGuildsNotSpecified(self.logger)
         
         self.guilds: List[Tuple[str, Guild]] = []
+        """Every guild goldy bot operates in as ``(id, guild)`` tuples, in the order they are in goldy.json."""
+        self.__guild_index: Dict[str, Guild] = {}
+
+        self.prefix_table: Dict[str, Tuple[str, GuildDBWrapper]] = {}
+        """
+        The prefix and config wrapper of every guild that has it's config loaded, keyed by guild id. 
+        It's updated whenever a config is so the command listener can reject messages that aren't commands without awaiting anything.
+        """
+
+        self.config_ttl: float | None = goldy.config.guild_config_ttl
+        """Seconds a guild config stays in memory before it's pulled again when change streams are not available."""
+        self.watching_configs = False
+        """Whether guild configs are currently being kept up to date by a MongoDB change stream."""
+        self.__config_watcher: asyncio.Task | None = None
+
+        self.setup_concurrency: int = goldy.config.guild_setup_concurrency
+        """How many guilds are set up at the same time."""
+
+        # Keeping guild member caches up to date. (These events are only received with the GUILD_MEMBERS intent)
+        if goldy.intents & GUILD_MEMBERS_INTENT:
+            goldy.shard_manager.event_dispatcher.add_listener(self.on_member_update, event_name = "GUILD_MEMBER_UPDATE")
+            goldy.shard_manager.event_dispatcher.add_listener(self.on_member_remove, event_name = "GUILD_MEMBER_REMOVE")
 
     async def setup(self):
         """Adds guilds specified in goldy.json to the database if not already added."""
         self.logger.info("Setting up guilds...")
+        start_time = time.perf_counter()
 
-        for guild_id, guild_code_name in self.allowed_guilds:
+        # Nextcore queues these requests by their rate limit buckets, the semaphore just keeps us from flooding it.
+        semaphore = asyncio.Semaphore(self.setup_concurrency)
 
-            # Getting guild discord data
-            # ---------------------------
-            try:
-                guild_data = await nextcore_utils.get_guild_data(guild_id, self.goldy)
-            except NotFoundError:
-                raise GuildNotFound(
-                    guild_code_name, self.logger
+        async def setup_guild(guild_id: str, guild_code_name: str) -> Tuple[Guild, float]:
+            async with semaphore:
+                guild_start_time = time.perf_counter()
+
+                # Getting guild discord data
+                # ---------------------------
+                try:
+                    guild_data = await nextcore_utils.get_guild_data(guild_id, self.goldy)
+                except NotFoundError:
+                    raise GuildNotFound(
+                        guild_code_name, self.logger
+                    )
+
+                guild = Guild(
+                    id = guild_id, 
+                    code_name = guild_code_name, 
+                    data = guild_data, 
+                    goldy = self.goldy
                 )
 
-            guild = Guild(
-                id = guild_id, 
-                code_name = guild_code_name, 
-                data = guild_data, 
-                goldy = self.goldy
-            )
+                setup_time = time.perf_counter() - guild_start_time
+                self.logger.debug(f"Guild '{guild.code_name}' set up in {setup_time * 1000:.0f}ms.")
+
+                return guild, setup_time
+
+        results = await asyncio.gather(
+            *[setup_guild(guild_id, guild_code_name) for guild_id, guild_code_name in self.allowed_guilds]
+        )
+
+        await self.load_configs([guild for guild, _ in results])
+
+        # Add guilds to list. (in the order they are in goldy.json)
+        # -----------------------------------------------------------
+        for guild, _ in results:
+            self.add_guild(guild)
 
-            await guild.config_wrapper.update() # This should update the guild's config data which should also generate itself configuration in the database if it's missing.
+        report = f"Done setting up {len(results)} guilds in {time.perf_counter() - start_time:.2f}s"
 
-            # Add guild to list.
-            # --------------------
-            self.guilds.append(
-                (guild_id, guild)
+        if len(results) > 0:
+            slowest_guild, slowest_time = max(results, key = lambda result: result[1])
+            report += f" (slowest was '{slowest_guild.code_name}' at {slowest_time * 1000:.0f}ms)"
+
+        self.logger.info(report + ".")
+
+        if self.__config_watcher is None:
+            backend = self.goldy.database.backend
+
+            if backend.supports_change_streams:
+                self.__config_watcher = self.goldy.async_loop.create_task(self.__watch_configs())
+            else:
+                self.logger.info(
+                    f"The {backend.name} database backend doesn't support change streams so guild configs will be refreshed every '{self.config_ttl}' seconds instead."
+                )
+
+
+    async def load_configs(self, guilds: List[Guild]) -> None:
+        """
+        Loads the configs of all these guilds with one query and creates the missing ones from the template with one bulk insert. 
+        This is a lot quicker than calling ``guild.config_wrapper.update()`` on each guild.
+        """
+        if len(guilds) == 0:
+            return None
+
+        start_time = time.perf_counter()
+        database = self.goldy.database.get_goldy_database(DatabaseEnums.GOLDY_MAIN)
+
+        guild_ids = [guild.id for guild in guilds]
+
+        guild_configs = {
+            guild_config["_id"]: guild_config for guild_config in await database.find(
+                "guild_configs", query = {"_id": {"$in": guild_ids}}, key = "_id", max_to_find = len(guild_ids)
             )
+        }
+
+        missing_guilds = [guild for guild in guilds if guild.id not in guild_configs]
 
-            self.logger.debug(f"Guild '{guild.code_name}' set up.")
+        for guild in missing_guilds:
+            guild_configs[guild.id] = guild.config_wrapper.new_config()
+
+        failed_ids = set()
+
+        if len(missing_guilds) > 0:
+            try:
+                await database.insert_many("guild_configs", [guild_configs[guild.id] for guild in missing_guilds])
+            except BulkWriteError as e:
+                # Another process most likely created some of these configs in the meantime.
+                failed_ids = {missing_guilds[error["index"]].id for error in e.details.get("writeErrors", [])}
+                self.logger.warning(f"Failed to create {len(failed_ids)} guild configs, they will be pulled from the database again on use.")
 
-        self.logger.info("Done setting up guilds.")
+        for guild in guilds:
+            guild.config_wrapper.set_data(guild_configs[guild.id])
 
+            if guild.id in failed_ids:
+                guild.config_wrapper.expire()
+
+        self.logger.debug(
+            f"Loaded {len(guilds)} guild configs ({len(missing_guilds)} created) in {(time.perf_counter() - start_time) * 1000:.0f}ms."
+        )
+
+    def stop_watching_configs(self) -> None:
+        """Cancels the guild configs change stream. Goldy bot does this when it stops."""
+        if self.__config_watcher is not None:
+            self.__config_watcher.cancel()
+            self.__config_watcher = None
+
+        self.watching_configs = False
+
+    def update_prefix(self, config_wrapper: GuildDBWrapper) -> None:
+        """Updates the guild's entry in the prefix table. This is called by the config wrapper every time it gets new data."""
+        self.prefix_table[config_wrapper.guild.id] = (config_wrapper.prefix, config_wrapper)
+
+    def add_guild(self, guild: Guild) -> None:
+        """Adds a guild to the guilds goldy bot operates in. This is usually done internally by :py:meth:`setup`."""
+        self.guilds.append((guild.id, guild))
+        self.__guild_index[str(guild.id)] = guild
+
+    def clear(self) -> None:
+        """Forgets every guild, run :py:meth:`setup` to set them up again."""
+        self.guilds.clear()
+        self.__guild_index.clear()
+        self.prefix_table.clear()
 
     def get_guild(self, guild_id: str | int) -> Guild | None:
         """Finds and returns goldy bot guild by id."""
-        cache_tuple = utils.cache_lookup(
-            key=guild_id,
-            cache=self.guilds
-        )
+        return self.__guild_index.get(str(guild_id))
 
-        if cache_tuple is None:
-            return None
+    async def on_member_update(self, data: GuildMemberUpdateData) -> None:
+        guild = self.get_guild(data["guild_id"])
+
+        if guild is not None:
+            guild.member_cache.set(data["user"]["id"], data)
+
+    async def on_member_remove(self, data: GuildMemberRemoveData) -> None:
+        guild = self.get_guild(data["guild_id"])
+
+        if guild is not None:
+            guild.member_cache.pop(data["user"]["id"])
+
+    async def __watch_configs(self) -> None:
+        """Keeps the guild configs held in memory up to date by watching the database for changes. Falls back to the config ttl when change streams are not supported."""
+        database = self.goldy.database.get_goldy_database(DatabaseEnums.GOLDY_MAIN)
+        reconnecting = False
+
+        while True:
+            try:
+                async with database.watch("guild_configs", full_document = "updateLookup") as change_stream:
+                    # This starts the change stream so we know it's supported before trusting it.
+                    change = await change_stream.try_next()
+
+                    # Changes could have been missed while we weren't watching.
+                    if reconnecting:
+                        for _, guild in self.guilds:
+                            guild.config_wrapper.expire()
+
+                    self.watching_configs = True
+                    self.logger.info("Watching guild configs for changes.")
+
+                    if change is not None:
+                        self.__on_config_change(change)
+
+                    async for change in change_stream:
+                        self.__on_config_change(change)
+
+            except OperationFailure as e:
+                self.watching_configs = False
+                self.logger.info(
+                    f"Change streams are not supported by this database so guild configs will be refreshed every '{self.config_ttl}' seconds instead. ({e})"
+                )
+                return
+
+            except PyMongoError as e:
+                self.watching_configs = False
+                self.logger.warning(f"Lost the guild configs change stream, we'll try watching again in 30 seconds. ({e})")
+
+            reconnecting = True
+            await asyncio.sleep(30)
+
+    def __on_config_change(self, change: dict) -> None:
+        guild = self.get_guild(change["documentKey"]["_id"])
+
+        if guild is None:
+            return
+
+        if change["operationType"] in ["insert", "update", "replace"] and change.get("fullDocument") is not None:
+            guild.config_wrapper.set_data(change["fullDocument"])
+            self.logger.debug(f"Guild config of '{guild.code_name}' was changed in the database so we've updated it.")
+
+        elif change["operationType"] == "delete":
+            guild.config_wrapper.expire()
 
-        return cache_tuple[1]
-            
 
 # Exceptions
 # ------------
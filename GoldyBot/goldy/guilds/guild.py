@@ -1,16 +1,24 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, Tuple
 from discord_typings import GuildData
 
 from devgoldyutils import DictClass, LoggerAdapter, Colours
 
 from ... import goldy_bot_logger
+from ...utils import LRUCache
 from ..database.wrappers.guild import GuildDBWrapper
 
 if TYPE_CHECKING:
     from ... import Extension
     from .. import Goldy, objects
+    from ..commands.command import Command
+    from ..permission_system import CompiledPerms
+
+MEMBER_CACHE_SIZE = 1000
+MEMBER_CACHE_TTL = 300
+PERMISSION_MEMBER_DATA_MAX_AGE = 10
+"""Seconds cached member data can be used for permission checks, so a removed role stops granting perms quickly."""
 
 class Guild(DictClass):
     """A goldy bot guild class."""
@@ -29,13 +37,21 @@ class Guild(DictClass):
 
         self.config_wrapper = GuildDBWrapper(self)
 
+        self._compiled_perms: Dict[Command, Tuple[Tuple[int, str | None], CompiledPerms]] = {}
+        """Cache of command perms compiled against this guild's config, this is managed by the permission system."""
+
+        self.member_cache = LRUCache(max_size = MEMBER_CACHE_SIZE, ttl = MEMBER_CACHE_TTL)
+        """
+        Guild member data (:py:meth:`~discord_typings.GuildMemberData`) keyed by user id. 
+        It's fed by interactions, messages and member gateway events so member roles rarely need to be requested from discord.
+        """
+
         super().__init__(self.logger)
 
     @property
     async def config(self) -> GuildDBWrapper:
-        """Returns the guild's database wrapper for it's configuration."""
-        if self.config_wrapper.data == {}:
-            await self.config_wrapper.update()
+        """Returns the guild's database wrapper for it's configuration. The config is only pulled from the database if it has gone stale."""
+        await self.config_wrapper.refresh()
 
         return self.config_wrapper
 
@@ -70,7 +86,7 @@ class Guild(DictClass):
                 return True
 
             if role is not None:
-                member_data = await platter.author.member_data
+                member_data = await platter.author.get_member_data(max_age = PERMISSION_MEMBER_DATA_MAX_AGE)
 
                 for role_id in member_data["roles"]:
                     if role == str(role_id):
@@ -46,7 +46,7 @@ class LiveConsoleApp(cmd2.Cmd):
 
         # Rerun guilds setup...
         # ----------------------
-        self.goldy.guild_manager.guilds.clear()
+        self.goldy.guild_manager.clear()
 
         self.goldy.async_loop.create_task(
             self.goldy.guild_manager.setup()
@@ -55,13 +55,36 @@ class LiveConsoleApp(cmd2.Cmd):
     def do_reload_configs(self, _: cmd2.Statement):
         self.goldy.config.__init__()
 
-        self.goldy.guild_manager.guilds.clear()
+        self.goldy.guild_manager.clear()
 
         self.logger.warning("Wait, we're reloading guilds... (This may halt the bot for a while!)")
         self.goldy.async_loop.create_task(
             self.goldy.guild_manager.setup()
         )
 
+    def do_migrate_member_data(self, _: cmd2.Statement):
+        from ..database.migrations import migrate_member_data
+
+        self.logger.warning("Migrating member data to the new layout in the background, the bot stays online while this runs.")
+        self.goldy.async_loop.create_task(
+            migrate_member_data(self.goldy.database)
+        )
+
+    def do_collscan_report(self, _: cmd2.Statement):
+        async def report():
+            collscans = await self.goldy.database.collscan_report()
+
+            if len(collscans) == 0:
+                self.logger.info("No collection scans were found in the slow query log.")
+
+            for stats in collscans:
+                self.logger.warning(
+                    f"'{stats['namespace']}' ran {stats['count']} slow collection scans taking {stats['total_ms']}ms in total " \
+                        f"(up to {stats['max_docs_examined']} documents examined). Example filter: {stats['example_filter']}"
+                )
+
+        self.goldy.async_loop.create_task(report())
+
     def do_quit(self, _: cmd2.Statement):
         self.logger.info("Exiting...")
         self.goldy.stop("Console master commanded me to stop!")
@@ -46,6 +46,8 @@ async def delete_msg(message: Message, reason: str=None) -> Message:
         headers = headers
     )
 
+    goldy.invokables.remove_message(message.data["id"])
+
     logger.debug(f"A message in the channel '{message.data['channel_id']}' was deleted with reason: {reason}")
 
     return message
\ No newline at end of file
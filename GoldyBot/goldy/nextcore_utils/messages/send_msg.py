@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import overload, List, TYPE_CHECKING, Dict
+from typing import overload, List, TYPE_CHECKING, Dict, Any
 from discord_typings import MessageReferenceData, InteractionMessageCallbackData, MessageData, InteractionCallbackData, ActionRowData
 from discord_typings.resources.channel import MessageBase
 
@@ -16,6 +16,27 @@ if TYPE_CHECKING:
     from ..files import File
     from ..embeds.embed import Embed
 
+def message_request_body(payload: dict, files: List[File] | None = None) -> Dict[str, Any]:
+    """
+    Returns the body keyword arguments for a message request. 
+    Multipart form data is only built when there are files to upload, otherwise the payload is sent as plain json.
+    """
+    if not files:
+        return {"json": payload}
+
+    form_data = FormData()
+
+    for file in files:
+        form_data.add_field(
+            file.name.split(".")[-2], file.contents, filename = file.name
+        )
+
+    form_data.add_field(
+        "payload_json", json_dumps(payload)
+    )
+
+    return {"data": form_data}
+
 @overload
 async def send_msg(
     platter: objects.GoldPlatter, 
@@ -159,7 +180,6 @@ async def send_msg(
     
     goldy = object.goldy
 
-    form_data = FormData()
     payload: MessageBase | InteractionMessageCallbackData = {}
 
     if text is not None:
@@ -177,6 +197,9 @@ async def send_msg(
             # Recipes need the command platter object for when checking if it was the author who invoked a recipe.
             recipe.command_platter = object 
 
+            if recipe.persistent:
+                recipe.pack_custom_id()
+
             if count / 5 == 0:
                 component_count += 1
                 components[component_count] = ActionRowData(type=1, components=[])
@@ -187,13 +210,6 @@ async def send_msg(
 
         payload["components"] = [components[component] for component in components]
 
-    # Adding files to form data.
-    if files is not None:
-        for file in files:
-            form_data.add_field(
-                file.name.split(".")[-2], file.contents, filename = file.name
-            )
-
     payload.update(extra)
 
     message_data: MessageData = None
@@ -211,16 +227,9 @@ async def send_msg(
             # ------------------
             if platter._interaction_responded is False:
 
-                form_data.add_field(
-                    "payload_json", json_dumps(
-                        {
-                            "type": 4, 
-                            "data": payload
-                        }
-                    )
-                )
-
-                await goldy.http_client.request(
+                # 'with_response' makes discord return the created message in the callback response 
+                # so we don't need to request the original interaction response afterwards.
+                r = await goldy.http_client.request(
                     Route(
                         "POST", 
                         "/interactions/{interaction_id}/{interaction_token}/callback", 
@@ -228,23 +237,13 @@ async def send_msg(
                         interaction_token = platter.data["token"]
                     ),
                     rate_limit_key = goldy.nc_authentication.rate_limit_key,
-                    data = form_data
+                    params = {"with_response": "true"},
+                    **message_request_body({"type": 4, "data": payload}, files)
                 )
 
                 platter._interaction_responded = True
 
-                # Get and return message data of original interaction response. 
-                r = await goldy.http_client.request(
-                    Route(
-                        "GET", 
-                        "/webhooks/{application_id}/{interaction_token}/messages/@original", 
-                        application_id = goldy.application_data["id"], 
-                        interaction_token = platter.data["token"]
-                    ),
-                    rate_limit_key = goldy.nc_authentication.rate_limit_key
-                )
-
-                message_data = await r.json()
+                message_data = (await r.json())["resource"]["message"]
 
                 platter.logger.debug("Interaction callback message was sent.")
 
@@ -254,10 +253,6 @@ async def send_msg(
             # Is sent when you want to respond again after sending the original response to an interaction command.
             else:
 
-                form_data.add_field(
-                    "payload_json", json_dumps(payload)
-                )
-
                 r = await goldy.http_client.request(
                     Route(
                         "POST", 
@@ -266,7 +261,7 @@ async def send_msg(
                         interaction_token = platter.data["token"]
                     ),
                     rate_limit_key = goldy.nc_authentication.rate_limit_key,
-                    data = form_data
+                    **message_request_body(payload, files)
                 )
 
                 message_data = await r.json()
@@ -286,19 +281,15 @@ async def send_msg(
                     guild_id = platter.data["guild_id"]
                 )
 
-            form_data.add_field(
-                "payload_json", json_dumps(payload)
-            )
-
             r = await goldy.http_client.request(
                 Route(
                     "POST", 
                     "/channels/{channel_id}/messages", 
                     channel_id = platter.data['channel_id']
                 ),
-                data = form_data,
                 rate_limit_key = goldy.nc_authentication.rate_limit_key,
                 headers = goldy.nc_authentication.headers,
+                **message_request_body(payload, files)
             )
 
             message_data = await r.json()
@@ -310,19 +301,15 @@ async def send_msg(
     if isinstance(object, objects.Channel):
         channel: objects.Channel = object
 
-        form_data.add_field(
-            "payload_json", json_dumps(payload)
-        )
-
         r = await goldy.http_client.request(
             Route(
                 "POST", 
                 "/channels/{channel_id}/messages", 
                 channel_id = channel.id
             ),
-            data = form_data,
             rate_limit_key = goldy.nc_authentication.rate_limit_key,
             headers = goldy.nc_authentication.headers,
+            **message_request_body(payload, files)
         )
 
         message_data = await r.json()
@@ -332,6 +319,10 @@ async def send_msg(
 
     message = objects.Message(message_data, object.guild, goldy)
 
+    if recipes is not None:
+        # So the recipes get cleaned up when this message is deleted.
+        goldy.invokables.link_message(message.data["id"], recipes)
+
     # TODO: Find a way to also delete the author's prefix command message.
     if delete_after is not None:
         utils.delay(
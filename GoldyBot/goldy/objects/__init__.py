@@ -2,6 +2,7 @@ from .message import Message
 from .member import Member
 from .channel import Channel
 from .invokable import Invokable
+from .invokable_registry import InvokableRegistry, InvokableTypes
 from .platter import Platter
 from .platter.golden_platter import GoldPlatter
 
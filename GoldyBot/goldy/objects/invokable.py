@@ -10,11 +10,15 @@ if TYPE_CHECKING:
     from typing import Callable, Any
     from ..commands.command import Command
     from .platter.golden_platter import GoldPlatter
+    from .invokable_registry import InvokableTypes
 
     INVOKABLE_TYPES = Union[Command, Recipe]
 
 class Invokable(ABC, dict):
     """A hybrid abstract class that is inherited from every goldy bot object that can be invoked from discord, like a command, a button or on-message event."""
+    invokable_type: InvokableTypes
+    """The registry namespace this type of invokable gets registered under."""
+
     def __init__(
         self,
         name: str,
@@ -51,10 +55,10 @@ class Invokable(ABC, dict):
         """The name of the invokable. This is used in log messages and more."""
         return self.__name
 
-    def register(self, id: str) -> None:
-        """Method to register this as an invokable."""
+    def register(self, id: str, ttl: float | None = None) -> None:
+        """Method to register this as an invokable. If a ``ttl`` is given the invokable expires after that many seconds."""
         self.__id = id
-        self.goldy.invokables.add((id, self))
+        self.goldy.invokables.add(self.invokable_type, id, self, ttl = ttl)
 
         if self in self.goldy.pre_invokables:
             self.goldy.pre_invokables.remove(self)
@@ -63,9 +67,7 @@ class Invokable(ABC, dict):
 
     def unregister(self) -> None:
         """Deletes and removes this invokable from the registration list, making it no longer invokable."""
-        self.goldy.invokables.remove(
-            (self.id, self)
-        )
+        self.goldy.invokables.remove(self.invokable_type, self.id)
 
         self.logger.debug(
             f"Invokable '{self.name}' has been unregistered!"
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import time
+import heapq
+import asyncio
+import itertools
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, Iterator, Tuple, List, Set, Callable
+
+from devgoldyutils import LoggerAdapter
+
+from ... import goldy_bot_logger
+
+if TYPE_CHECKING:
+    from .invokable import INVOKABLE_TYPES
+
+__all__ = ("InvokableTypes", "InvokableRegistry")
+
+logger = LoggerAdapter(goldy_bot_logger, prefix="InvokableRegistry")
+
+class InvokableTypes(Enum):
+    """The namespaces invokables get registered under. Each namespace is it's own separate index."""
+    SLASH_COMMAND = "slash_command"
+    """Keyed by the interaction command id (``command_id`` or ``guild_id:command_id`` for guild commands)."""
+    PREFIX_COMMAND = "prefix_command"
+    """Keyed by the prefix command's name."""
+    RECIPE = "recipe"
+    """Keyed by the message component's ``custom_id``."""
+
+class InvokableRegistry():
+    """
+    An indexed registry of every invokable registered in goldy bot.
+
+    Lookups are constant time no matter how many commands, buttons or select menus are registered.
+    Invokables can also be registered with a ttl and are evicted by :py:meth:`~GoldyBot.goldy.objects.invokable_registry.InvokableRegistry.sweep` once expired.
+    """
+    def __init__(self, max_recipes: int | None = None, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_recipes = max_recipes
+        """The max amount of recipes that can be registered at once, the oldest recipe is evicted when exceeded. None means no limit."""
+
+        self.__clock = clock
+        self.__namespaces: Dict[InvokableTypes, Dict[str, INVOKABLE_TYPES]] = {
+            type: {} for type in InvokableTypes
+        }
+
+        self.__expiries: List[Tuple[float, int, InvokableTypes, str, INVOKABLE_TYPES]] = []
+        self.__expiry_counter = itertools.count()
+
+        self.__message_invokables: Dict[str, Set[Tuple[InvokableTypes, str]]] = {}
+        self.__invokable_messages: Dict[Tuple[InvokableTypes, str], str] = {}
+
+    def __len__(self) -> int:
+        return sum(len(namespace) for namespace in self.__namespaces.values())
+
+    def __iter__(self) -> Iterator[Tuple[str, INVOKABLE_TYPES]]:
+        """Iterates over all registered invokables as ``(id, invokable)`` tuples."""
+        for namespace in self.__namespaces.values():
+            yield from list(namespace.items())
+
+    def __contains__(self, item: Tuple[str, INVOKABLE_TYPES]) -> bool:
+        id, invokable = item
+        return self.__namespaces[invokable.invokable_type].get(id) is invokable
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Returns the size of every index held by the registry. Useful for keeping an eye on memory usage."""
+        stats = {type.value: len(namespace) for type, namespace in self.__namespaces.items()}
+
+        stats["pending_expiries"] = len(self.__expiries)
+        stats["linked_messages"] = len(self.__message_invokables)
+
+        return stats
+
+    def add(self, type: InvokableTypes, id: str, invokable: INVOKABLE_TYPES, ttl: float | None = None) -> None:
+        """Adds an invokable to the registry under that namespace. If a ttl is given the invokable will be evicted after that many seconds."""
+        namespace = self.__namespaces[type]
+
+        namespace.pop(id, None) # Re-adding moves the invokable to the back of the eviction order.
+        namespace[id] = invokable
+
+        if ttl is not None:
+            heapq.heappush(
+                self.__expiries, (self.__clock() + ttl, next(self.__expiry_counter), type, id, invokable)
+            )
+
+        if type == InvokableTypes.RECIPE and self.max_recipes is not None:
+
+            while len(namespace) > self.max_recipes:
+                oldest_id = next(iter(namespace))
+                self.remove(type, oldest_id)
+
+                logger.debug(f"Evicted the recipe '{oldest_id}' as the max of {self.max_recipes} registered recipes was reached.")
+
+    def remove(self, type: InvokableTypes, id: str) -> INVOKABLE_TYPES | None:
+        """Removes and returns the invokable registered with that id. Returns None if nothing was registered."""
+        invokable = self.__namespaces[type].pop(id, None)
+
+        message_id = self.__invokable_messages.pop((type, id), None)
+
+        if message_id is not None:
+            message_invokables = self.__message_invokables[message_id]
+            message_invokables.discard((type, id))
+
+            if len(message_invokables) == 0:
+                del self.__message_invokables[message_id]
+
+        return invokable
+
+    def get(self, type: InvokableTypes, id: str) -> INVOKABLE_TYPES | None:
+        """Returns the invokable registered with that id in that namespace or None if it doesn't exist."""
+        return self.__namespaces[type].get(id)
+
+    def count(self, type: InvokableTypes) -> int:
+        """Returns how many invokables are registered in that namespace."""
+        return len(self.__namespaces[type])
+
+    def link_message(self, message_id: str, invokables: List[INVOKABLE_TYPES]) -> None:
+        """Links registered invokables (like the recipes of a message) to a message so they are removed when that message is deleted."""
+        for invokable in invokables:
+            key = (invokable.invokable_type, invokable.id)
+
+            if invokable.id is None or self.__namespaces[key[0]].get(key[1]) is not invokable:
+                continue
+
+            self.__invokable_messages[key] = message_id
+            self.__message_invokables.setdefault(message_id, set()).add(key)
+
+    def remove_message(self, message_id: str) -> int:
+        """Removes all invokables linked to that message. Returns how many were removed."""
+        keys = self.__message_invokables.get(message_id, set()).copy()
+
+        for type, id in keys:
+            self.remove(type, id)
+
+        return len(keys)
+
+    def sweep(self) -> int:
+        """Removes every invokable that has expired. Returns how many were removed."""
+        now = self.__clock()
+        removed = 0
+
+        while self.__expiries and self.__expiries[0][0] <= now:
+            _, _, type, id, invokable = heapq.heappop(self.__expiries)
+
+            if self.__namespaces[type].get(id) is invokable:
+                self.remove(type, id)
+                removed += 1
+
+        # Drop expiry entries of invokables that were removed before expiring so they don't pile up.
+        if len(self.__expiries) > 2 * len(self) + 64:
+            self.__expiries = [
+                entry for entry in self.__expiries if self.__namespaces[entry[2]].get(entry[3]) is entry[4]
+            ]
+            heapq.heapify(self.__expiries)
+
+        return removed
+
+    async def run_sweeper(self, interval: float = 30) -> None:
+        """Sweeps expired invokables every ``interval`` seconds forever."""
+        while True:
+            await asyncio.sleep(interval)
+
+            removed = self.sweep()
+
+            if removed > 0:
+                logger.debug(f"Swept {removed} expired invokables. {self.stats}")
@@ -64,6 +64,17 @@ class Member(DictClass):
 
     @property
     async def member_data(self) -> GuildMemberData:
+        """The member's guild data like their roles. This is taken from the guild's member cache when possible."""
+        return await self.get_member_data()
+
+    async def get_member_data(self, max_age: float | None = None) -> GuildMemberData:
+        """
+        Returns the member's guild data like their roles, taken from the guild's member cache when possible. 
+        Pass ``max_age`` to request it from discord when the cached data is older than that many seconds, permission checks do this.
+        """
+        if self.guild_member_data is None or max_age is not None:
+            self.guild_member_data = self.guild.member_cache.get(self.id, max_age = max_age)
+
         if self.guild_member_data is None:
             r = await self.goldy.http_client.request(
                 Route(
@@ -77,5 +88,6 @@ class Member(DictClass):
             )
 
             self.guild_member_data = await r.json()
+            self.guild.member_cache.set(self.id, self.guild_member_data)
 
         return self.guild_member_data
\ No newline at end of file
@@ -1,17 +1,30 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, FrozenSet
 from discord_typings import GuildMemberData
 
-from nextcore.http import Route
+from dataclasses import dataclass
 from devgoldyutils import LoggerAdapter, Colours
 
 from .perms import Perms
+from .guilds.guild import PERMISSION_MEMBER_DATA_MAX_AGE
 from .. import goldy_bot_logger
 
 if TYPE_CHECKING:
     from . import Goldy
+    from .guilds import Guild
+    from .commands.command import Command
     from .objects.platter.golden_platter import GoldPlatter
 
+@dataclass(frozen = True)
+class CompiledPerms():
+    """A command's required perms compiled against a guild's config."""
+    member_ids: FrozenSet[str]
+    """Ids of members that are always allowed to run the command, e.g. the bot dev and guild owner."""
+    role_ids: FrozenSet[str]
+    """Ids of the roles that allow a member to run the command."""
+    missing_roles: FrozenSet[str] = frozenset()
+    """Required roles the guild hasn't configured. While there are any, only ``member_ids`` can run the command."""
+
 class PermissionSystem():
     """A goldy bot class that contains methods to handle member/command permissions."""
     def __init__(self, goldy: Goldy) -> None:
@@ -19,65 +32,81 @@ class PermissionSystem():
 
         self.logger = LoggerAdapter(goldy_bot_logger, prefix=Colours.PURPLE.apply("PermissionSystem"))
 
+    def get_compiled_perms(self, command: Command, guild: Guild) -> CompiledPerms:
+        """Returns the command's required perms compiled against the guild's config. They are only compiled again when the guild's config or owner changes."""
+        # The guild owner perm depends on the owner so it's part of the cache key along with the config version.
+        cache_key = (guild.config_wrapper.version, guild.get("owner_id"))
+        cached = guild._compiled_perms.get(command)
+
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        member_ids = set()
+        role_ids = set()
+        missing_roles = set()
+
+        for perm in command.required_perms:
+
+            if perm == Perms.BOT_DEV:
+                member_ids.add(self.goldy.config.bot_dev)
+
+            # TODO: Add bot admin.
+
+            elif perm == Perms.GUILD_OWNER:
+                member_ids.add(guild.get("owner_id"))
+
+            elif not isinstance(perm, Perms):
+                role_id = guild.config_wrapper.roles.get(perm)
+
+                if role_id is None:
+                    # Maybe there is a better way of handling this but I'll leave this as temporary solution for now.
+                    self.logger.error(
+                        f"This guild ({guild.code_name}) hasn't been configured to include the required role '{perm}' you entered for the command '{command.name}'."
+                    )
+                    missing_roles.add(perm)
+                    continue
+
+                role_ids.add(str(role_id))
+
+        compiled_perms = CompiledPerms(frozenset(member_ids), frozenset(role_ids), frozenset(missing_roles))
+        guild._compiled_perms[command] = (cache_key, compiled_perms)
+
+        self.logger.debug(f"Compiled perms of '{command.name}' for the guild '{guild.code_name}'.")
+        return compiled_perms
+
+    def clear_compiled_perms(self) -> None:
+        """Forgets the compiled perms of every guild. Ran when an extension unloads so the perms of it's old command objects don't pile up."""
+        for _, guild in self.goldy.guild_manager.guilds:
+            guild._compiled_perms.clear()
+
     async def got_perms(self, platter: GoldPlatter) -> bool: # TODO: I might rename this method.
         """Method that checks if the command author has the perms to run this command."""
         
         if not platter.invokable.required_perms == []:
             self.logger.debug("Checking if member has perms to run command...")
 
-            # If the required roles contain 'bot_dev' and the bot dev is running the command allow the command to execute.
-            # --------------------------------------------------------------------------------------------------------------
-            if Perms.BOT_DEV in platter.invokable.required_perms:
-                if platter.author.id == self.goldy.config.bot_dev:
-                    self.logger.debug("Member is a bot developer :)")
-                    return True
+            compiled_perms = self.get_compiled_perms(platter.invokable, platter.guild)
 
-            # TODO: Add bot admin.
+            # Bot dev and server owner check.
+            # --------------------------------
+            if platter.author.id in compiled_perms.member_ids:
+                self.logger.debug("Member is a bot developer or the server owner ✅")
+                return True
 
-            # Server owner check.
-            # --------------------
-            if Perms.GUILD_OWNER in platter.invokable.required_perms:
-                if platter.author.id == platter.guild.get("owner_id"):
-                    self.logger.debug("Member is server owner ✅")
-                    return True
+            # A misconfigured guild denies everyone else rather than ignoring the role.
+            if compiled_perms.missing_roles:
+                self.logger.info(f"The required roles {sorted(compiled_perms.missing_roles)} aren't configured in this guild, denying the author.")
+                return False
 
             # Check if member has any of the required roles.
             #----------------------------------------------------
+            if compiled_perms.role_ids:
+                # Get the member's guild data. (only requested from discord if it's not freshly in the guild's member cache)
+                member_data: GuildMemberData = await platter.author.get_member_data(max_age = PERMISSION_MEMBER_DATA_MAX_AGE)
 
-            # Get the member's guild data.
-            r = await self.goldy.http_client.request(
-                Route(
-                    "GET",
-                    "/guilds/{guild_id}/members/{user_id}",
-                    guild_id = platter.guild.id,
-                    user_id = platter.author.id
-                ),
-                rate_limit_key = self.goldy.nc_authentication.rate_limit_key,
-                headers = self.goldy.nc_authentication.headers,
-            )
-
-            member_data: GuildMemberData = await r.json()
-
-            for role_code_name in platter.invokable.required_perms:
-
-                if role_code_name not in Perms:
-                    try:
-                        role_id_uwu = platter.guild.config_wrapper.roles[role_code_name]
-                    except KeyError:
-                        # Maybe there is a better way of handling this but I'll leave this as temporary solution for now.
-                        self.logger.error(
-                            f"This guild ({platter.guild.code_name}) hasn't been configured to include the required role '{role_code_name}' you entered for the command '{platter.invokable.name}'."
-                        )
-                        return False
-
-                    # Loop through each role of the member and check if the role id is equal to that required.
-                    for member_role_id in member_data["roles"]:
-                        if str(member_role_id) == role_id_uwu:
-                            self.logger.debug(f"The author has the required role '{role_code_name}' :)")
-                            return True
-                    
-
-                    # TODO: Might be better to create a Role() object and add a .has_role() method to Member object.
+                if not compiled_perms.role_ids.isdisjoint(str(role_id) for role_id in member_data["roles"]):
+                    self.logger.debug("The author has one of the required roles :)")
+                    return True
 
             self.logger.info("The author has no perms to run this command.")
             return False
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from typing import Callable, Any, TYPE_CHECKING, Awaitable
 from discord_typings import ComponentData
 from devgoldyutils import LoggerAdapter, Colours
@@ -7,6 +8,7 @@ from devgoldyutils import LoggerAdapter, Colours
 from abc import abstractmethod
 from ... import goldy_bot_logger
 from ..objects.invokable import Invokable
+from ..objects.invokable_registry import InvokableTypes
 from ..objects.platter.golden_platter import GoldPlatter
 from ..nextcore_utils import front_end_errors
 
@@ -19,14 +21,43 @@ RECIPE_CALLBACK = Callable[[GoldPlatter], Any]
 
 class Recipe(Invokable):
     """A recipe is equivalent to an item or message component. This is inherited by all message components in Goldy Bot. This can be passed into a send_msg function."""
-    def __init__(self, data: ComponentData, name: str, callback: RECIPE_CALLBACK, author_only: bool = True) -> ComponentData:
+    invokable_type = InvokableTypes.RECIPE
+
+    def __init__(
+        self, 
+        data: ComponentData, 
+        name: str, 
+        callback: RECIPE_CALLBACK, 
+        author_only: bool = True, 
+        ttl: float = None, 
+        max_uses: int = None, 
+        persistent: bool = False, 
+        **callback_args
+    ) -> ComponentData:
         """
         Creates an component in discord to use in action rows. 😋
+
+        The recipe stops being invokable after ``ttl`` seconds (defaults to ``goldy.recipes.ttl`` in goldy.json, 
+        pass ``math.inf`` to never expire) or after it has been used ``max_uses`` times.
+
+        Persistent recipes are never registered, instead the callback and it's args are packed into the custom_id 
+        so they keep working after restarts. The callback has to be decorated with ``@GoldyBot.recipe_handler()``.
         """
         self.callback = callback
         """The function to be executed on recipe interaction."""
+        self.callback_args = callback_args
+        """Extra keyword arguments passed to the callback."""
         self.author_only = author_only
 
+        self.ttl = ttl
+        """How many seconds this recipe stays invokable after it's registered."""
+        self.max_uses = max_uses
+        """How many times this recipe can be invoked before it's unregistered. None means unlimited."""
+        self.uses = 0
+
+        self.persistent = persistent
+        """Whether this recipe is stored in it's custom_id instead of the registry."""
+
         self.logger = LoggerAdapter(
             logger = LoggerAdapter(goldy_bot_logger, prefix = self.__class__.__name__),
             prefix = Colours.PINK_GREY.apply(name)
@@ -42,18 +73,53 @@ class Recipe(Invokable):
             data = data,
             callable = callback,
             goldy = get_goldy_instance(),
-            logger = self.logger 
+            logger = self.logger, 
+            pre_register = False # Recipes are registered straight away by their subclasses.
+        )
+
+        if self.ttl is None:
+            self.ttl = self.goldy.config.recipe_ttl
+
+    def register(self, id: str) -> None:
+        ttl = self.ttl
+
+        if ttl == math.inf:
+            ttl = None
+
+        return super().register(id, ttl = ttl)
+
+    @property
+    def author_id(self) -> str | None:
+        """The id of the member who sent the command this recipe is attached to."""
+        return self.command_platter.author.id
+
+    def pack_custom_id(self) -> str:
+        """Packs this persistent recipe into it's custom_id. This is usually used internally when the recipe is sent."""
+        from .persistent import encode_custom_id
+
+        self["custom_id"] = encode_custom_id(
+            callback = self.callback, 
+            author_id = self.author_id if self.author_only else None, 
+            multiple_values = self.get("max_values", 1) > 1, 
+            callback_args = self.callback_args
         )
 
+        return self["custom_id"]
+
     @abstractmethod
     async def invoke(self, platter: objects.GoldPlatter, lambda_func: Callable[..., Awaitable]) -> Any:
         """Runs/triggers this recipe. This method is usually used internally."""
         self.logger.debug(f"Attempting to invoke '{self.__class__.__name__}'...")
 
         if self.author_only:
-            if not platter.author.id == platter.invokable.command_platter.author.id:
+            if not platter.author.id == self.author_id:
                 raise front_end_errors.OnlyAuthorCanInvokeRecipe(platter, self.logger)
 
+        self.uses += 1
+
+        if self.max_uses is not None and self.uses >= self.max_uses:
+            self.unregister()
+
         try:
             return await lambda_func()
 
@@ -72,6 +72,9 @@ class Button(Recipe):
         emoji: str = None, 
         author_only: bool = True, 
         custom_id: str = None, 
+        ttl: float = None, 
+        max_uses: int = None, 
+        persistent: bool = False, 
         **callback_args
     ) -> ButtonComponentData:
         ...
@@ -96,6 +99,9 @@ class Button(Recipe):
         emoji: str = None, 
         author_only: bool = True, 
         callback: RECIPE_CALLBACK = None, 
+        ttl: float = None, 
+        max_uses: int = None, 
+        persistent: bool = False, 
         **callback_args
     ) -> ButtonComponentData:
         """
@@ -138,13 +144,16 @@ class Button(Recipe):
             name = data["label"],
             callback = callback,
             author_only = author_only, 
+            ttl = ttl, 
+            max_uses = max_uses, 
+            persistent = persistent, 
             **callback_args
         )
 
-        if not style == ButtonStyle.LINK.value:
+        if not style == ButtonStyle.LINK.value and not persistent:
             self.register(custom_id)
 
     async def invoke(self, platter: GoldPlatter) -> Any:
         return await super().invoke(
-            platter, lambda: self.callback(platter)
+            platter, lambda: self.callback(platter, **self.callback_args)
         )
\ No newline at end of file
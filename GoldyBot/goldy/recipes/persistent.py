@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import json
+import hashlib
+from typing import TYPE_CHECKING, Callable, Dict, Any, Tuple
+
+from . import Recipe
+from ...errors import GoldyBotError
+from ..nextcore_utils import front_end_errors
+from ..extensions import extensions_index
+
+if TYPE_CHECKING:
+    from typing import List
+    from ..objects.platter.golden_platter import GoldPlatter
+
+__all__ = ("recipe_handler", "PersistentRecipe")
+
+PERSISTENT_PREFIX = "gb~"
+"""Every persistent recipe's custom_id starts with this."""
+MAX_CUSTOM_ID_LENGTH = 100
+
+persistent_handlers: Dict[str, Callable] = {}
+"""
+The static handler table persistent recipes are resolved through, keyed by handler id.
+"""
+handler_extensions: Dict[str, str | None] = {}
+"""The name of the extension each recipe handler belongs to, keyed by handler id. None for handlers that aren't methods."""
+
+def handler_id(func: Callable) -> str:
+    """Returns the short stable id a recipe handler is keyed under. This has to stay the same across restarts so it's built from the function's qualified name."""
+    func = getattr(func, "__func__", func)
+    return hashlib.blake2s(func.__qualname__.encode(), digest_size = 4).hexdigest()
+
+def extension_name_of(func: Callable) -> str | None:
+    """Returns the name of the class (extension) a method is defined in from it's qualified name, nested classes included."""
+    parts = func.__qualname__.split(".")
+
+    if len(parts) < 2 or parts[-2] == "<locals>":
+        return None
+
+    return parts[-2]
+
+def recipe_handler():
+    """
+    Marks a method as a persistent recipe handler so buttons and select menus with ``persistent = True`` can call it, even after a restart.
+
+    ---------------
+
+    ⭐ Example:
+    -------------
+    This is how you use a persistent button in goldy bot::
+
+        @GoldyBot.command()
+        async def nuke(self, platter: GoldyBot.GoldPlatter, city: str):
+            await platter.send_message(
+                f"Are you sure you would like to nuke **{city}**?",
+                recipes = [
+                    Button(ButtonStyle.GREEN, label="Yes", callback = self.nuke_city, persistent = True, city = city)
+                ]
+            )
+
+        @GoldyBot.recipe_handler()
+        async def nuke_city(self, platter: GoldyBot.GoldPlatter, city: str):
+            await platter.send_message(f"> 💣 You nuked {city}.", reply = True)
+
+    The callback args get stored in the button's custom_id so they must be json serializable and small (custom_ids are capped at 100 characters).
+
+    ⚠️ The command author's id is packed into the custom_id to keep other members from clicking the button, 
+    it's checked against the message's interaction when discord gives us one but don't treat it as a security boundary.
+    """
+    def decorate(func):
+        id = handler_id(func)
+        existing = persistent_handlers.get(id)
+
+        if existing is not None and existing.__qualname__ != func.__qualname__:
+            raise GoldyBotError(
+                f"The recipe handler '{func.__qualname__}' clashes with '{existing.__qualname__}'. Please rename one of them."
+            )
+
+        persistent_handlers[id] = func
+        handler_extensions[id] = extension_name_of(func)
+        return func
+
+    return decorate
+
+def encode_custom_id(callback: Callable, author_id: str | None, multiple_values: bool, callback_args: Dict[str, Any]) -> str:
+    """Packs a handler and it's callback args into a custom_id."""
+    id = handler_id(callback)
+
+    if id not in persistent_handlers:
+        raise GoldyBotError(
+            f"'{getattr(callback, '__qualname__', callback)}' is not a recipe handler so it can't be used by a persistent recipe. " \
+                "Decorate it with '@GoldyBot.recipe_handler()'."
+        )
+
+    custom_id = PERSISTENT_PREFIX + id + "~" + json.dumps(
+        [author_id, int(multiple_values), callback_args], separators = (",", ":")
+    )
+
+    if len(custom_id) > MAX_CUSTOM_ID_LENGTH:
+        raise GoldyBotError(
+            f"The callback args of this persistent recipe are too big to fit in a custom_id ({len(custom_id)}/{MAX_CUSTOM_ID_LENGTH} characters)."
+        )
+
+    return custom_id
+
+def decode_custom_id(custom_id: str) -> Tuple[str, str | None, bool, Dict[str, Any]] | None:
+    """Unpacks a persistent recipe's custom_id. Returns None if it isn't one."""
+    if not custom_id.startswith(PERSISTENT_PREFIX):
+        return None
+
+    try:
+        id, payload = custom_id[len(PERSISTENT_PREFIX):].split("~", 1)
+        decoded = json.loads(payload)
+    except (ValueError, TypeError):
+        return None
+
+    # Custom ids come from discord users so anything that isn't shaped like ours is ignored.
+    if not isinstance(decoded, list) or not len(decoded) == 3:
+        return None
+
+    author_id, multiple_values, callback_args = decoded
+
+    if not isinstance(callback_args, dict) or not (author_id is None or isinstance(author_id, str)):
+        return None
+
+    return id, author_id, bool(multiple_values), callback_args
+
+def interaction_author_id(interaction: dict) -> str | None:
+    """Returns the id of the member who ran the slash command the component's message responds to. None for messages that weren't a response to one."""
+    message = interaction.get("message", {})
+    metadata = message.get("interaction_metadata") or message.get("interaction")
+
+    if metadata is None:
+        return None
+
+    return metadata.get("user", {}).get("id")
+
+def resolve_handler(id: str) -> Callable | None:
+    """Returns the recipe handler with that id bound to it's extension. None if there's no such handler or it's extension isn't loaded anymore."""
+    func = persistent_handlers.get(id)
+
+    if func is None:
+        return None
+
+    extension_name = handler_extensions.get(id)
+
+    if extension_name is None:
+        return func
+
+    extension = extensions_index.get(extension_name)
+
+    if extension is None:
+        return None
+
+    return func.__get__(extension)
+
+
+class PersistentRecipe(Recipe):
+    """
+    A recipe rebuilt from a custom_id at dispatch time. Nothing is kept in memory per message,
+    the handler is looked up in the static handler table and bound to it's extension.
+    """
+    def __init__(self, custom_id: str, callback: Callable, author_id: str | None, multiple_values: bool, **callback_args):
+        self.__author_id = author_id
+        self.multiple_values = multiple_values
+
+        super().__init__(
+            data = {"custom_id": custom_id},
+            name = callback.__qualname__,
+            callback = callback,
+            author_only = author_id is not None,
+            persistent = True,
+            **callback_args
+        )
+
+    @classmethod
+    def from_custom_id(cls, custom_id: str) -> PersistentRecipe | None:
+        """Returns the persistent recipe packed in that custom_id or None if it's not one or it's handler no longer exists."""
+        decoded = decode_custom_id(custom_id)
+
+        if decoded is None:
+            return None
+
+        id, author_id, multiple_values, callback_args = decoded
+        callback = resolve_handler(id)
+
+        if callback is None:
+            return None
+
+        return cls(custom_id, callback, author_id, multiple_values, **callback_args)
+
+    @property
+    def author_id(self) -> str | None:
+        return self.__author_id
+
+    async def invoke(self, platter: GoldPlatter) -> Any:
+        if self.author_only:
+            # The author id came from the custom_id, so when discord tells us who ran the command we hold it to that as well.
+            command_author_id = interaction_author_id(platter.data)
+
+            if command_author_id is not None and not command_author_id == self.author_id:
+                raise front_end_errors.OnlyAuthorCanInvokeRecipe(platter, self.logger)
+
+        values: List[str] | None = platter.data["data"].get("values")
+
+        if values is None:
+            return await super().invoke(
+                platter, lambda: self.callback(platter, **self.callback_args)
+            )
+
+        if not self.multiple_values:
+            values = values[0]
+
+        return await super().invoke(
+            platter, lambda: self.callback(platter, values, **self.callback_args)
+        )
@@ -69,6 +69,9 @@ class SelectMenu(Recipe):
         min_values: Literal[1] = 1,
         max_values: Literal[1] = 1,
         author_only: bool = True, 
+        ttl: float = None, 
+        max_uses: int = None, 
+        persistent: bool = False, 
         **callback_args
     ):
         ...
@@ -82,6 +85,9 @@ class SelectMenu(Recipe):
         min_values: Literal[1] = 1,
         max_values: Literal[1] = 1,
         author_only: bool = True, 
+        ttl: float = None, 
+        max_uses: int = None, 
+        persistent: bool = False, 
         **callback_args
     ):
         ...
@@ -96,6 +102,9 @@ class SelectMenu(Recipe):
         min_values: int = 1,
         max_values: int = 1,
         author_only: bool = True, 
+        ttl: float = None, 
+        max_uses: int = None, 
+        persistent: bool = False, 
         **callback_args
     ):
         ...
@@ -109,6 +118,9 @@ class SelectMenu(Recipe):
         min_values: int = 1,
         max_values: int = 1,
         author_only: bool = True, 
+        ttl: float = None, 
+        max_uses: int = None, 
+        persistent: bool = False, 
         **callback_args
     ):
         ...
@@ -123,6 +135,9 @@ class SelectMenu(Recipe):
         max_values: int = 1,
         custom_id: str = None, 
         author_only: bool = True, 
+        ttl: float = None, 
+        max_uses: int = None, 
+        persistent: bool = False, 
         **callback_args
     ):
         if TYPE_CHECKING:
@@ -161,10 +176,15 @@ class SelectMenu(Recipe):
             data, 
             self.__class__.__name__, 
             callback,
-            author_only
+            author_only, 
+            ttl, 
+            max_uses, 
+            persistent, 
+            **callback_args
         )
 
-        self.register(custom_id)
+        if not persistent:
+            self.register(custom_id)
 
     async def invoke(self, platter: GoldPlatter) -> Any:
         data: ComponentInteractionData = platter.data
@@ -174,5 +194,5 @@ class SelectMenu(Recipe):
             values = data["data"]["values"]
 
         return await super().invoke(
-            platter, lambda: self.callback(platter, values)
+            platter, lambda: self.callback(platter, values, **self.callback_args)
         )
\ No newline at end of file
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import GoldyBot
-from GoldyBot import cache_lookup, Perms, info
-from GoldyBot.goldy.extensions import extensions_cache
+from GoldyBot import Perms, info
+from GoldyBot.goldy.extensions import extensions_index
 
 class GuildAdmin(GoldyBot.Extension):
     def __init__(self):
@@ -44,19 +44,29 @@ class GuildAdmin(GoldyBot.Extension):
             colour = GoldyBot.Colours.BROWN
         )
 
+        self.extension_not_found = GoldyBot.Embed(
+            title = "💔 Extension Not Found!",
+            description = "There's no loaded extension with that name.",
+            colour = GoldyBot.Colours.RED
+        )
+
     config = GoldyBot.GroupCommand("config", required_perms = [Perms.GUILD_OWNER], hidden = True)
 
     @config.sub_command(
         description = "🧰💚 A command for enabling a Goldy Bot extension in this guild.",
         slash_options = {
             "extension": GoldyBot.SlashOption(
-                choices = [GoldyBot.SlashOptionChoice(extension[0], extension[0]) for extension in extensions_cache]
+                choices = [GoldyBot.SlashOptionChoice(extension_name, extension_name) for extension_name in extensions_index]
             )
         }
     )
     async def enable_extension(self, platter: GoldyBot.GoldPlatter, extension: str):
         guild_config = await platter.guild.config
-        extension: GoldyBot.Extension = cache_lookup(extension, extensions_cache)[1]
+        extension: GoldyBot.Extension | None = extensions_index.get(extension)
+
+        if extension is None:
+            await platter.send_message(embeds = [self.extension_not_found], hide = True)
+            return
 
         is_allowed = await platter.guild.is_extension_allowed(extension)
 
@@ -91,13 +101,17 @@ class GuildAdmin(GoldyBot.Extension):
         description = "🧰❤️ A command for disabling a Goldy Bot extension in this guild.",
         slash_options = {
             "extension": GoldyBot.SlashOption(
-                choices = [GoldyBot.SlashOptionChoice(extension[0], extension[0]) for extension in extensions_cache]
+                choices = [GoldyBot.SlashOptionChoice(extension_name, extension_name) for extension_name in extensions_index]
             )
         }
     )
     async def disable_extension(self, platter: GoldyBot.GoldPlatter, extension: str):
         guild_config = await platter.guild.config
-        extension: GoldyBot.Extension = cache_lookup(extension, extensions_cache)[1]
+        extension: GoldyBot.Extension | None = extensions_index.get(extension)
+
+        if extension is None:
+            await platter.send_message(embeds = [self.extension_not_found], hide = True)
+            return
 
         is_allowed = await platter.guild.is_extension_allowed(extension)
 
@@ -1,4 +1,4 @@
-__all__ = ("update_dict",)
+__all__ = ("update_dict", "flatten_dict")
 
 def update_dict(d1: dict, d2: dict):
     """
@@ -20,4 +20,29 @@ def update_dict(d1: dict, d2: dict):
         else:
             d1_copy[key] = d2[key]
 
-    return d1_copy
\ No newline at end of file
+    return d1_copy
+
+def flatten_dict(d: dict, parent_key: str = "") -> dict:
+    """
+    Flattens nested dictionaries into dotted keys, e.g. ``{"a": {"b": 1}}`` becomes ``{"a.b": 1}``. 
+    
+    Handy for turning a partial document into MongoDB ``$set`` paths so only those fields get touched. Empty dictionaries are kept as values.
+
+    Raises ``ValueError`` for keys with a ``.`` in them or starting with ``$`` as they'd be read as paths or operators.
+    """
+    flat_dict = {}
+
+    for key, value in d.items():
+        key = str(key)
+
+        if "." in key or key.startswith("$"):
+            raise ValueError(f"The key '{key}' can't be flattened, keys can't contain '.' or start with '$'.")
+
+        key = f"{parent_key}.{key}" if parent_key else key
+
+        if isinstance(value, dict) and len(value) > 0:
+            flat_dict.update(flatten_dict(value, key))
+        else:
+            flat_dict[key] = value
+
+    return flat_dict
@@ -1,12 +1,15 @@
 from __future__ import annotations
 from typing import  TypeVar, TYPE_CHECKING
 
+import time
+from collections import OrderedDict
+
 if TYPE_CHECKING:
-    from typing import List, Dict, Tuple, Set
+    from typing import List, Dict, Tuple, Set, Any, Callable, Hashable
 
     T = TypeVar("T")
 
-__all__ = ("cache_lookup",)
+__all__ = ("cache_lookup", "LRUCache")
 
 def cache_lookup(key: str, cache: Dict[str, Tuple[str, T]] | List[Tuple[str, T]] | Set[Tuple[str, T]], cap_sensitive = True) -> Tuple[str, T] | None:
     """Finds and returns object using key from any goldy bot cache object."""
@@ -29,4 +32,66 @@ def cache_lookup(key: str, cache: Dict[str, Tuple[str, T]] | List[Tuple[str, T]]
 
     return None
 
-    # TODO: Add support for more different cache types.
\ No newline at end of file
+    # TODO: Add support for more different cache types.
+
+
+class LRUCache():
+    """
+    A size capped cache that evicts the least recently used item when full. 
+    Items can also expire after ``ttl`` seconds, a ttl of None means items never expire.
+    """
+    def __init__(self, max_size: int = 1000, ttl: float | None = None, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self.__clock = clock
+        self.__items: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: Hashable, default: Any = None, max_age: float | None = None) -> Any:
+        """
+        Returns the item cached with that key or the default if it's missing or has expired. 
+        ``max_age`` returns the default for items cached more than that many seconds ago, without evicting them.
+        """
+        item = self.__items.get(key)
+
+        if item is None:
+            return default
+
+        cached_at, value = item
+        age = self.__clock() - cached_at
+
+        if self.ttl is not None and age >= self.ttl:
+            del self.__items[key]
+            return default
+
+        if max_age is not None and age >= max_age:
+            return default
+
+        self.__items.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Caches an item, evicting the least recently used item if the cache is full."""
+        self.__items[key] = (self.__clock(), value)
+        self.__items.move_to_end(key)
+
+        while len(self.__items) > self.max_size:
+            self.__items.popitem(last = False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Removes and returns the item cached with that key."""
+        item = self.__items.pop(key, None)
+
+        if item is None:
+            return default
+
+        return item[1]
+
+    def clear(self) -> None:
+        self.__items.clear()
@@ -0,0 +1,35 @@
+"""
+Shows that looking up a guild takes the same time no matter how many guilds goldy bot is in.
+
+Usage: python scripts/benchmark_guild_lookup.py
+"""
+import timeit
+from types import SimpleNamespace
+
+from GoldyBot.goldy.guilds import GuildManager
+
+LOOKUPS = 10_000
+
+def guild_manager(guild_count: int) -> GuildManager:
+    goldy = SimpleNamespace(
+        config = SimpleNamespace(allowed_guilds = [("1", "test_server")], guild_config_ttl = 60, guild_setup_concurrency = 10),
+        intents = 0,
+        shard_manager = SimpleNamespace(event_dispatcher = SimpleNamespace(add_listener = lambda *args, **kwargs: None))
+    )
+    guild_manager = GuildManager(goldy)
+
+    for guild_id in range(guild_count):
+        guild_manager.add_guild(SimpleNamespace(id = str(guild_id)))
+
+    return guild_manager
+
+def main():
+    for guild_count in (10, 1000, 10_000):
+        manager = guild_manager(guild_count)
+        last_guild_id = str(guild_count - 1) # Looking up the last guild was the worst case of the old linear scan.
+
+        lookup_time = min(timeit.repeat(lambda: manager.get_guild(last_guild_id), number = LOOKUPS, repeat = 5))
+        print(f"{guild_count} guilds: {lookup_time / LOOKUPS * 1e9:.0f}ns per lookup")
+
+if __name__ == "__main__":
+    main()
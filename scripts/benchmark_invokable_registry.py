@@ -0,0 +1,30 @@
+"""
+Shows that looking up a registered invokable takes the same time no matter how many are registered.
+
+Usage: python scripts/benchmark_invokable_registry.py
+"""
+import timeit
+from types import SimpleNamespace
+
+from GoldyBot.goldy.objects import InvokableRegistry, InvokableTypes
+
+LOOKUPS = 20_000
+
+def registry_with_recipes(amount: int) -> InvokableRegistry:
+    registry = InvokableRegistry()
+
+    for index in range(amount):
+        registry.add(InvokableTypes.RECIPE, f"{index:032x}", SimpleNamespace(invokable_type = InvokableTypes.RECIPE, id = None))
+
+    return registry
+
+def main():
+    for amount in (10, 1000, 20_000):
+        registry = registry_with_recipes(amount)
+        key = f"{amount - 1:032x}"
+
+        lookup_time = min(timeit.repeat(lambda: registry.get(InvokableTypes.RECIPE, key), number = LOOKUPS, repeat = 5))
+        print(f"{amount} recipes: {lookup_time / LOOKUPS * 1e9:.0f}ns per lookup")
+
+if __name__ == "__main__":
+    main()
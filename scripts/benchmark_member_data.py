@@ -0,0 +1,88 @@
+"""
+Compares the old one collection per member data layout with the single ``members`` collection.
+
+Usage: python scripts/benchmark_member_data.py <mongodb url> [members]
+
+This creates and drops two scratch databases on that server, so please don't point it at production.
+"""
+import sys
+import time
+import random
+import asyncio
+import statistics
+
+import pymongo
+import motor.motor_asyncio
+
+GUILD_ID = "863416692083916820"
+LOOKUPS = 2000
+
+async def server_memory(client) -> int:
+    status = await client.admin.command("serverStatus")
+    return status["wiredTiger"]["cache"]["bytes currently in the cache"]
+
+async def database_stats(database) -> str:
+    stats = await database.command("dbStats")
+    return f"{stats['collections']} collections, {stats['storageSize'] / 1024 ** 2:.1f}MB storage, {stats['indexSize'] / 1024 ** 2:.1f}MB indexes"
+
+async def time_lookups(lookup, member_ids) -> str:
+    timings = []
+
+    for member_id in random.choices(member_ids, k = LOOKUPS):
+        start = time.perf_counter()
+        await lookup(member_id)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    return f"p50 {statistics.median(timings):.3f}ms, p99 {timings[int(len(timings) * 0.99)]:.3f}ms"
+
+async def main(url: str, members: int):
+    client = motor.motor_asyncio.AsyncIOMotorClient(url)
+    legacy = client["goldy_bench_legacy_members"]
+    single = client["goldy_bench_members"]
+
+    member_ids = [str(random.randint(10 ** 17, 10 ** 18)) for _ in range(members)]
+
+    try:
+        memory_before = await server_memory(client)
+
+        print(f"Creating {members} members in the old layout...")
+        for member_id in member_ids:
+            await legacy[member_id].insert_many([{"_id": "1"}, {"_id": GUILD_ID, "xp": 0}])
+
+        memory_legacy = await server_memory(client)
+
+        print(f"Creating {members} members in the new layout...")
+        await single["members"].create_index([("member_id", pymongo.ASCENDING), ("scope", pymongo.ASCENDING)], unique = True)
+
+        for index in range(0, members, 1000):
+            await single["members"].insert_many(
+                [
+                    document for member_id in member_ids[index:index + 1000] for document in (
+                        {"member_id": member_id, "scope": "global"}, {"member_id": member_id, "scope": GUILD_ID, "xp": 0}
+                    )
+                ]
+            )
+
+        memory_single = await server_memory(client)
+
+        legacy_lookup = lambda member_id: legacy[member_id].find({"_id": {"$in": ["1", GUILD_ID]}}).to_list(2)
+        single_lookup = lambda member_id: single["members"].find(
+            {"member_id": member_id, "scope": {"$in": ["global", GUILD_ID]}}
+        ).to_list(2)
+
+        print()
+        print(f"old layout: {await database_stats(legacy)}, +{(memory_legacy - memory_before) / 1024 ** 2:.1f}MB server cache")
+        print(f"    lookups: {await time_lookups(legacy_lookup, member_ids)}")
+        print(f"new layout: {await database_stats(single)}, +{(memory_single - memory_legacy) / 1024 ** 2:.1f}MB server cache")
+        print(f"    lookups: {await time_lookups(single_lookup, member_ids)}")
+
+    finally:
+        await client.drop_database(legacy)
+        await client.drop_database(single)
+        client.close()
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 5000)
+    )
@@ -0,0 +1,60 @@
+"""
+Compares sending a message payload as plain json with sending it as multipart form data.
+
+Usage: python scripts/benchmark_message_body.py [messages]
+"""
+import io
+import sys
+import time
+import asyncio
+
+from aiohttp import web, ClientSession
+
+from GoldyBot.goldy.nextcore_utils import File
+from GoldyBot.goldy.nextcore_utils.messages.send_msg import message_request_body
+
+payload = {
+    "content": "this is suppose to be owotastic!",
+    "embeds": [{"title": "owo", "description": "damn it, you found me!"}]
+}
+
+async def echo_content_type(request: web.Request) -> web.Response:
+    await request.read()
+    return web.Response(text = request.content_type)
+
+async def time_requests(body_factory, amount: int) -> float:
+    app = web.Application()
+    app.router.add_post("/messages", echo_content_type)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+
+    port = runner.addresses[0][1]
+
+    try:
+        async with ClientSession() as session:
+            start = time.perf_counter()
+
+            for _ in range(amount):
+                async with session.post(f"http://127.0.0.1:{port}/messages", **body_factory()) as r:
+                    await r.read()
+
+            elapsed = time.perf_counter() - start
+    finally:
+        await runner.cleanup()
+
+    return elapsed / amount
+
+def main(amount: int):
+    files = [File(io.BytesIO(b"owo"), "owo.txt")]
+
+    json_time = asyncio.run(time_requests(lambda: message_request_body(payload), amount))
+    multipart_time = asyncio.run(time_requests(lambda: message_request_body(payload, files), amount))
+
+    print(f"json: {json_time * 1000:.3f}ms/message, multipart: {multipart_time * 1000:.3f}ms/message")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,80 @@
+import asyncio
+from types import SimpleNamespace
+
+from nextcore.http import Route
+
+from GoldyBot.goldy.commands.loader import CommandLoader, hash_payloads
+
+from .test_local_backend import goldy_db
+
+payloads = [{"name": "ping", "description": "Pong!", "options": [], "type": 1}]
+
+class FakeResponse():
+    def __init__(self, data) -> None:
+        self.data = data
+
+    async def json(self):
+        return self.data
+
+class FakeHTTPClient():
+    def __init__(self) -> None:
+        self.requests = []
+
+    async def request(self, route, **kwargs):
+        self.requests.append(route)
+
+        return FakeResponse(
+            [{"id": str(1000 + index), "name": payload["name"], "application_id": "1"} for index, payload in enumerate(kwargs["json"])]
+        )
+
+def command_loader(database, http_client, force_sync: bool | None = False, config_force_sync: bool = False) -> CommandLoader:
+    goldy = SimpleNamespace(
+        application_data = {"id": "1"},
+        database = SimpleNamespace(get_goldy_database = lambda _: database),
+        http_client = http_client,
+        nc_authentication = SimpleNamespace(rate_limit_key = None, headers = {}),
+        config = SimpleNamespace(force_command_sync = config_force_sync)
+    )
+
+    return CommandLoader(goldy, force_sync = force_sync)
+
+def sync(loader: CommandLoader, slash_command_payloads):
+    route = Route("PUT", "/applications/{application_id}/commands", application_id = "1")
+    return asyncio.run(loader._CommandLoader__sync_cmds("global", route, slash_command_payloads))
+
+
+def test_hash_payloads_ignores_key_order():
+    reordered_payloads = [{"type": 1, "options": [], "description": "Pong!", "name": "ping"}]
+
+    assert hash_payloads(payloads) == hash_payloads(reordered_payloads)
+    assert hash_payloads(payloads) != hash_payloads([{**payloads[0], "description": "Pong! 🏓"}])
+
+def test_sync_cmds_skips_unchanged_commands():
+    database = goldy_db()
+    http_client = FakeHTTPClient()
+    loader = command_loader(database, http_client)
+
+    assert sync(loader, payloads) == [{"id": "1000", "name": "ping", "application_id": "1"}]
+    assert len(http_client.requests) == 1
+
+    # Same commands so the ids saved from the last sync are handed back without a request.
+    assert sync(loader, payloads) == [{"id": "1000", "name": "ping"}]
+    assert len(http_client.requests) == 1
+
+    sync(loader, [{**payloads[0], "description": "Pong! 🏓"}])
+    assert len(http_client.requests) == 2
+
+def test_sync_cmds_force_sync():
+    database = goldy_db()
+    http_client = FakeHTTPClient()
+
+    sync(command_loader(database, http_client), payloads)
+    sync(command_loader(database, http_client, force_sync = True), payloads)
+
+    assert len(http_client.requests) == 2
+
+def test_force_sync_defaults_to_the_config(monkeypatch):
+    monkeypatch.setattr("sys.argv", ["run.py", "--force-sync"])
+
+    assert command_loader(None, None, force_sync = None).force_sync is False
+    assert command_loader(None, None, force_sync = None, config_force_sync = True).force_sync is True
@@ -1,5 +1,10 @@
 import json
+
+import pytest
+
 from . import Config
+from GoldyBot.errors import GoldyBotError
+from GoldyBot.goldy.goldy_config import GoldyConfig
 
 config = Config("./test_config.json")
 
@@ -16,4 +21,16 @@ def test_config_not_found_value():
     assert config.get("owo", "huh", "WHAT") is None
 
 def test_config_not_found_set_value():
-    assert config.get("owo", "huh", "WHAT", default_value="BRUH") == "BRUH"
\ No newline at end of file
+    assert config.get("owo", "huh", "WHAT", default_value="BRUH") == "BRUH"
+
+def test_goldy_config_rejects_bad_read_preference(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    for read_preference, valid in (("secondaryPreferred", True), ("secondary_preferred", False)):
+        (tmp_path / "goldy.json").write_text(json.dumps({"goldy": {"database": {"read_preference": read_preference}}}))
+
+        if valid:
+            assert GoldyConfig().database_client_options["readPreference"] == read_preference
+        else:
+            with pytest.raises(GoldyBotError):
+                GoldyConfig().database_client_options
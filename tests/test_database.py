@@ -0,0 +1,36 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from GoldyBot.errors import GoldyBotError
+from GoldyBot.goldy.database import Database
+
+def fake_goldy(database_url: str):
+    return SimpleNamespace(
+        token = SimpleNamespace(database_url = database_url),
+        config = SimpleNamespace(
+            write_buffer_max_pending = 100, write_buffer_flush_interval = 60, write_buffer_max_attempts = 5, database_rebuild_indexes = False, database_profile_slow_ms = None, database_client_options = {}
+        )
+    )
+
+
+def test_database_connects_lazily():
+    async def run():
+        database = Database(fake_goldy("local://:memory:"))
+        assert not database.ready
+
+        await database.wait_until_ready()
+        assert database.ready
+        assert database.connect() is database.connect()
+
+    asyncio.run(run())
+
+def test_database_connect_error():
+    async def run():
+        database = Database(fake_goldy("local:///this/folder/does/not/exist/goldy.db"))
+
+        with pytest.raises(GoldyBotError):
+            await database.wait_until_ready()
+
+    asyncio.run(run())
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+from pymongo.errors import OperationFailure
+
+from GoldyBot import DatabaseIndex
+from GoldyBot.goldy.database.indexes import sync_collection_indexes
+
+class FakeCollection():
+    def __init__(self, existing, failing = ()) -> None:
+        self.existing = existing
+        self.failing = failing
+        self.dropped = []
+        self.created = []
+
+    async def list_indexes(self):
+        for index_info in self.existing:
+            yield index_info
+
+    async def drop_index(self, name):
+        self.dropped.append(name)
+
+    async def create_indexes(self, models):
+        for model in models:
+            if model.document["name"] in self.failing and model.document.get("unique", False):
+                raise OperationFailure("E11000 duplicate key error")
+
+        self.created.extend(model.document["name"] for model in models)
+
+class FakeGoldyDB():
+    def __init__(self, collection) -> None:
+        self.handle = collection
+
+    def collection(self, name):
+        return self.handle
+
+
+def test_database_index_matches():
+    index = DatabaseIndex("goldy_member_data", "members", [("member_id", 1), ("scope", 1)], unique = True)
+
+    assert index.name == "member_id_1_scope_1"
+    assert index.matches({"name": "member_id_1_scope_1", "key": {"member_id": 1, "scope": 1}, "unique": True})
+    assert not index.matches({"name": "member_id_1_scope_1", "key": {"member_id": 1, "scope": 1}})
+    assert not index.matches({"name": "member_id_1", "key": {"member_id": 1}, "unique": True})
+
+def existing_member_indexes():
+    return [
+        {"name": "_id_", "key": {"_id": 1}},
+        {"name": "member_id_1_scope_1", "key": {"member_id": 1, "scope": 1}},
+        {"name": "xp_-1", "key": {"xp": -1}}
+    ]
+
+def declared_member_indexes():
+    return [
+        DatabaseIndex("goldy_member_data", "members", [("member_id", 1), ("scope", 1)], unique = True),
+        DatabaseIndex("goldy_member_data", "members", [("xp", -1)]),
+        DatabaseIndex("goldy_member_data", "members", "scope")
+    ]
+
+def test_sync_collection_indexes():
+    collection = FakeCollection(existing_member_indexes())
+
+    created, rebuilt, outdated = asyncio.run(sync_collection_indexes(FakeGoldyDB(collection), "members", declared_member_indexes()))
+
+    assert (created, rebuilt) == (1, 0)
+    assert [index.name for index in outdated] == ["member_id_1_scope_1"]
+    assert collection.dropped == []
+    assert collection.created == ["scope_1"]
+
+def test_sync_collection_indexes_rebuild():
+    collection = FakeCollection(existing_member_indexes())
+
+    created, rebuilt, outdated = asyncio.run(
+        sync_collection_indexes(FakeGoldyDB(collection), "members", declared_member_indexes(), rebuild = True)
+    )
+
+    assert (created, rebuilt, outdated) == (1, 1, [])
+    assert collection.dropped == ["member_id_1_scope_1"]
+    assert collection.created == ["scope_1", "member_id_1_scope_1"]
+
+def test_sync_collection_indexes_failed_rebuild_restores_index():
+    collection = FakeCollection(existing_member_indexes(), failing = ["member_id_1_scope_1"])
+
+    with pytest.raises(OperationFailure):
+        asyncio.run(sync_collection_indexes(FakeGoldyDB(collection), "members", declared_member_indexes(), rebuild = True))
+
+    assert collection.dropped == ["member_id_1_scope_1"]
+    assert collection.created == ["scope_1", "member_id_1_scope_1"]
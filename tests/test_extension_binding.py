@@ -0,0 +1,84 @@
+import asyncio
+from types import SimpleNamespace
+
+import GoldyBot.goldy
+from GoldyBot.goldy.commands.command import Command
+from GoldyBot.goldy.events.decorator import event
+from GoldyBot.goldy.extensions import Extension, extensions_cache, extensions_index
+
+class Economy(Extension):
+    def __init__(self) -> None:
+        # Skips Extension.__init__ as that needs a running goldy bot.
+        self.goldy = SimpleNamespace(permission_system = SimpleNamespace(clear_compiled_perms = lambda: None))
+        self.commands = []
+        self.loaded = True
+        self.used = 0
+
+        extensions_cache.append((self.name, self))
+        extensions_index[self.name] = self
+
+    @property
+    def logger(self):
+        self.used += 1
+        return SimpleNamespace(debug = lambda *args: None)
+
+async def balance(self, platter):
+    ...
+
+balance.__qualname__ = "Economy.balance"
+
+
+def test_unload_removes_extension_from_index():
+    extension = Economy()
+
+    extension.unload()
+
+    assert "Economy" not in extensions_index
+    assert extension.loaded is False
+
+def test_command_extension_is_looked_up_again_after_unload():
+    command = Command.__new__(Command)
+    command._extension = None
+    command.extension_name = "Economy"
+
+    old_extension = Economy()
+    assert command.extension is old_extension
+
+    old_extension.unload()
+    assert command.extension is None
+
+    new_extension = Economy()
+    assert command.extension is new_extension
+
+    new_extension.unload()
+
+def test_event_callback_is_bound_again_after_unload(monkeypatch):
+    listeners = []
+    goldy = SimpleNamespace(
+        shard_manager = SimpleNamespace(event_dispatcher = SimpleNamespace(add_listener = lambda callback, name: listeners.append(callback))),
+        guild_manager = SimpleNamespace(get_guild = lambda guild_id: None)
+    )
+    monkeypatch.setitem(GoldyBot.goldy.cache, "goldy_core_instance", goldy)
+
+    event("MESSAGE_CREATE")(balance)
+    callback = listeners[0]
+    message = {"guild_id": "1", "author": {"id": "1"}}
+
+    async def run():
+        assert await callback(message) is False # No extension loaded yet.
+
+        old_extension = Economy()
+        await callback(message)
+        await callback(message)
+        assert old_extension.used == 2
+
+        old_extension.unload()
+        assert await callback(message) is False
+
+        new_extension = Economy()
+        await callback(message)
+        assert new_extension.used == 1
+
+        new_extension.unload()
+
+    asyncio.run(run())
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+
+from GoldyBot.goldy.database.databases import GoldyDB
+
+class FakeCursor():
+    def __init__(self, documents) -> None:
+        self.documents = iter(documents)
+        self.closed = False
+
+    def sort(self, key):
+        return self
+
+    def batch_size(self, size):
+        return self
+
+    async def next(self):
+        try:
+            return next(self.documents)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def close(self):
+        self.closed = True
+
+class FakeCollection():
+    def __init__(self, read_preference = None) -> None:
+        self.cursor = None
+        self.read_preference = read_preference
+
+    def with_options(self, read_preference):
+        return FakeCollection(read_preference)
+
+    async def find_one(self, query):
+        return {"_id": query["_id"], "prefix": "!"}
+
+    def find(self, query, projection = None, limit = 0):
+        self.cursor = FakeCursor({"_id": str(index)} for index in range(limit or 1000))
+        return self.cursor
+
+class FakeDatabase(dict):
+    def __missing__(self, key):
+        self[key] = FakeCollection()
+        return self[key]
+
+class FakeCoreDatabase():
+    def __init__(self) -> None:
+        self.client = {"goldy_main": FakeDatabase()}
+        self.logger = logging.getLogger("test")
+        self.operations = []
+
+    def record_operation(self, database_name, collection, operation, duration):
+        self.operations.append((database_name, collection, operation))
+
+
+def test_goldy_db_caches_collection_handles():
+    goldy_db = GoldyDB(FakeCoreDatabase(), "goldy_main")
+
+    assert goldy_db.collection("guild_configs") is goldy_db.collection("guild_configs")
+
+def test_goldy_db_records_operations():
+    core_database = FakeCoreDatabase()
+    goldy_db = GoldyDB(core_database, "goldy_main")
+
+    assert asyncio.run(goldy_db.find_one("guild_configs", {"_id": "863416692083916820"}))["prefix"] == "!"
+    assert core_database.operations == [("goldy_main", "guild_configs", "find_one")]
+
+def test_goldy_db_stream():
+    core_database = FakeCoreDatabase()
+    goldy_db = GoldyDB(core_database, "goldy_main")
+
+    async def first_five():
+        return [document async for document in goldy_db.stream("members", limit = 5, batch_size = 2)]
+
+    assert [document["_id"] for document in asyncio.run(first_five())] == ["0", "1", "2", "3", "4"]
+    assert goldy_db.collection("members").cursor.closed
+    assert core_database.operations == [("goldy_main", "members", "stream")]
+
+def test_goldy_db_read_preference_handles():
+    goldy_db = GoldyDB(FakeCoreDatabase(), "goldy_main")
+    handle = goldy_db.collection("members", "secondaryPreferred")
+
+    assert handle is goldy_db.collection("members", "secondaryPreferred")
+    assert handle.read_preference.mongos_mode == "secondaryPreferred"
+    assert goldy_db.collection("members").read_preference is None
@@ -0,0 +1,181 @@
+import asyncio
+import logging
+from types import SimpleNamespace
+
+from GoldyBot.goldy.guilds import GuildManager
+from GoldyBot.goldy.database.wrappers.guild import GuildDBWrapper
+
+from .test_local_backend import goldy_db
+
+class FakeClock():
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def fake_goldy(config_ttl: float | None = 60) -> SimpleNamespace:
+    database = goldy_db()
+
+    goldy = SimpleNamespace(
+        config = SimpleNamespace(allowed_guilds = [("863416692083916820", "test_server")], guild_config_ttl = config_ttl, guild_setup_concurrency = 10),
+        intents = 0,
+        shard_manager = SimpleNamespace(event_dispatcher = SimpleNamespace(add_listener = lambda *args, **kwargs: None)),
+        database = SimpleNamespace(get_goldy_database = lambda _: database)
+    )
+    goldy.guild_manager = GuildManager(goldy)
+
+    return goldy
+
+def config_wrapper(goldy, clock = None, id: str = "863416692083916820", code_name: str = "test_server") -> GuildDBWrapper:
+    guild = SimpleNamespace(id = id, code_name = code_name, goldy = goldy, logger = logging.getLogger("test"))
+    goldy.guild_manager.add_guild(guild)
+
+    guild.config_wrapper = GuildDBWrapper(guild, clock = clock or FakeClock())
+    return guild.config_wrapper
+
+
+def test_guild_config_goes_stale_after_ttl():
+    goldy = fake_goldy(config_ttl = 60)
+    clock = FakeClock()
+    wrapper = config_wrapper(goldy, clock)
+
+    assert wrapper.is_stale
+
+    wrapper.set_data(wrapper.new_config())
+    assert not wrapper.is_stale and wrapper.version == 1
+
+    clock.now = 60
+    assert wrapper.is_stale
+
+    # Configs pushed to us by a change stream never go stale.
+    goldy.guild_manager.watching_configs = True
+    assert not wrapper.is_stale
+
+    wrapper.expire()
+    assert wrapper.is_stale
+
+def test_guild_config_refresh_only_pulls_stale_configs():
+    goldy = fake_goldy()
+    wrapper = config_wrapper(goldy)
+
+    async def run():
+        await wrapper.refresh() # Creates the config from the template.
+        assert wrapper.prefix == "!" and wrapper.version == 1
+
+        await wrapper.refresh()
+        assert wrapper.version == 1
+
+        wrapper.expire()
+        await wrapper.refresh()
+        assert wrapper.version == 2
+
+    asyncio.run(run())
+
+def test_set_data_updates_the_prefix_table():
+    goldy = fake_goldy()
+    wrapper = config_wrapper(goldy)
+
+    wrapper.set_data({**wrapper.new_config(), "prefix": "?"})
+
+    assert goldy.guild_manager.prefix_table["863416692083916820"] == ("?", wrapper)
+
+def test_config_change_events_update_the_guild():
+    goldy = fake_goldy()
+    manager = goldy.guild_manager
+    wrapper = config_wrapper(goldy)
+    wrapper.set_data(wrapper.new_config())
+
+    on_config_change = manager._GuildManager__on_config_change
+
+    on_config_change(
+        {"operationType": "update", "documentKey": {"_id": "863416692083916820"}, "fullDocument": {**wrapper.new_config(), "prefix": "$"}}
+    )
+    assert wrapper.prefix == "$" and manager.prefix_table["863416692083916820"][0] == "$"
+
+    on_config_change({"operationType": "delete", "documentKey": {"_id": "863416692083916820"}})
+    assert wrapper.is_stale
+
+    # Changes to guilds goldy bot isn't in are ignored.
+    on_config_change({"operationType": "update", "documentKey": {"_id": "1"}, "fullDocument": {}})
+
+def test_stop_watching_configs_cancels_the_watcher():
+    manager = fake_goldy().guild_manager
+
+    async def run():
+        watcher = asyncio.get_event_loop().create_task(asyncio.sleep(3600))
+        manager._GuildManager__config_watcher = watcher
+        manager.watching_configs = True
+
+        manager.stop_watching_configs()
+        await asyncio.sleep(0)
+
+        assert watcher.cancelled()
+        assert not manager.watching_configs
+
+    asyncio.run(run())
+
+def test_load_configs_bulk_loads_and_creates_missing_configs(monkeypatch):
+    goldy = fake_goldy()
+    database = goldy.database.get_goldy_database(None)
+    existing = config_wrapper(goldy, id = "1", code_name = "existing_server")
+    missing = config_wrapper(goldy, id = "2", code_name = "missing_server")
+
+    calls = []
+
+    def spy(name: str):
+        method = getattr(database, name)
+
+        async def wrapper(collection, *args, **kwargs):
+            calls.append((name, args, kwargs))
+            return await method(collection, *args, **kwargs)
+
+        monkeypatch.setattr(database, name, wrapper)
+
+    async def run():
+        await database.insert("guild_configs", {**existing.new_config(), "prefix": "?"})
+
+        spy("find")
+        spy("insert_many")
+        await goldy.guild_manager.load_configs([existing.guild, missing.guild])
+
+        assert await database.find_one("guild_configs", {"_id": "2"}) == missing.new_config()
+
+    asyncio.run(run())
+
+    # One query for every config and one insert for only the missing ones.
+    assert [call[0] for call in calls] == ["find", "insert_many"]
+    assert calls[0][2]["query"] == {"_id": {"$in": ["1", "2"]}}
+    assert calls[1][1] == ([missing.new_config()],)
+
+    assert existing.prefix == "?" and missing.prefix == "!"
+    assert not existing.is_stale and not missing.is_stale
+    assert goldy.guild_manager.prefix_table["1"][0] == "?"
+
+def test_load_configs_expires_configs_that_failed_to_insert(monkeypatch):
+    goldy = fake_goldy()
+    database = goldy.database.get_goldy_database(None)
+    raced = config_wrapper(goldy, id = "1", code_name = "raced_server")
+    missing = config_wrapper(goldy, id = "2", code_name = "missing_server")
+
+    find = database.find
+
+    async def find_then_race(collection, *args, **kwargs):
+        guild_configs = await find(collection, *args, **kwargs)
+
+        # Another process creates this config between our find and insert_many.
+        await database.insert("guild_configs", {**raced.new_config(), "prefix": "$"})
+        return guild_configs
+
+    monkeypatch.setattr(database, "find", find_then_race)
+
+    async def run():
+        await goldy.guild_manager.load_configs([raced.guild, missing.guild])
+
+        assert raced.is_stale and not missing.is_stale
+        assert await database.find_one("guild_configs", {"_id": "2"}) == missing.new_config()
+
+        await raced.refresh()
+        assert raced.prefix == "$"
+
+    asyncio.run(run())
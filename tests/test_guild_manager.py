@@ -0,0 +1,64 @@
+import asyncio
+from types import SimpleNamespace
+
+from GoldyBot.goldy import GUILD_MEMBERS_INTENT
+from GoldyBot.goldy.guilds import GuildManager
+from GoldyBot.utils import LRUCache
+
+def guild_manager(guild_count: int, intents: int = 0, listeners: list = None) -> GuildManager:
+    listeners = [] if listeners is None else listeners
+
+    goldy = SimpleNamespace(
+        config = SimpleNamespace(allowed_guilds = [("1", "test_server")], guild_config_ttl = 60, guild_setup_concurrency = 10),
+        intents = intents,
+        shard_manager = SimpleNamespace(event_dispatcher = SimpleNamespace(add_listener = lambda callback, event_name: listeners.append(event_name)))
+    )
+    guild_manager = GuildManager(goldy)
+
+    for guild_id in range(guild_count):
+        guild_manager.add_guild(SimpleNamespace(id = str(guild_id), member_cache = LRUCache()))
+
+    return guild_manager
+
+
+def test_get_guild_normalises_ids():
+    manager = guild_manager(10)
+
+    assert manager.get_guild("7") is manager.get_guild(7)
+    assert manager.get_guild("100") is None
+
+    manager.clear()
+    assert manager.get_guild("7") is None and manager.guilds == []
+
+class UnscannableList(list):
+    def __iter__(self):
+        raise AssertionError("The guild list was scanned.")
+
+def test_get_guild_does_not_scan_guilds():
+    manager = guild_manager(10_000)
+    manager.guilds = UnscannableList(manager.guilds)
+
+    # Looking up the last guild was the worst case of the old linear scan, see scripts/benchmark_guild_lookup.py.
+    assert manager.get_guild("9999").id == "9999"
+    assert manager.get_guild(10_000) is None
+
+def test_member_listeners_need_the_guild_members_intent():
+    listeners = []
+    guild_manager(1, listeners = listeners)
+    assert listeners == []
+
+    guild_manager(1, intents = GUILD_MEMBERS_INTENT, listeners = listeners)
+    assert listeners == ["GUILD_MEMBER_UPDATE", "GUILD_MEMBER_REMOVE"]
+
+def test_member_events_update_the_member_cache():
+    manager = guild_manager(1, intents = GUILD_MEMBERS_INTENT)
+    member_cache = manager.get_guild("0").member_cache
+
+    async def run():
+        await manager.on_member_update({"guild_id": "0", "user": {"id": "1"}, "roles": []})
+        assert member_cache.get("1")["roles"] == []
+
+        await manager.on_member_remove({"guild_id": "0", "user": {"id": "1"}})
+        assert member_cache.get("1") is None
+
+    asyncio.run(run())
@@ -0,0 +1,108 @@
+from types import SimpleNamespace
+
+from GoldyBot.goldy.objects import InvokableRegistry, InvokableTypes
+
+class FakeClock():
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def dummy_recipe(id: str = None):
+    return SimpleNamespace(invokable_type = InvokableTypes.RECIPE, id = id)
+
+
+def test_registry_lookup():
+    registry = InvokableRegistry()
+    recipe = dummy_recipe()
+
+    registry.add(InvokableTypes.RECIPE, "uwu", recipe)
+
+    assert registry.get(InvokableTypes.RECIPE, "uwu") is recipe
+    assert ("uwu", recipe) in registry
+    assert len(registry) == 1
+
+def test_registry_namespaces_are_separate():
+    registry = InvokableRegistry()
+    recipe = dummy_recipe()
+
+    registry.add(InvokableTypes.RECIPE, "1452365", recipe)
+
+    assert registry.get(InvokableTypes.SLASH_COMMAND, "1452365") is None
+    assert registry.get(InvokableTypes.PREFIX_COMMAND, "1452365") is None
+    assert registry.count(InvokableTypes.RECIPE) == 1
+
+def test_registry_remove():
+    registry = InvokableRegistry()
+    recipe = dummy_recipe()
+
+    registry.add(InvokableTypes.RECIPE, "jeff", recipe)
+
+    assert registry.remove(InvokableTypes.RECIPE, "jeff") is recipe
+    assert registry.remove(InvokableTypes.RECIPE, "jeff") is None
+    assert len(registry) == 0
+
+def test_registry_recipes_expire():
+    clock = FakeClock()
+    registry = InvokableRegistry(clock = clock)
+
+    registry.add(InvokableTypes.RECIPE, "short", dummy_recipe(), ttl = 60)
+    registry.add(InvokableTypes.RECIPE, "forever", dummy_recipe())
+
+    clock.now = 59
+    assert registry.sweep() == 0
+
+    clock.now = 60
+    assert registry.sweep() == 1
+    assert registry.get(InvokableTypes.RECIPE, "short") is None
+    assert registry.get(InvokableTypes.RECIPE, "forever") is not None
+
+def test_registry_evicts_oldest_recipe():
+    registry = InvokableRegistry(max_recipes = 2)
+
+    for id in ("a", "b", "c"):
+        registry.add(InvokableTypes.RECIPE, id, dummy_recipe())
+
+    assert registry.get(InvokableTypes.RECIPE, "a") is None
+    assert registry.count(InvokableTypes.RECIPE) == 2
+
+def test_registry_removes_recipes_of_deleted_message():
+    registry = InvokableRegistry()
+    recipes = [dummy_recipe("yes"), dummy_recipe("no")]
+
+    for recipe in recipes:
+        registry.add(InvokableTypes.RECIPE, recipe.id, recipe)
+
+    registry.link_message("1234", recipes)
+
+    assert registry.remove_message("1234") == 2
+    assert len(registry) == 0
+    assert registry.stats["linked_messages"] == 0
+
+def test_registry_stays_bounded_over_a_day():
+    clock = FakeClock()
+    registry = InvokableRegistry(max_recipes = 5000, clock = clock)
+
+    peak = {}
+
+    # 24 hours of a busy bot: 20 buttons a minute, a third of messages get deleted, swept every 30 seconds.
+    for minute in range(24 * 60):
+        for index in range(20):
+            recipe = dummy_recipe(f"{minute}-{index}")
+            registry.add(InvokableTypes.RECIPE, recipe.id, recipe, ttl = 3600)
+            registry.link_message(recipe.id, [recipe])
+
+            if index % 3 == 0:
+                registry.remove_message(recipe.id)
+
+        for _ in range(2):
+            clock.now += 30
+            registry.sweep()
+
+        for key, value in registry.stats.items():
+            peak[key] = max(peak.get(key, 0), value)
+
+    assert peak["recipe"] <= 20 * 60
+    assert peak["pending_expiries"] <= 2 * peak["recipe"] + 64
+    assert peak["linked_messages"] <= peak["recipe"]
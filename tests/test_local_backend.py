@@ -0,0 +1,128 @@
+import asyncio
+import logging
+
+import pytest
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from GoldyBot.errors import GoldyBotError
+from GoldyBot.goldy.database.backends import get_backend, LocalBackend
+from GoldyBot.goldy.database.databases import GoldyDB
+from GoldyBot.goldy.database.indexes import DatabaseIndex, sync_collection_indexes
+
+class FakeCoreDatabase():
+    def __init__(self) -> None:
+        self.backend = get_backend("local://:memory:")
+        self.client = self.backend.client
+        self.logger = logging.getLogger("test")
+
+    def record_operation(self, database_name, collection, operation, duration):
+        ...
+
+def goldy_db(name: str = "goldy_main") -> GoldyDB:
+    return GoldyDB(FakeCoreDatabase(), name)
+
+
+def test_local_backend_from_url():
+    assert isinstance(get_backend("local://:memory:"), LocalBackend)
+
+def test_local_backend_edit_and_find():
+    database = goldy_db()
+
+    async def run():
+        await database.edit("guild_configs", {"_id": "863416692083916820"}, {"prefix": "!", "roles": {"admin": "1"}})
+        document = await database.edit("guild_configs", {"_id": "863416692083916820"}, {"roles": {"mod": "2"}})
+
+        assert document == {"_id": "863416692083916820", "prefix": "!", "roles": {"admin": "1", "mod": "2"}}
+        assert await database.find_one("guild_configs", {"_id": {"$in": ["863416692083916820"]}}) == document
+        assert await database.find_one("guild_configs", {"prefix": {"$ne": "!"}}) is None
+
+    asyncio.run(run())
+
+def test_local_backend_bulk_write_and_stream():
+    database = goldy_db("goldy_member_data")
+
+    async def run():
+        await database.bulk_write("members", [
+            UpdateOne({"member_id": str(member_id), "scope": "global"}, {"$inc": {"xp": member_id}}, upsert = True) for member_id in range(10)
+        ])
+        await database.bulk_write("members", [UpdateOne({"member_id": "3", "scope": "global"}, {"$setOnInsert": {"xp": 0}}, upsert = True)])
+
+        documents = [
+            document async for document in database.stream(
+                "members", {"xp": {"$gte": 3}}, projection = {"_id": 0, "member_id": 1}, sort = [("xp", -1)], limit = 3, batch_size = 2
+            )
+        ]
+
+        assert documents == [{"member_id": "9"}, {"member_id": "8"}, {"member_id": "7"}]
+
+    asyncio.run(run())
+
+def test_local_backend_unique_indexes():
+    database = goldy_db("goldy_member_data")
+    index = DatabaseIndex("goldy_member_data", "members", [("member_id", 1), ("scope", 1)], unique = True)
+
+    async def run():
+        assert await sync_collection_indexes(database, "members", [index]) == (1, 0, [])
+        assert await sync_collection_indexes(database, "members", [index]) == (0, 0, [])
+
+        await database.insert("members", {"member_id": "1", "scope": "global"})
+
+        with pytest.raises(DuplicateKeyError):
+            await database.insert("members", {"member_id": "1", "scope": "global"})
+
+        with pytest.raises(BulkWriteError) as error:
+            await database.insert_many("members", [{"member_id": "2", "scope": "global"}, {"member_id": "1", "scope": "global"}])
+
+        assert [write_error["index"] for write_error in error.value.details["writeErrors"]] == [1]
+
+    asyncio.run(run())
+
+def test_local_backend_array_fields():
+    database = goldy_db()
+
+    async def run():
+        await database.insert("tags", {"_id": "1", "tags": ["a", "b"], "score": 5})
+        await database.insert("tags", {"_id": "2", "tags": "c", "score": 5.0})
+
+        assert (await database.find_one("tags", {"tags": "a"}))["_id"] == "1"
+        assert (await database.find_one("tags", {"tags": {"$in": ["z", "b"]}}))["_id"] == "1"
+        assert (await database.find_one("tags", {"tags": {"$in": ["c"]}}))["_id"] == "2"
+        assert await database.find_one("tags", {"tags": {"$in": []}}) is None
+        assert len(await database.find("tags", {"score": 5}, key = "_id")) == 2
+
+    asyncio.run(run())
+
+def test_local_backend_unsorted_cursor():
+    database = goldy_db("goldy_member_data")
+
+    async def run():
+        await database.bulk_write("members", [
+            UpdateOne({"member_id": str(member_id)}, {"$set": {"xp": member_id}}, upsert = True) for member_id in range(5)
+        ])
+
+        cursor = database.database["members"].find({}, limit = 2)
+
+        assert (await cursor.next())["xp"] == 0
+
+        # Writes made while the cursor is open don't break it.
+        await database.edit("members", {"member_id": "0"}, {"xp": 100})
+
+        assert (await cursor.next())["xp"] == 1
+
+        with pytest.raises(StopAsyncIteration):
+            await cursor.next()
+
+    asyncio.run(run())
+
+def test_edit_rejects_ids_paths_and_operators():
+    database = goldy_db()
+
+    async def run():
+        for data in ({"_id": "2", "prefix": "?"}, {"roles.admin": "1"}, {"$inc": {"xp": 1}}):
+            with pytest.raises(GoldyBotError):
+                await database.edit("guild_configs", {"_id": "1"}, data)
+
+        assert await database.find_one("guild_configs", {"_id": "1"}) is None
+
+    asyncio.run(run())
@@ -0,0 +1,47 @@
+import asyncio
+import logging
+from types import SimpleNamespace
+
+from GoldyBot.goldy.database.wrappers.member import MemberDBWrapper, MEMBERS_COLLECTION
+
+from .test_local_backend import goldy_db
+
+def fake_database():
+    member_data = goldy_db("goldy_member_data")
+
+    return SimpleNamespace(
+        get_goldy_database = lambda _: member_data,
+        legacy_member_ids = {"332592361307897856"},
+        logger = logging.getLogger("test")
+    ), member_data
+
+def fake_member(database) -> SimpleNamespace:
+    goldy = SimpleNamespace(database = database)
+
+    return SimpleNamespace(
+        id = "332592361307897856",
+        username = "goldy",
+        guild = SimpleNamespace(id = "863416692083916820", code_name = "test_server"),
+        goldy = goldy,
+        logger = logging.getLogger("test")
+    )
+
+
+def test_legacy_data_is_migrated_after_an_increment():
+    database, member_data = fake_database()
+    member_id = "332592361307897856"
+
+    async def run():
+        await member_data.insert(member_id, {"_id": "1", "xp": 10, "bio": "owo", "stats": {"wins": 3, "losses": 1}})
+
+        # An increment that landed before the member's first update created a new layout document.
+        await member_data.edit(MEMBERS_COLLECTION, {"member_id": member_id, "scope": "global"}, {"xp": 2, "stats": {"wins": 5}})
+
+        wrapper = MemberDBWrapper(fake_member(database))
+        await wrapper.update()
+
+        assert wrapper.data == {"xp": 2, "bio": "owo", "stats": {"wins": 5, "losses": 1}}
+        assert database.legacy_member_ids == set()
+        assert member_id not in await member_data.list_collection_names()
+
+    asyncio.run(run())
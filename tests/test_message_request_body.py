@@ -0,0 +1,55 @@
+import io
+import asyncio
+
+from aiohttp import web, ClientSession
+
+from GoldyBot.goldy.nextcore_utils import File
+from GoldyBot.goldy.nextcore_utils.messages.send_msg import message_request_body
+
+payload = {
+    "content": "this is suppose to be owotastic!",
+    "embeds": [{"title": "owo", "description": "damn it, you found me!"}]
+}
+
+async def echo_content_type(request: web.Request) -> web.Response:
+    await request.read()
+    return web.Response(text = request.content_type)
+
+async def content_types_received(body_factory, amount: int = 3):
+    app = web.Application()
+    app.router.add_post("/messages", echo_content_type)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+
+    port = runner.addresses[0][1]
+    content_types = set()
+
+    try:
+        async with ClientSession() as session:
+            for _ in range(amount):
+                async with session.post(f"http://127.0.0.1:{port}/messages", **body_factory()) as r:
+                    content_types.add(await r.text())
+    finally:
+        await runner.cleanup()
+
+    return content_types
+
+
+def test_json_body_without_files():
+    assert message_request_body(payload) == {"json": payload}
+    assert message_request_body(payload, []) == {"json": payload}
+
+def test_multipart_body_with_files():
+    body = message_request_body(payload, [File(io.BytesIO(b"owo"), "owo.txt")])
+
+    assert list(body) == ["data"]
+
+def test_message_body_content_types():
+    files = [File(io.BytesIO(b"owo"), "owo.txt")]
+
+    assert asyncio.run(content_types_received(lambda: message_request_body(payload))) == {"application/json"}
+    assert asyncio.run(content_types_received(lambda: message_request_body(payload, files))) == {"multipart/form-data"}
@@ -0,0 +1,93 @@
+import asyncio
+from types import SimpleNamespace
+
+from GoldyBot.goldy.perms import Perms
+from GoldyBot.goldy.objects.member import Member
+from GoldyBot.goldy.guilds.guild import PERMISSION_MEMBER_DATA_MAX_AGE
+from GoldyBot.goldy.permission_system import PermissionSystem
+from GoldyBot.utils import LRUCache
+
+class FakeClock():
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class FakeResponse():
+    def __init__(self, data) -> None:
+        self.data = data
+
+    async def json(self):
+        return self.data
+
+class FakeGuild(dict):
+    def __init__(self, owner_id: str) -> None:
+        super().__init__(owner_id = owner_id)
+
+        self.code_name = "test_server"
+        self.config_wrapper = SimpleNamespace(version = 1, roles = {})
+        self._compiled_perms = {}
+
+class FakeCommand():
+    name = "nuke"
+    required_perms = [Perms.GUILD_OWNER]
+
+
+def test_compiled_perms_follow_the_guild_owner():
+    guild = FakeGuild("1")
+    permission_system = PermissionSystem(SimpleNamespace(guild_manager = SimpleNamespace(guilds = [("2", guild)])))
+    command = FakeCommand()
+
+    assert permission_system.get_compiled_perms(command, guild).member_ids == {"1"}
+
+    guild["owner_id"] = "2"
+    assert permission_system.get_compiled_perms(command, guild).member_ids == {"2"}
+
+    permission_system.clear_compiled_perms()
+    assert guild._compiled_perms == {}
+
+def test_permission_checks_refetch_stale_member_roles():
+    clock = FakeClock()
+    guild = SimpleNamespace(id = "863416692083916820", member_cache = LRUCache(ttl = 300, clock = clock))
+    requests = []
+
+    async def request(route, **kwargs):
+        requests.append(route)
+        return FakeResponse({"roles": []}) # The role was taken away.
+
+    goldy = SimpleNamespace(http_client = SimpleNamespace(request = request), nc_authentication = SimpleNamespace(rate_limit_key = None, headers = {}))
+    guild.member_cache.set("1", {"roles": ["5"]})
+
+    async def run():
+        assert (await Member({"id": "1", "username": "goldy"}, guild, goldy).member_data)["roles"] == ["5"]
+
+        clock.now = PERMISSION_MEMBER_DATA_MAX_AGE
+        member = Member({"id": "1", "username": "goldy"}, guild, goldy)
+
+        assert (await member.member_data)["roles"] == ["5"]
+        assert (await member.get_member_data(max_age = PERMISSION_MEMBER_DATA_MAX_AGE))["roles"] == []
+
+    asyncio.run(run())
+
+    assert len(requests) == 1
+
+def test_unconfigured_required_role_denies():
+    guild = FakeGuild("1")
+    guild.config_wrapper.roles = {"mod": "5"}
+    permission_system = PermissionSystem(SimpleNamespace(guild_manager = SimpleNamespace(guilds = [("2", guild)])))
+
+    command = FakeCommand()
+    command.required_perms = [Perms.GUILD_OWNER, "admin", "mod"]
+
+    async def member_data(max_age = None):
+        return {"roles": ["5"]}
+
+    def platter(author_id: str):
+        return SimpleNamespace(invokable = command, guild = guild, author = SimpleNamespace(id = author_id, get_member_data = member_data))
+
+    assert permission_system.get_compiled_perms(command, guild).missing_roles == {"admin"}
+
+    # The member has the mod role but the guild never configured admin, so it's denied like before compiled perms.
+    assert asyncio.run(permission_system.got_perms(platter("2"))) is False
+    assert asyncio.run(permission_system.got_perms(platter("1"))) is True
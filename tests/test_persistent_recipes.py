@@ -0,0 +1,70 @@
+import pytest
+
+from GoldyBot import recipe_handler
+from GoldyBot.errors import GoldyBotError
+from GoldyBot.goldy.extensions import extensions_index
+from GoldyBot.goldy.recipes.persistent import (
+    encode_custom_id, decode_custom_id, handler_id, persistent_handlers, interaction_author_id, resolve_handler
+)
+
+class Nuker():
+    @recipe_handler()
+    async def nuke_city(self, platter, city: str):
+        ...
+
+    async def not_a_handler(self, platter):
+        ...
+
+class Outer():
+    class Bank():
+        @recipe_handler()
+        async def withdraw(self, platter, amount: int):
+            ...
+
+def make_local_handler():
+    @recipe_handler()
+    async def local_handler(platter):
+        ...
+
+    return local_handler
+
+
+def test_custom_id_round_trip():
+    custom_id = encode_custom_id(Nuker().nuke_city, "332592361307897856", False, {"city": "london"})
+
+    assert len(custom_id) <= 100
+    assert decode_custom_id(custom_id) == (handler_id(Nuker.nuke_city), "332592361307897856", False, {"city": "london"})
+    assert persistent_handlers[handler_id(Nuker.nuke_city)] is Nuker.nuke_city
+
+def test_custom_id_of_non_persistent_recipe():
+    assert decode_custom_id("a9f3c0d2e1b4") is None
+    assert decode_custom_id("gb~owo") is None
+
+def test_malformed_custom_ids():
+    for custom_id in ("gb~x~5", "gb~x~null", "gb~x~[1,2]", 'gb~x~[null,0,"owo"]', "gb~x~[null,0,[]]", "gb~x~[5,0,{}]"):
+        assert decode_custom_id(custom_id) is None
+
+def test_custom_id_needs_a_recipe_handler():
+    with pytest.raises(GoldyBotError):
+        encode_custom_id(Nuker().not_a_handler, None, False, {})
+
+def test_custom_id_length_is_capped():
+    with pytest.raises(GoldyBotError):
+        encode_custom_id(Nuker.nuke_city, None, False, {"city": "a" * 100})
+
+def test_recipe_handlers_bind_to_their_own_class(monkeypatch):
+    bank = Outer.Bank()
+    monkeypatch.setitem(extensions_index, "Bank", bank)
+
+    assert resolve_handler(handler_id(Outer.Bank.withdraw)).__self__ is bank
+
+    local_handler = make_local_handler()
+    assert resolve_handler(handler_id(local_handler)) is local_handler
+
+    monkeypatch.delitem(extensions_index, "Bank")
+    assert resolve_handler(handler_id(Outer.Bank.withdraw)) is None
+
+def test_interaction_author_id():
+    assert interaction_author_id({"message": {"interaction_metadata": {"user": {"id": "1"}}}}) == "1"
+    assert interaction_author_id({"message": {"interaction": {"user": {"id": "2"}}}}) == "2"
+    assert interaction_author_id({"message": {}}) is None
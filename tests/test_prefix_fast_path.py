@@ -0,0 +1,19 @@
+import asyncio
+from types import SimpleNamespace
+
+from GoldyBot.goldy.commands.listener import CommandListener
+
+def test_non_command_messages_are_rejected_without_the_guild():
+    config_wrapper = SimpleNamespace(is_stale = False)
+    guild_manager = SimpleNamespace(prefix_table = {"863416692083916820": ("!", config_wrapper)}, get_guild = None)
+    listener = CommandListener(SimpleNamespace(guild_manager = guild_manager))
+
+    async def run():
+        await listener.on_prefix_cmd({"guild_id": "863416692083916820", "author": {"id": "1"}, "content": "hello there"})
+        await listener.on_prefix_cmd({"guild_id": "863416692083916820", "author": {"id": "1", "bot": True}, "content": "!ping"})
+        await listener.on_prefix_cmd({"guild_id": "1", "author": {"id": "1"}, "content": "!ping"})
+        await listener.on_prefix_cmd({"author": {"id": "1"}, "content": "!ping"})
+
+    asyncio.run(run())
+
+    assert listener.message_stats == {"rejected": 4, "unknown": 0, "dispatched": 0}
@@ -0,0 +1,75 @@
+import asyncio
+from types import SimpleNamespace
+
+from GoldyBot.goldy.commands.command import Command
+from GoldyBot.goldy.commands.prefix_command import PrefixCommand
+
+calls = []
+
+class Game():
+    async def game(self, platter):
+        calls.append(("game",))
+
+    async def start(self, platter):
+        calls.append(("start",))
+
+    async def now(self, platter, speed):
+        calls.append(("now", speed))
+
+    async def say(self, platter, text, user):
+        calls.append(("say", text, user))
+
+goldy = SimpleNamespace(guild_manager = SimpleNamespace(get_guild = lambda id: None))
+
+def command_tree():
+    game = PrefixCommand(goldy, Game.game, pre_register = False)
+    start = PrefixCommand(goldy, Game.start, pre_register = False)
+    now = PrefixCommand(goldy, Game.now, pre_register = False)
+
+    game.register_sub_command(start)
+    start.register_sub_command(now)
+
+    return game, start, now
+
+def platter(content: str, command: PrefixCommand):
+    return SimpleNamespace(data = {"content": content}, author = None, invokable = command)
+
+async def skip_checks(self, platter, lambda_func):
+    # The guild and permission checks have their own tests, these are only about routing.
+    return await lambda_func()
+
+
+def test_route_walks_nested_sub_commands():
+    game, start, now = command_tree()
+
+    assert game.route(["start", "now", "fast"]) == ([start, now], ["fast"])
+    assert game.route(["start"]) == ([start], [])
+    assert game.route([]) == ([], [])
+
+def test_route_falls_back_to_args_on_unknown_sub_commands():
+    game, start, now = command_tree()
+
+    assert game.route(["stop", "now"]) == ([], ["stop", "now"])
+    assert game.route(["start", "later", "now"]) == ([start], ["later", "now"])
+
+    # Sub commands only match from their own parent.
+    assert game.route(["now"]) == ([], ["now"])
+
+def test_invoke_routes_the_message_content(monkeypatch):
+    monkeypatch.setattr(Command, "invoke", skip_checks)
+    game, start, now = command_tree()
+    calls.clear()
+
+    asyncio.run(game.invoke(platter('!game start now "very fast"', game)))
+
+    assert calls == [("game",), ("start",), ("now", "very fast")]
+
+def test_invoke_with_args_and_no_sub_commands(monkeypatch):
+    monkeypatch.setattr(Command, "invoke", skip_checks)
+    say = PrefixCommand(goldy, Game.say, pre_register = False)
+    calls.clear()
+
+    # The content isn't tokenized again when the listener already parsed the args.
+    asyncio.run(say.invoke(platter("!say this is ignored", say), args = ["hello world", "<@332592361307897856>"]))
+
+    assert calls == [("say", "hello world", "332592361307897856")]
@@ -0,0 +1,9 @@
+from GoldyBot.goldy.commands.prefix_command import tokenize
+
+def test_tokenize_splits_on_whitespace():
+    assert tokenize("!game  start\tnow ") == ["!game", "start", "now"]
+
+def test_tokenize_quoted_arguments():
+    assert tokenize('!say "hello world" \'it works\' don\'t') == ["!say", "hello world", "it works", "don't"]
+    assert tokenize('!say “smart quotes” ""') == ["!say", "smart quotes", ""]
+    assert tokenize('!say "never closed') == ["!say", "never closed"]
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+from types import SimpleNamespace
+
+from pymongo.errors import AutoReconnect
+
+from GoldyBot.goldy.database import DatabaseEnums
+from GoldyBot.goldy.database.write_buffer import WriteBehindBuffer
+
+class FakeGoldyDB():
+    def __init__(self) -> None:
+        self.batches = []
+
+    async def bulk_write(self, collection, operations, ordered = True):
+        self.batches.append([(operation._filter, operation._doc) for operation in operations])
+
+def fake_database():
+    goldy_db = FakeGoldyDB()
+
+    return SimpleNamespace(get_goldy_database = lambda _: goldy_db, logger = logging.getLogger("test")), goldy_db
+
+
+def test_write_buffer_coalesces_updates():
+    database, collection = fake_database()
+    buffer = WriteBehindBuffer(database, max_pending = 100, flush_interval = 60)
+
+    async def run():
+        for _ in range(50):
+            buffer.inc(DatabaseEnums.GOLDY_MEMBER_DATA, "members", {"member_id": "1", "scope": "global"}, {"xp": 5})
+
+        buffer.set(DatabaseEnums.GOLDY_MEMBER_DATA, "members", {"member_id": "1", "scope": "global"}, {"level": 2})
+        buffer.inc(DatabaseEnums.GOLDY_MEMBER_DATA, "members", {"member_id": "2", "scope": "global"}, {"xp": 1})
+
+        await buffer.close()
+
+    asyncio.run(run())
+
+    assert collection.batches == [[
+        ({"member_id": "1", "scope": "global"}, {"$set": {"level": 2}, "$inc": {"xp": 250}}),
+        ({"member_id": "2", "scope": "global"}, {"$inc": {"xp": 1}})
+    ]]
+    assert buffer.metrics["coalesced_writes"] == 50
+    assert buffer.metrics["last_batch_size"] == 2
+    assert len(buffer) == 0
+
+def test_write_buffer_keeps_conflicting_paths_apart():
+    database, collection = fake_database()
+    buffer = WriteBehindBuffer(database, flush_interval = 60)
+
+    async def run():
+        buffer.set(DatabaseEnums.GOLDY_MEMBER_DATA, "members", {"member_id": "1"}, {"stats": {}})
+        buffer.set(DatabaseEnums.GOLDY_MEMBER_DATA, "members", {"member_id": "1"}, {"stats.wins": 1})
+
+        await buffer.close()
+
+    asyncio.run(run())
+
+    assert collection.batches == [[
+        ({"member_id": "1"}, {"$set": {"stats": {}}}),
+        ({"member_id": "1"}, {"$set": {"stats.wins": 1}})
+    ]]
+
+def test_write_buffer_retries_failed_flushes():
+    database, collection = fake_database()
+    buffer = WriteBehindBuffer(database, flush_interval = 60, max_attempts = 2)
+    failures = [AutoReconnect("connection reset")]
+
+    async def flaky_bulk_write(collection_name, operations, ordered = True):
+        if len(failures) > 0:
+            raise failures.pop()
+
+        collection.batches.append([(operation._filter, operation._doc) for operation in operations])
+
+    collection.bulk_write = flaky_bulk_write
+
+    async def run():
+        buffer.inc(DatabaseEnums.GOLDY_MEMBER_DATA, "members", {"member_id": "1", "scope": "global"}, {"xp": 5})
+        assert await buffer.flush() == 0
+        assert len(buffer) == 1
+
+        buffer.inc(DatabaseEnums.GOLDY_MEMBER_DATA, "members", {"member_id": "1", "scope": "global"}, {"xp": 1})
+        assert await buffer.flush() == 2
+
+        await buffer.close()
+
+    asyncio.run(run())
+
+    # The failed write goes first so the order the updates were made in is kept.
+    assert collection.batches == [[
+        ({"member_id": "1", "scope": "global"}, {"$inc": {"xp": 5}}),
+        ({"member_id": "1", "scope": "global"}, {"$inc": {"xp": 1}})
+    ]]
+    assert buffer.metrics["retried_documents"] == 1
+    assert buffer.metrics["failed_documents"] == 0
+
+def test_write_buffer_drops_writes_after_max_attempts():
+    database, collection = fake_database()
+    buffer = WriteBehindBuffer(database, flush_interval = 60, max_attempts = 2)
+
+    async def broken_bulk_write(collection_name, operations, ordered = True):
+        raise AutoReconnect("connection reset")
+
+    collection.bulk_write = broken_bulk_write
+
+    async def run():
+        buffer.inc(DatabaseEnums.GOLDY_MEMBER_DATA, "members", {"member_id": "1"}, {"xp": 5})
+
+        await buffer.flush()
+        await buffer.close()
+
+    asyncio.run(run())
+
+    assert len(buffer) == 0
+    assert buffer.metrics["failed_documents"] == 1
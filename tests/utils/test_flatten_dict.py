@@ -0,0 +1,20 @@
+import pytest
+
+from .. import flatten_dict
+
+
+def test_flatten_dict_nested():
+    assert flatten_dict({"prefix": "?", "extensions": {"allowed": ["owo"], "restrictions": {"admin": ["1"]}}}) == {
+        "prefix": "?",
+        "extensions.allowed": ["owo"],
+        "extensions.restrictions.admin": ["1"]
+    }
+
+def test_flatten_dict_keeps_empty_dicts():
+    assert flatten_dict({"roles": {}}) == {"roles": {}}
+    assert flatten_dict({}) == {}
+
+def test_flatten_dict_rejects_paths_and_operators():
+    for bad_dict in ({"roles.admin": "1"}, {"$set": {"prefix": "?"}}, {"roles": {"$gt": 5}}):
+        with pytest.raises(ValueError):
+            flatten_dict(bad_dict)
@@ -0,0 +1,58 @@
+from .. import LRUCache
+
+class FakeClock():
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_cache_get_and_set():
+    cache = LRUCache(max_size = 2)
+    cache.set("owo", 1)
+
+    assert cache.get("owo") == 1
+    assert cache.get("uwu") is None
+    assert cache.get("uwu", "BRUH") == "BRUH"
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size = 2)
+    cache.set("owo", 1)
+    cache.set("uwu", 2)
+
+    cache.get("owo") # owo is now the most recently used.
+    cache.set("jeff", 3)
+
+    assert "uwu" not in cache
+    assert cache.get("owo") == 1
+    assert cache.get("jeff") == 3
+    assert len(cache) == 2
+
+def test_lru_cache_ttl():
+    clock = FakeClock()
+    cache = LRUCache(max_size = 10, ttl = 30, clock = clock)
+    cache.set("owo", 1)
+
+    clock.now = 29
+    assert cache.get("owo") == 1
+
+    clock.now = 30
+    assert cache.get("owo") is None
+    assert len(cache) == 0
+
+def test_lru_cache_max_age():
+    clock = FakeClock()
+    cache = LRUCache(max_size = 10, ttl = 300, clock = clock)
+    cache.set("owo", 1)
+
+    clock.now = 10
+    assert cache.get("owo", max_age = 10) is None
+    assert cache.get("owo") == 1
+
+def test_lru_cache_pop():
+    cache = LRUCache()
+    cache.set("owo", 1)
+
+    assert cache.pop("owo") == 1
+    assert cache.pop("owo") is None